@@ -10,6 +10,97 @@ import matplotlib.pyplot as plt
 import os
 from pathlib import Path
 
+from utils._njit import FLOAT_ARRAY, njit
+
+# Ausstiegsgründe, wie sie der Backtest-Kernel zurückgibt
+EXIT_SIGNAL = 0
+EXIT_STOP_LOSS = 1
+EXIT_TAKE_PROFIT = 2
+
+@njit(f"({FLOAT_ARRAY}, {FLOAT_ARRAY}, {FLOAT_ARRAY}, {FLOAT_ARRAY}, float64, float64)", cache=True)
+def _backtest_loop(close, signal, stop_loss, take_profit, capital, commission):
+    """
+    Durchläuft die Preisdaten Bar für Bar und simuliert Long-Trades
+    
+    Args:
+        close (np.ndarray): Schlusskurse (float64)
+        signal (np.ndarray): Handelssignale (1 Kauf, -1 Verkauf, 0 Halten)
+        stop_loss (np.ndarray): Stop-Loss je Einstiegsbar (NaN = kein Stop-Loss)
+        take_profit (np.ndarray): Take-Profit je Einstiegsbar (NaN = kein Take-Profit)
+        capital (float): Anfangskapital
+        commission (float): Provisionsrate pro Trade
+        
+    Returns:
+        tuple: Equity, Positionen, Trade-Arrays (Einstiegs-/Ausstiegsindex, Anteile,
+            Ausstiegspreis, Gewinn, Ausstiegsgrund), Endkapital, Endposition und
+            Index eines offenen Trades (-1, wenn keiner offen ist)
+    """
+    n = close.shape[0]
+    equity = np.zeros(n)
+    positions = np.zeros(n)
+    equity[0] = capital
+    
+    # Jeder Trade braucht mindestens zwei Bars, daher reicht n // 2 + 1
+    max_trades = n // 2 + 1
+    entry_idx = np.empty(max_trades, dtype=np.int64)
+    exit_idx = np.empty(max_trades, dtype=np.int64)
+    trade_shares = np.empty(max_trades)
+    exit_price = np.empty(max_trades)
+    profit = np.empty(max_trades)
+    exit_reason = np.empty(max_trades, dtype=np.int64)
+    n_trades = 0
+    
+    position = 0.0
+    open_idx = -1
+    
+    for i in range(1, n):
+        price = close[i]
+        sig = signal[i]
+        exit_at = np.nan
+        reason = EXIT_SIGNAL
+        
+        if sig == 1 and position == 0:  # Kaufsignal
+            # Verwende 95% des verfügbaren Kapitals für den Trade
+            shares = capital * 0.95 / (price * (1 + commission))
+            capital -= shares * price * (1 + commission)
+            position = shares
+            open_idx = i
+        elif sig == -1 and position > 0:  # Verkaufssignal
+            exit_at = price
+        elif position > 0 and open_idx >= 0:
+            # Überprüfe Stop-Loss und Take-Profit
+            if not np.isnan(stop_loss[open_idx]) and price <= stop_loss[open_idx]:
+                exit_at = stop_loss[open_idx]
+                reason = EXIT_STOP_LOSS
+            elif not np.isnan(take_profit[open_idx]) and price >= take_profit[open_idx]:
+                exit_at = take_profit[open_idx]
+                reason = EXIT_TAKE_PROFIT
+        
+        if not np.isnan(exit_at):
+            proceeds = position * exit_at * (1 - commission)
+            capital += proceeds
+            
+            if open_idx >= 0:
+                entry_idx[n_trades] = open_idx
+                exit_idx[n_trades] = i
+                trade_shares[n_trades] = position
+                exit_price[n_trades] = exit_at
+                profit[n_trades] = proceeds - (position * close[open_idx] * (1 + commission))
+                exit_reason[n_trades] = reason
+                n_trades += 1
+                open_idx = -1
+            
+            position = 0.0
+        
+        # Aktualisiere Equity und Positionen
+        equity[i] = capital + position * price
+        positions[i] = position
+    
+    return (equity, positions,
+            entry_idx[:n_trades], exit_idx[:n_trades], trade_shares[:n_trades],
+            exit_price[:n_trades], profit[:n_trades], exit_reason[:n_trades],
+            capital, position, open_idx)
+
 class BacktestEngine:
     """
     Engine zum Backtesten von Handelsstrategien mit historischen Daten
@@ -62,107 +153,64 @@ class BacktestEngine:
         else:
             data = signals
             
-        # Initialisiere Ergebnisarrays
-        equity = np.zeros(len(data))
-        positions = np.zeros(len(data))
-        equity[0] = self.capital
+        # Extrahiere die Spalten einmalig als NumPy-Arrays für den Kernel
+        close = data['Close'].to_numpy(dtype=np.float64)
+        signal = data['Signal'].to_numpy(dtype=np.float64)
+        
+        # Stop-Loss und Take-Profit werden nur für mögliche Einstiegsbars berechnet
+        has_stop_loss = hasattr(strategy, 'calculate_stop_loss')
+        has_take_profit = hasattr(strategy, 'calculate_take_profit')
+        stop_loss = np.full(len(data), np.nan)
+        take_profit = np.full(len(data), np.nan)
+        for i in np.flatnonzero(signal == 1):
+            if i == 0:
+                continue
+            if has_stop_loss:
+                stop_loss[i] = strategy.calculate_stop_loss(data, i)
+            if has_take_profit:
+                take_profit[i] = strategy.calculate_take_profit(data, i)
         
         # Durchlaufe jeden Zeitpunkt
-        for i in range(1, len(data)):
-            # Aktueller Preis
-            current_price = data['Close'].iloc[i]
-            prev_price = data['Close'].iloc[i-1]
-            
-            # Aktuelles Signal
-            signal = data['Signal'].iloc[i]
-            
-            # Aktualisiere Position basierend auf Signal
-            if signal == 1 and self.position == 0:  # Kaufsignal
-                # Berechne Anzahl der Aktien, die gekauft werden können
-                shares = self._calculate_position_size(current_price)
-                
-                # Kaufe Aktien
-                cost = shares * current_price * (1 + self.commission)
-                self.capital -= cost
-                self.position = shares
-                
-                # Zeichne Trade auf
-                self.current_trade = {
-                    'entry_date': data.index[i],
-                    'entry_price': current_price,
-                    'shares': shares,
-                    'type': 'long',
-                    'stop_loss': strategy.calculate_stop_loss(data, i) if hasattr(strategy, 'calculate_stop_loss') else None,
-                    'take_profit': strategy.calculate_take_profit(data, i) if hasattr(strategy, 'calculate_take_profit') else None
-                }
-                
-                if verbose:
-                    print(f"KAUF: {data.index[i]}, Preis: {current_price:.2f}, Anteile: {shares:.2f}, Kapital: {self.capital:.2f}")
-                    
-            elif signal == -1 and self.position > 0:  # Verkaufssignal
-                # Verkaufe Aktien
-                proceeds = self.position * current_price * (1 - self.commission)
-                self.capital += proceeds
-                
-                # Berechne Gewinn/Verlust
-                if self.current_trade:
-                    self.current_trade['exit_date'] = data.index[i]
-                    self.current_trade['exit_price'] = current_price
-                    self.current_trade['profit'] = proceeds - (self.current_trade['shares'] * self.current_trade['entry_price'] * (1 + self.commission))
-                    self.current_trade['profit_pct'] = (current_price / self.current_trade['entry_price']) - 1
-                    self.trades.append(self.current_trade)
-                    self.current_trade = None
-                
-                self.position = 0
-                
-                if verbose:
-                    print(f"VERKAUF: {data.index[i]}, Preis: {current_price:.2f}, Kapital: {self.capital:.2f}")
-                    
-            # Überprüfe Stop-Loss und Take-Profit, wenn eine Position besteht
-            elif self.position > 0 and self.current_trade:
-                # Überprüfe Stop-Loss
-                if self.current_trade['stop_loss'] is not None and current_price <= self.current_trade['stop_loss']:
-                    # Verkaufe Aktien zum Stop-Loss-Preis
-                    proceeds = self.position * self.current_trade['stop_loss'] * (1 - self.commission)
-                    self.capital += proceeds
-                    
-                    # Berechne Gewinn/Verlust
-                    self.current_trade['exit_date'] = data.index[i]
-                    self.current_trade['exit_price'] = self.current_trade['stop_loss']
-                    self.current_trade['profit'] = proceeds - (self.current_trade['shares'] * self.current_trade['entry_price'] * (1 + self.commission))
-                    self.current_trade['profit_pct'] = (self.current_trade['stop_loss'] / self.current_trade['entry_price']) - 1
-                    self.current_trade['exit_reason'] = 'stop_loss'
-                    self.trades.append(self.current_trade)
-                    self.current_trade = None
-                    
-                    self.position = 0
-                    
-                    if verbose:
-                        print(f"STOP-LOSS: {data.index[i]}, Preis: {self.current_trade['stop_loss']:.2f}, Kapital: {self.capital:.2f}")
-                
-                # Überprüfe Take-Profit
-                elif self.current_trade['take_profit'] is not None and current_price >= self.current_trade['take_profit']:
-                    # Verkaufe Aktien zum Take-Profit-Preis
-                    proceeds = self.position * self.current_trade['take_profit'] * (1 - self.commission)
-                    self.capital += proceeds
-                    
-                    # Berechne Gewinn/Verlust
-                    self.current_trade['exit_date'] = data.index[i]
-                    self.current_trade['exit_price'] = self.current_trade['take_profit']
-                    self.current_trade['profit'] = proceeds - (self.current_trade['shares'] * self.current_trade['entry_price'] * (1 + self.commission))
-                    self.current_trade['profit_pct'] = (self.current_trade['take_profit'] / self.current_trade['entry_price']) - 1
-                    self.current_trade['exit_reason'] = 'take_profit'
-                    self.trades.append(self.current_trade)
-                    self.current_trade = None
-                    
-                    self.position = 0
-                    
-                    if verbose:
-                        print(f"TAKE-PROFIT: {data.index[i]}, Preis: {self.current_trade['take_profit']:.2f}, Kapital: {self.capital:.2f}")
+        (equity, positions, entry_idx, exit_idx, trade_shares, exit_price,
+         profit, exit_reason, self.capital, self.position, open_idx) = _backtest_loop(
+            close, signal, stop_loss, take_profit, float(self.capital), float(self.commission)
+        )
+        
+        # Trades spaltenweise (Structure of Arrays) für die vektorisierte Weiterverarbeitung
+        entry_price = close[entry_idx]
+        trade_arrays = {
+            'entry_date': data.index[entry_idx],
+            'entry_price': entry_price,
+            'exit_date': data.index[exit_idx],
+            'exit_price': exit_price,
+            'shares': trade_shares,
+            'profit': profit,
+            'return': exit_price / entry_price - 1,
+        }
+        
+        # Wandle die Trade-Arrays in Trade-Dictionaries um
+        exit_reasons = {EXIT_STOP_LOSS: 'stop_loss', EXIT_TAKE_PROFIT: 'take_profit'}
+        for k in range(len(entry_idx)):
+            entry, exit_ = entry_idx[k], exit_idx[k]
+            trade = self._open_trade(data, entry, trade_shares[k], stop_loss, take_profit,
+                                     has_stop_loss, has_take_profit)
+            trade['exit_date'] = data.index[exit_]
+            trade['exit_price'] = exit_price[k]
+            trade['profit'] = profit[k]
+            trade['profit_pct'] = trade_arrays['return'][k]
+            if exit_reason[k] in exit_reasons:
+                trade['exit_reason'] = exit_reasons[exit_reason[k]]
+            self.trades.append(trade)
             
-            # Aktualisiere Equity und Positionen
-            equity[i] = self.capital + (self.position * current_price)
-            positions[i] = self.position
+            if verbose:
+                print(f"KAUF: {data.index[entry]}, Preis: {close[entry]:.2f}, Anteile: {trade_shares[k]:.2f}, Kapital: {equity[entry] - trade_shares[k] * close[entry]:.2f}")
+                label = exit_reasons.get(exit_reason[k], 'verkauf').replace('_', '-').upper()
+                print(f"{label}: {data.index[exit_]}, Preis: {exit_price[k]:.2f}, Kapital: {equity[exit_]:.2f}")
+        
+        # Offener Trade am Ende des Backtests
+        if open_idx >= 0:
+            self.current_trade = self._open_trade(data, open_idx, self.position, stop_loss, take_profit,
+                                                  has_stop_loss, has_take_profit)
             
         # Erstelle Equity-Kurve
         equity_curve = pd.Series(equity, index=data.index)
@@ -176,29 +224,37 @@ class BacktestEngine:
             'equity_curve': equity_curve,
             'positions': positions_series,
             'trades': self.trades,
+            'trade_arrays': trade_arrays,
             'metrics': metrics,
             'data': data
         }
         
         return results
     
-    def _calculate_position_size(self, price):
+    def _open_trade(self, data, index, shares, stop_loss, take_profit, has_stop_loss, has_take_profit):
         """
-        Berechnet die Positionsgröße basierend auf verfügbarem Kapital
+        Erstellt das Trade-Dictionary für einen Einstieg
         
         Args:
-            price (float): Aktueller Preis
+            data (pandas.DataFrame): DataFrame mit Preisdaten
+            index (int): Index der Einstiegsbar
+            shares (float): Anzahl der gekauften Aktien
+            stop_loss (np.ndarray): Stop-Loss je Einstiegsbar
+            take_profit (np.ndarray): Take-Profit je Einstiegsbar
+            has_stop_loss (bool): Ob die Strategie einen Stop-Loss berechnet
+            has_take_profit (bool): Ob die Strategie einen Take-Profit berechnet
             
         Returns:
-            float: Anzahl der Aktien, die gekauft werden können
+            dict: Trade-Informationen
         """
-        # Verwende 95% des verfügbaren Kapitals für den Trade
-        available_capital = self.capital * 0.95
-        
-        # Berechne Anzahl der Aktien
-        shares = available_capital / (price * (1 + self.commission))
-        
-        return shares
+        return {
+            'entry_date': data.index[index],
+            'entry_price': data['Close'].iloc[index],
+            'shares': shares,
+            'type': 'long',
+            'stop_loss': stop_loss[index] if has_stop_loss else None,
+            'take_profit': take_profit[index] if has_take_profit else None
+        }
     
     def _calculate_performance_metrics(self, equity_curve, data):
         """
@@ -243,6 +299,8 @@ class BacktestEngine:
             hold_times = [(t['exit_date'] - t['entry_date']).days for t in self.trades]
             avg_hold_time = np.mean(hold_times) if hold_times else 0
         else:
+            winning_trades = []
+            losing_trades = []
             win_rate = 0
             avg_profit = 0
             avg_loss = 0
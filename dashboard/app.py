@@ -1,17 +1,15 @@
 import os
 import sys
-import json
 import pandas as pd
 import numpy as np
 import logging
 from datetime import datetime, timedelta
-from io import StringIO
+from functools import lru_cache
 
 import dash
 from dash import dcc, html, Input, Output, State, callback, dash_table, ALL, MATCH
 import dash_bootstrap_components as dbc
 from dash_bootstrap_templates import load_figure_template, ThemeChangerAIO
-from dash_iconify import DashIconify
 import dash_mantine_components as dmc
 
 import plotly.graph_objects as go
@@ -27,17 +25,27 @@ parent_dir = os.path.dirname(current_dir)
 sys.path.append(parent_dir)
 
 # Importiere die benutzerdefinierten Komponenten
-from dashboard.components_module import load_nasdaq_symbols, create_asset_buttons, create_timeframe_buttons
+from dashboard.icons import icon
+from dashboard.components_module import load_nasdaq_symbols, create_asset_buttons, create_symbol_options, create_symbol_search, create_timeframe_buttons
 
 # Importiere die Datenverarbeitungsfunktionen
 from data.data_loader_enhanced import load_stock_data, validate_symbol, get_alternative_symbols
-from dashboard.chart_utils import create_price_chart, create_volume_chart, create_indicator_chart
+from dashboard.chart_utils import create_price_chart, create_volume_chart, create_indicator_chart, m4_aggregate, fill_missing, xaxis_window, slice_window
+from dashboard.store_utils import create_cache, memoize, quantize_dataframe
 from dashboard.chart_callbacks import register_chart_callbacks
 from dashboard.error_handler import handle_error
 
+# Hintergrund-Callbacks benötigen diskcache; ohne das Paket läuft der Download im Request
+try:
+    import diskcache
+    background_callback_manager = dash.DiskcacheManager(diskcache.Cache(os.path.join(current_dir, ".cache", "background")))
+except ImportError:
+    background_callback_manager = None
+
 # Initialisiere die Dash-App
 app = dash.Dash(
     __name__,
+    background_callback_manager=background_callback_manager,
     external_stylesheets=[dbc.themes.BOOTSTRAP],
     meta_tags=[
         {"name": "viewport", "content": "width=device-width, initial-scale=1"},
@@ -45,6 +53,9 @@ app = dash.Dash(
     suppress_callback_exceptions=True
 )
 
+# Serverseitiger Cache für geladene Kursdaten (Redis, wenn konfiguriert, sonst Dateisystem)
+cache = create_cache(app.server, os.path.join(current_dir, ".cache", "data"))
+
 # Setze den Titel der App
 app.title = "Trading Dashboard"
 
@@ -64,8 +75,96 @@ colors = {
     'info': '#0dcaf0',
 }
 
-# Lade die Nasdaq-Symbole
+# Häufig genutzte Farben und Styles als Konstanten; Layout und Charts teilen sich dieselben Objekte
+CARD_BG = colors['card_background']
+CARD_STYLE = {"backgroundColor": CARD_BG}
+DARK_LAYOUT = dict(template="plotly_dark", paper_bgcolor=CARD_BG, plot_bgcolor=CARD_BG)
+
+# Kanonische OHLCV-Spalten, wie sie chart_utils erwartet
+OHLCV_COLUMNS = ('Open', 'High', 'Low', 'Close', 'Volume')
+_OHLCV_BY_LOWER = {col.lower(): col for col in OHLCV_COLUMNS}
+
+# Höchstzahl der Zeitpunkte, die pro Trace an den Browser gesendet werden
+CHART_POINTS = 2000
+
+def fetch_ohlc(symbol, timeframe, date_range):
+    """
+    Lädt die Kursdaten für ein Symbol mit kanonischen Spaltennamen
+    
+    Args:
+        symbol (str): Das Aktiensymbol
+        timeframe (str): Zeitrahmen der Kerzen
+        date_range (str): Zeitraum
+    
+    Returns:
+        tuple | None: (DataFrame mit OHLCV-Daten, Statusmeldung) oder None, wenn keine Daten vorliegen
+    """
+    df, status_message = load_stock_data(symbol, timeframe, date_range)
+    if df.empty:
+        return None
+    
+    # Normalisiere die Spaltennamen einmalig beim Laden, damit die Chart-Callbacks
+    # bei jeder Interaktion von einem festen Schema ausgehen können
+    df.columns = [_OHLCV_BY_LOWER.get(str(col).lower(), col) for col in df.columns]
+    
+    # Kurse und Indikatoren als float32, Volumen als uint32: halbiert, was der Cache
+    # speichert und bei jedem Chart-Aufruf wieder einlesen muss
+    return quantize_dataframe(df), status_message
+
+fetch_ohlc = memoize(cache, timeout=300, maxsize=8)(fetch_ohlc)
+
+# Hilfsfunktionen für leere Charts
+def _empty_fig():
+    """
+    Erstellt ein leeres Chart im Dashboard-Stil
+    
+    Returns:
+        go.Figure: Leeres Chart
+    """
+    return go.Figure(layout=dict(
+        DARK_LAYOUT,
+        margin=dict(l=0, r=0, t=0, b=0),
+        xaxis=dict(showgrid=False, zeroline=False),
+        yaxis=dict(showgrid=False, zeroline=False),
+    ))
+
+# Leeres Chart einmalig als JSON; dient als Startwert der Graphen und als Antwort ohne Daten
+EMPTY_FIG = _empty_fig().to_plotly_json()
+
+# Lade die Nasdaq-Symbole; Buttons und Suchoptionen werden einmalig beim Import erstellt
 nasdaq_symbols = load_nasdaq_symbols()
+asset_buttons = create_asset_buttons(nasdaq_symbols)
+symbol_options = create_symbol_options(nasdaq_symbols)
+
+# Symbole aus der Liste gelten ohne Netzwerkabfrage als gültig; einmal erfolgreich
+# geprüfte Symbole werden ergänzt
+_valid_symbols = {
+    entry["symbol"].upper()
+    for entry in nasdaq_symbols.get("popular_symbols", []) + nasdaq_symbols.get("indices", [])
+}
+
+# Kürzel, für die bei ungültiger Eingabe Alternativen vorgeschlagen werden
+ALTERNATIVE_GROUPS = {"nq": "nasdaq", "sp": "sp500", "spx": "sp500"}
+
+def is_valid_symbol(symbol):
+    """
+    Prüft ein Symbol und fragt die Datenquelle nur für unbekannte Symbole ab
+    
+    Args:
+        symbol (str): Das Aktiensymbol
+    
+    Returns:
+        bool: True, wenn das Symbol gültig ist
+    """
+    key = symbol.upper()
+    if key in _valid_symbols:
+        return True
+    
+    # Nur positive Ergebnisse merken, damit ein Netzwerkfehler kein Symbol dauerhaft sperrt
+    if validate_symbol(symbol):
+        _valid_symbols.add(key)
+        return True
+    return False
 
 # Definiere Header
 header = dbc.Navbar(
@@ -74,7 +173,7 @@ header = dbc.Navbar(
             html.A(
                 dbc.Row(
                     [
-                        dbc.Col(DashIconify(icon="mdi:chart-line", width=30, color=colors['primary'])),
+                        dbc.Col(icon("mdi:chart-line", width=30, color=colors['primary'])),
                         dbc.Col(dbc.NavbarBrand("Trading Dashboard Pro", className="ms-2")),
                     ],
                     align="center",
@@ -87,10 +186,10 @@ header = dbc.Navbar(
             dbc.Collapse(
                 dbc.Nav(
                     [
-                        dbc.NavItem(dbc.NavLink([DashIconify(icon="mdi:view-dashboard", width=18, className="me-2"), "Dashboard"], href="#")),
-                        dbc.NavItem(dbc.NavLink([DashIconify(icon="mdi:strategy", width=18, className="me-2"), "Strategien"], href="#")),
-                        dbc.NavItem(dbc.NavLink([DashIconify(icon="mdi:test-tube", width=18, className="me-2"), "Backtesting"], href="#")),
-                        dbc.NavItem(dbc.NavLink([DashIconify(icon="mdi:cog", width=18, className="me-2"), "Einstellungen"], href="#")),
+                        dbc.NavItem(dbc.NavLink([icon("mdi:view-dashboard", width=18, className="me-2"), "Dashboard"], href="#")),
+                        dbc.NavItem(dbc.NavLink([icon("mdi:strategy", width=18, className="me-2"), "Strategien"], href="#")),
+                        dbc.NavItem(dbc.NavLink([icon("mdi:test-tube", width=18, className="me-2"), "Backtesting"], href="#")),
+                        dbc.NavItem(dbc.NavLink([icon("mdi:cog", width=18, className="me-2"), "Einstellungen"], href="#")),
                     ],
                     className="ms-auto",
                     navbar=True,
@@ -109,14 +208,25 @@ header = dbc.Navbar(
 # Erstelle die verbesserten Zeitrahmen-Buttons
 timeframe_buttons = create_timeframe_buttons()
 
+# Auswahl für den Zeitraum; konstant, daher nur einmal erstellt
+RANGE_OPTIONS = (
+    {"label": "1 Tag", "value": "1d"},
+    {"label": "5 Tage", "value": "5d"},
+    {"label": "1 Monat", "value": "1mo"},
+    {"label": "3 Monate", "value": "3mo"},
+    {"label": "6 Monate", "value": "6mo"},
+    {"label": "1 Jahr", "value": "1y"},
+    {"label": "2 Jahre", "value": "2y"},
+    {"label": "5 Jahre", "value": "5y"},
+    {"label": "Max", "value": "max"},
+)
+
 # Definiere Sidebar für Dateneinstellungen
 sidebar = dbc.Card(
     [
         dbc.CardHeader([
             html.H4("Dateneinstellungen", className="card-title mb-0"),
-            html.Div([
-                DashIconify(icon="mdi:database-cog", width=24, color=colors['primary']),
-            ], className="float-end")
+            icon("mdi:database-cog", width=24, color=colors['primary'], className="float-end")
         ]),
         dbc.CardBody([
             dbc.Form([
@@ -124,7 +234,7 @@ sidebar = dbc.Card(
                     dbc.Col([
                         dbc.Label("Symbol", html_for="symbol-input", className="mb-1"),
                         dbc.InputGroup([
-                            dbc.InputGroupText(DashIconify(icon="mdi:finance", width=18)),
+                            dbc.InputGroupText(icon("mdi:finance", width=18)),
                             dbc.Input(
                                 id="symbol-input",
                                 type="text",
@@ -136,8 +246,11 @@ sidebar = dbc.Card(
                     ]),
                 ]),
                 
-                # Füge die klickbaren Assets hinzu
-                create_asset_buttons(nasdaq_symbols),
+                # Symbolsuche; die Liste wird clientseitig aus dem symbols-store gefiltert
+                create_symbol_search(),
+                
+                # Füge die klickbaren Assets als feste Favoriten hinzu
+                asset_buttons,
                 
                 dbc.Label("Zeitrahmen", className="mb-1"),
                 timeframe_buttons,
@@ -146,20 +259,10 @@ sidebar = dbc.Card(
                     dbc.Col([
                         dbc.Label("Zeitraum", html_for="range-dropdown", className="mb-1"),
                         dbc.InputGroup([
-                            dbc.InputGroupText(DashIconify(icon="mdi:calendar-range", width=18)),
+                            dbc.InputGroupText(icon("mdi:calendar-range", width=18)),
                             dbc.Select(
                                 id="range-dropdown",
-                                options=[
-                                    {"label": "1 Tag", "value": "1d"},
-                                    {"label": "5 Tage", "value": "5d"},
-                                    {"label": "1 Monat", "value": "1mo"},
-                                    {"label": "3 Monate", "value": "3mo"},
-                                    {"label": "6 Monate", "value": "6mo"},
-                                    {"label": "1 Jahr", "value": "1y"},
-                                    {"label": "2 Jahre", "value": "2y"},
-                                    {"label": "5 Jahre", "value": "5y"},
-                                    {"label": "Max", "value": "max"},
-                                ],
+                                options=RANGE_OPTIONS,
                                 value="1y",
                                 className="border-start-0",
                             ),
@@ -170,7 +273,7 @@ sidebar = dbc.Card(
                 dbc.Row([
                     dbc.Col([
                         dbc.Button(
-                            [DashIconify(icon="mdi:refresh", width=18, className="me-2"), "Daten abrufen"],
+                            [icon("mdi:refresh", width=18, className="me-2"), "Daten abrufen"],
                             id="fetch-data-button",
                             color="primary",
                             className="w-100 mb-3",
@@ -199,7 +302,7 @@ sidebar = dbc.Card(
         ]),
     ],
     className="mb-4 shadow sidebar",
-    style={"backgroundColor": colors['card_background']},
+    style=CARD_STYLE,
 )
 
 # Definiere Hauptbereich für Charts
@@ -207,20 +310,19 @@ chart_card = dbc.Card(
     [
         dbc.CardHeader([
             html.H4(["Preischart ", html.Span(id="chart-symbol", className="text-primary")], className="card-title mb-0 d-inline"),
-            html.Div([
-                dbc.ButtonGroup([
-                    dbc.Button(id="toggle-sma", className="btn-sm", n_clicks=0),
-                    dbc.Button(id="toggle-bb", className="btn-sm", n_clicks=0),
-                    dbc.Button(id="toggle-rsi", className="btn-sm", n_clicks=0),
-                    dbc.Button(id="toggle-macd", className="btn-sm", n_clicks=0),
-                    dbc.Button(id="toggle-volume", className="btn-sm", n_clicks=0),
-                ], className="float-end"),
+            dbc.ButtonGroup([
+                dbc.Button([icon("mdi:chart-line", width=16), " SMA"], id="toggle-sma", className="btn-sm", n_clicks=0),
+                dbc.Button([icon("mdi:chart-bell-curve-cumulative", width=16), " BB"], id="toggle-bb", className="btn-sm", n_clicks=0),
+                dbc.Button([icon("mdi:chart-line-variant", width=16), " RSI"], id="toggle-rsi", className="btn-sm", n_clicks=0),
+                dbc.Button([icon("mdi:chart-timeline-variant", width=16), " MACD"], id="toggle-macd", className="btn-sm", n_clicks=0),
+                dbc.Button([icon("mdi:chart-histogram", width=16), " VOL"], id="toggle-volume", className="btn-sm", n_clicks=0),
             ], className="float-end"),
         ]),
         dbc.CardBody([
             dcc.Loading(
                 dcc.Graph(
                     id="price-chart",
+                    figure=EMPTY_FIG,
                     config={
                         "displayModeBar": True,
                         "scrollZoom": True,
@@ -238,7 +340,7 @@ chart_card = dbc.Card(
         ]),
     ],
     className="mb-4 shadow",
-    style={"backgroundColor": colors['card_background']},
+    style=CARD_STYLE,
 )
 
 # Definiere Bereich für Indikatoren
@@ -246,9 +348,7 @@ indicators_card = dbc.Card(
     [
         dbc.CardHeader([
             html.H4("Technische Indikatoren", className="card-title mb-0"),
-            html.Div([
-                DashIconify(icon="mdi:chart-bell-curve", width=24, color=colors['primary']),
-            ], className="float-end")
+            icon("mdi:chart-bell-curve", width=24, color=colors['primary'], className="float-end")
         ]),
         dbc.CardBody([
             dbc.Row([
@@ -256,6 +356,7 @@ indicators_card = dbc.Card(
                     dcc.Loading(
                         dcc.Graph(
                             id="rsi-chart",
+                            figure=EMPTY_FIG,
                             config={
                                 "displayModeBar": False,
                                 "scrollZoom": True,
@@ -270,6 +371,7 @@ indicators_card = dbc.Card(
                     dcc.Loading(
                         dcc.Graph(
                             id="macd-chart",
+                            figure=EMPTY_FIG,
                             config={
                                 "displayModeBar": False,
                                 "scrollZoom": True,
@@ -284,6 +386,7 @@ indicators_card = dbc.Card(
                     dcc.Loading(
                         dcc.Graph(
                             id="volume-chart",
+                            figure=EMPTY_FIG,
                             config={
                                 "displayModeBar": False,
                                 "scrollZoom": True,
@@ -298,7 +401,81 @@ indicators_card = dbc.Card(
         ]),
     ],
     className="mb-4 shadow",
-    style={"backgroundColor": colors['card_background']},
+    style=CARD_STYLE,
+)
+
+# Beispiel-Trades spaltenweise; Preis und Wert bleiben numerisch und werden im Browser formatiert
+SAMPLE_TRADES = {
+    "Datum": np.array(["2023-01-15", "2023-02-22", "2023-03-10", "2023-04-05"]),
+    "Typ": np.array(["Kauf", "Verkauf", "Kauf", "Verkauf"]),
+    "Preis": np.array([150.25, 165.75, 145.30, 170.20]),
+    "Menge": np.array([10, 5, 8, 13]),
+}
+
+TRADES_COLUMNS = [
+    {"name": "Datum", "id": "Datum"},
+    {"name": "Typ", "id": "Typ"},
+    {"name": "Preis", "id": "Preis", "type": "numeric", "format": dash_table.FormatTemplate.money(2)},
+    {"name": "Menge", "id": "Menge", "type": "numeric"},
+    {"name": "Wert", "id": "Wert", "type": "numeric", "format": dash_table.FormatTemplate.money(2)},
+]
+
+def _trade_records(trades):
+    """
+    Erzeugt die Tabellenzeilen aus spaltenweisen Trade-Daten
+    
+    Der Wert wird vektorisiert berechnet und die Zeilen werden nur einmal am Ende erzeugt.
+    
+    Args:
+        trades (dict): Spalten 'Datum', 'Typ', 'Preis' und 'Menge' als Arrays
+    
+    Returns:
+        list: Zeilen für DataTable.data
+    """
+    df = pd.DataFrame(trades)
+    df["Wert"] = (df["Preis"] * df["Menge"]).round(2)
+    return df.to_dict("records")
+
+# Die Beispiel-Zeilen hängen nicht von den Kursdaten ab und werden nur einmal erstellt
+SAMPLE_TRADE_RECORDS = _trade_records(SAMPLE_TRADES)
+
+# Die Tabelle samt Styles wird einmalig erstellt; Callbacks setzen nur noch 'data'.
+# Sie rendert nur die sichtbaren Zeilen.
+trades_table = dash_table.DataTable(
+    id="trades-table",
+    data=[],
+    columns=TRADES_COLUMNS,
+    style_header={
+        "backgroundColor": colors['background'],
+        "color": colors['text'],
+        "fontWeight": "bold",
+        "border": f"1px solid {colors['secondary']}",
+    },
+    # Feste Spaltenbreiten, damit Kopf und virtualisierte Zeilen ausgerichtet bleiben
+    style_cell={
+        "backgroundColor": CARD_BG,
+        "color": colors['text'],
+        "border": f"1px solid {colors['secondary']}",
+        "padding": "10px",
+        "textAlign": "left",
+        "minWidth": "100px",
+        "width": "100px",
+        "maxWidth": "100px",
+    },
+    style_data_conditional=[
+        {
+            "if": {"column_id": "Typ", "filter_query": "{Typ} eq 'Kauf'"},
+            "color": colors['success'],
+        },
+        {
+            "if": {"column_id": "Typ", "filter_query": "{Typ} eq 'Verkauf'"},
+            "color": colors['danger'],
+        },
+    ],
+    page_action="none",
+    virtualization=True,
+    fixed_rows={"headers": True},
+    style_table={"height": "400px", "overflowY": "auto"},
 )
 
 # Definiere Trades-Tabelle
@@ -306,16 +483,14 @@ trades_card = dbc.Card(
     [
         dbc.CardHeader([
             html.H4("Trades", className="card-title mb-0"),
-            html.Div([
-                DashIconify(icon="mdi:swap-horizontal", width=24, color=colors['primary']),
-            ], className="float-end")
+            icon("mdi:swap-horizontal", width=24, color=colors['primary'], className="float-end")
         ]),
         dbc.CardBody([
-            html.Div(id="trades-table-container"),
+            trades_table,
         ]),
     ],
     className="mb-4 shadow",
-    style={"backgroundColor": colors['card_background']},
+    style=CARD_STYLE,
 )
 
 # Definiere das Layout der App
@@ -327,6 +502,9 @@ app.layout = dbc.Container(
         # Füge einen Store für API-Status hinzu
         dcc.Store(id="api-error-store"),
         
+        # Alle Symbole einmalig als JSON für die clientseitige Suche
+        dcc.Store(id="symbols-store", data=symbol_options),
+        
         header,
         dbc.Row(
             [
@@ -388,27 +566,27 @@ app.layout = dbc.Container(
                                 html.Div(
                                     [
                                         html.A(
-                                            DashIconify(icon="mdi:github", width=18),
+                                            icon("mdi:github", width=18),
                                             href="#",
                                             className="text-muted me-3",
                                         ),
                                         html.A(
-                                            DashIconify(icon="mdi:twitter", width=18),
+                                            icon("mdi:twitter", width=18),
                                             href="#",
                                             className="text-muted me-3",
                                         ),
                                         html.A(
-                                            DashIconify(icon="mdi:linkedin", width=18),
+                                            icon("mdi:linkedin", width=18),
                                             href="#",
                                             className="text-muted me-3",
                                         ),
                                         html.A(
-                                            DashIconify(icon="mdi:email", width=18),
+                                            icon("mdi:email", width=18),
                                             href="#",
                                             className="text-muted me-3",
                                         ),
                                         html.A(
-                                            DashIconify(icon="mdi:web", width=18),
+                                            icon("mdi:web", width=18),
                                             href="#",
                                             className="text-muted",
                                         ),
@@ -430,51 +608,66 @@ app.layout = dbc.Container(
     className="bg-dark text-light",
 )
 
-# Callback für die Aktualisierung des aktiven Zeitrahmens
-@app.callback(
-    Output("active-timeframe-store", "data"),
-    [Input({"type": "timeframe-button", "index": ALL}, "n_clicks")],
-    [State({"type": "timeframe-button", "index": ALL}, "id"),
-     State("active-timeframe-store", "data")]
+# Clientseitige Callbacks für Zeitrahmen- und Asset-Buttons (ohne Server-Roundtrip)
+# Die ID des geklickten Buttons enthält den Wert direkt im Feld 'index'
+app.clientside_callback(
+    """
+    function(nClicks, ids) {
+        const id = window.dash_clientside.callback_context.triggered_id;
+        if (!id) {
+            return window.dash_clientside.no_update;
+        }
+        return [id.index, ids.map(i => (i.index === id.index ? 'timeframe-button active' : 'timeframe-button'))];
+    }
+    """,
+    [Output("active-timeframe-store", "data"),
+     Output({"type": "timeframe-button", "index": ALL}, "className")],
+    Input({"type": "timeframe-button", "index": ALL}, "n_clicks"),
+    State({"type": "timeframe-button", "index": ALL}, "id"),
+    prevent_initial_call=True
 )
-def update_active_timeframe(n_clicks, ids, current_timeframe):
-    ctx = dash.callback_context
-    if not ctx.triggered:
-        return current_timeframe
-    
-    button_id = ctx.triggered[0]["prop_id"].split(".")[0]
-    if not button_id:
-        return current_timeframe
-    
-    try:
-        button_id_dict = json.loads(button_id)
-        timeframe = button_id_dict["index"]
-        return timeframe
-    except:
-        return current_timeframe
 
-# Callback für die Aktualisierung des Symbols durch Klicken auf Asset-Buttons
-@app.callback(
+app.clientside_callback(
+    """
+    function(nClicks) {
+        const id = window.dash_clientside.callback_context.triggered_id;
+        return id ? id.index : window.dash_clientside.no_update;
+    }
+    """,
     Output("symbol-input", "value"),
-    [Input({"type": "asset-button", "index": ALL}, "n_clicks")],
-    [State({"type": "asset-button", "index": ALL}, "id"),
-     State("symbol-input", "value")]
+    Input({"type": "asset-button", "index": ALL}, "n_clicks"),
+    prevent_initial_call=True
+)
+
+# Clientseitige Filterung der Symbolsuche (ohne Server-Roundtrip)
+# Die aktuelle Auswahl bleibt in den Optionen, damit ihr Label sichtbar bleibt
+app.clientside_callback(
+    """
+    function(search, options, value) {
+        const query = (search || '').toUpperCase();
+        if (!query) {
+            return options.filter(o => o.value === value);
+        }
+        return options.filter(o => o.value === value || o.search.includes(query)).slice(0, 50);
+    }
+    """,
+    Output("symbol-search", "options"),
+    Input("symbol-search", "search_value"),
+    [State("symbols-store", "data"),
+     State("symbol-search", "value")]
+)
+
+# Übernimmt das gewählte Suchergebnis in das Symbolfeld
+app.clientside_callback(
+    """
+    function(value) {
+        return value || window.dash_clientside.no_update;
+    }
+    """,
+    Output("symbol-input", "value", allow_duplicate=True),
+    Input("symbol-search", "value"),
+    prevent_initial_call=True
 )
-def update_symbol_from_button(n_clicks, ids, current_symbol):
-    ctx = dash.callback_context
-    if not ctx.triggered:
-        return current_symbol
-    
-    button_id = ctx.triggered[0]["prop_id"].split(".")[0]
-    if not button_id:
-        return current_symbol
-    
-    try:
-        button_id_dict = json.loads(button_id)
-        symbol = button_id_dict["index"]
-        return symbol
-    except:
-        return current_symbol
 
 # Callback für das Abrufen der Daten
 @app.callback(
@@ -490,7 +683,12 @@ def update_symbol_from_button(n_clicks, ids, current_symbol):
     [Input("fetch-data-button", "n_clicks")],
     [State("symbol-input", "value"),
      State("active-timeframe-store", "data"),
-     State("range-dropdown", "value")]
+     State("range-dropdown", "value")],
+    # Der Download läuft im Hintergrund, damit der Worker frei bleibt; die Daten landen
+    # im gemeinsamen Kursdaten-Cache, aus dem die Chart-Callbacks lesen
+    background=background_callback_manager is not None,
+    running=[(Output("fetch-data-button", "disabled"), True, False)],
+    prevent_initial_call=True
 )
 def fetch_data(n_clicks, symbol, timeframe, date_range):
     if n_clicks is None:
@@ -500,15 +698,12 @@ def fetch_data(n_clicks, symbol, timeframe, date_range):
         return dash.no_update, "Bitte geben Sie ein Symbol ein", dash.no_update, "", "text-center small mt-2", True, "Bitte geben Sie ein Symbol ein", False, ""
     
     try:
-        logger.info(f"Daten werden abgerufen für Symbol: {symbol}, Zeitrahmen: {timeframe}, Zeitraum: {date_range}")
+        logger.info("Daten werden abgerufen für Symbol: %s, Zeitrahmen: %s, Zeitraum: %s", symbol, timeframe, date_range)
         
         # Validiere das Symbol
-        if not validate_symbol(symbol):
-            alternatives = []
-            if symbol.lower() == "nq":
-                alternatives = get_alternative_symbols("nasdaq")
-            elif symbol.lower() == "sp" or symbol.lower() == "spx":
-                alternatives = get_alternative_symbols("sp500")
+        if not is_valid_symbol(symbol):
+            group = ALTERNATIVE_GROUPS.get(symbol.lower())
+            alternatives = get_alternative_symbols(group) if group else []
             
             alternatives_text = ""
             if alternatives:
@@ -518,25 +713,25 @@ def fetch_data(n_clicks, symbol, timeframe, date_range):
             return dash.no_update, error_msg, dash.no_update, error_msg, "text-center small mt-2 text-danger", True, error_msg, False, ""
         
         # Lade die Daten mit verbesserter Fehlerbehandlung
-        df, status_message = load_stock_data(symbol, timeframe, date_range)
+        result = fetch_ohlc(symbol, timeframe, date_range)
         
         # Überprüfe, ob Daten zurückgegeben wurden
-        if df.empty:
+        if result is None:
             error_msg = f"Keine Daten für {symbol} gefunden. Bitte überprüfen Sie das Symbol oder versuchen Sie es später erneut."
             return dash.no_update, error_msg, dash.no_update, error_msg, "text-center small mt-2 text-danger", True, error_msg, False, ""
+        df, status_message = result
         
-        # Erstelle eine Info-Nachricht
-        start_date = df.index.min().strftime('%d.%m.%Y')
-        end_date = df.index.max().strftime('%d.%m.%Y')
-        days = (df.index.max() - df.index.min()).days
-        info = f"{days} Tage ({start_date} - {end_date})"
+        # Erstelle eine Info-Nachricht; Start und Ende werden nur einmal bestimmt
+        first, last = df.index.min(), df.index.max()
+        info = f"{(last - first).days} Tage ({first:%d.%m.%Y} - {last:%d.%m.%Y})"
         
-        # Bereite die Daten für das Speichern vor
+        # Im Store liegt nur der Schlüssel; die Chart-Callbacks holen die Daten aus dem Cache.
+        # 'end' unterscheidet neu geladene Daten für die gecachten Figuren.
         data = {
-            'df': df.to_json(date_format='iso', orient='split'),
             'symbol': symbol,
             'timeframe': timeframe,
-            'date_range': date_range
+            'date_range': date_range,
+            'end': last.isoformat(),
         }
         
         # Zeige ein Info-Toast, wenn Fallback-Symbole verwendet wurden
@@ -547,20 +742,22 @@ def fetch_data(n_clicks, symbol, timeframe, date_range):
     
     except Exception as e:
         error_msg = f"Fehler beim Laden der Daten: {str(e)}"
-        logger.error(error_msg)
+        logger.exception("Fehler beim Laden der Daten für %s", symbol)
         return dash.no_update, error_msg, dash.no_update, error_msg, "text-center small mt-2 text-danger", True, error_msg, False, ""
 
-# Callback für die Aktualisierung der Chart-Steuerelemente
-@app.callback(
-    [Output("toggle-sma", "children"),
-     Output("toggle-sma", "color"),
-     Output("toggle-bb", "children"),
+# Clientseitiger Callback für die Farben der Chart-Steuerelemente (ohne Server-Roundtrip)
+# Die Beschriftungen sind statisch im Layout; ungerade Klickzahl = aktiv, sonst Standardwert
+app.clientside_callback(
+    """
+    function(nSma, nBb, nRsi, nMacd, nVolume) {
+        const color = (n, active) => ((n ? n % 2 === 1 : active) ? 'primary' : 'outline-primary');
+        return [color(nSma, false), color(nBb, false), color(nRsi, true), color(nMacd, true), color(nVolume, true)];
+    }
+    """,
+    [Output("toggle-sma", "color"),
      Output("toggle-bb", "color"),
-     Output("toggle-rsi", "children"),
      Output("toggle-rsi", "color"),
-     Output("toggle-macd", "children"),
      Output("toggle-macd", "color"),
-     Output("toggle-volume", "children"),
      Output("toggle-volume", "color")],
     [Input("toggle-sma", "n_clicks"),
      Input("toggle-bb", "n_clicks"),
@@ -568,192 +765,224 @@ def fetch_data(n_clicks, symbol, timeframe, date_range):
      Input("toggle-macd", "n_clicks"),
      Input("toggle-volume", "n_clicks")]
 )
-def update_chart_controls(n_sma, n_bb, n_rsi, n_macd, n_volume):
-    # Standardwerte
-    sma_active = n_sma % 2 == 1 if n_sma else False
-    bb_active = n_bb % 2 == 1 if n_bb else False
-    rsi_active = n_rsi % 2 == 1 if n_rsi else True
-    macd_active = n_macd % 2 == 1 if n_macd else True
-    volume_active = n_volume % 2 == 1 if n_volume else True
+
+# Hilfsfunktion für Charts mit Fehlermeldung
+def _empty_error_fig(msg):
+    """
+    Erstellt ein leeres Chart mit einer Fehlermeldung
+    
+    Args:
+        msg (str): Anzuzeigende Fehlermeldung
+    
+    Returns:
+        go.Figure: Leeres Chart mit Fehlermeldung
+    """
+    fig = _empty_fig()
+    fig.add_annotation(
+        text=f"Fehler: {msg}",
+        xref="paper", yref="paper",
+        x=0.5, y=0.5,
+        showarrow=False,
+        font=dict(size=16, color=colors['danger']),
+    )
+    return fig
+
+@lru_cache(maxsize=8)
+def _chart_frame(symbol, timeframe, date_range, end, window=None):
+    """
+    Stellt die Chart-Daten für einen Eintrag des stock-data-store bereit
+    
+    Die Daten kommen aus dem Kursdaten-Cache und werden per M4-Aggregation auf
+    CHART_POINTS Zeitpunkte reduziert. Die vier Chart-Callbacks teilen sich das Ergebnis.
+    Mit `window` wird nur der gezoomte Bereich aggregiert, sodass beim Hineinzoomen
+    wieder mehr Details sichtbar werden.
+    
+    Args:
+        symbol (str): Das Aktiensymbol
+        timeframe (str): Zeitrahmen der Kerzen
+        date_range (str): Zeitraum
+        end (str): Letzter Zeitstempel beim Laden (Teil des Cache-Schlüssels)
+        window (tuple, optional): Sichtbarer Bereich (start, ende) der x-Achse
+    
+    Returns:
+        pd.DataFrame: DataFrame mit OHLCV-Daten und Indikatoren
+    """
+    result = fetch_ohlc(symbol, timeframe, date_range)
+    if result is None:
+        raise ValueError(f"Keine Daten für {symbol} verfügbar")
+    df, _ = result
     
-    # Erstelle die Button-Inhalte
-    sma_content = [DashIconify(icon="mdi:chart-line", width=16), " SMA"]
-    bb_content = [DashIconify(icon="mdi:chart-bell-curve-cumulative", width=16), " BB"]
-    rsi_content = [DashIconify(icon="mdi:chart-line-variant", width=16), " RSI"]
-    macd_content = [DashIconify(icon="mdi:chart-timeline-variant", width=16), " MACD"]
-    volume_content = [DashIconify(icon="mdi:chart-histogram", width=16), " VOL"]
+    # fetch_ohlc liefert nur kanonische Spaltennamen
+    assert set(OHLCV_COLUMNS).issubset(df.columns), "Unerwartetes Spaltenschema im stock-data-store"
     
-    # Setze die Button-Farben
-    sma_color = "primary" if sma_active else "outline-primary"
-    bb_color = "primary" if bb_active else "outline-primary"
-    rsi_color = "primary" if rsi_active else "outline-primary"
-    macd_color = "primary" if macd_active else "outline-primary"
-    volume_color = "primary" if volume_active else "outline-primary"
+    if window is not None:
+        df = slice_window(df, *window)
     
-    return sma_content, sma_color, bb_content, bb_color, rsi_content, rsi_color, macd_content, macd_color, volume_content, volume_color
+    # Fülle NaN-Werte (z.B. in der Anlaufphase der Indikatoren) in einem Durchlauf; Füllen
+    # und Aggregation können die Datentypen vergrößern, daher wird erneut reduziert
+    df = fill_missing(m4_aggregate(df, width=CHART_POINTS))
+    return quantize_dataframe(df)
 
-# Callback für die Aktualisierung der Charts
-@app.callback(
-    [Output("price-chart", "figure"),
-     Output("rsi-chart", "figure"),
-     Output("macd-chart", "figure"),
-     Output("volume-chart", "figure")],
-    [Input("stock-data-store", "data"),
-     Input("toggle-sma", "n_clicks"),
-     Input("toggle-bb", "n_clicks"),
-     Input("toggle-rsi", "n_clicks"),
-     Input("toggle-macd", "n_clicks"),
-     Input("toggle-volume", "n_clicks")]
-)
-def update_chart(data, n_sma, n_bb, n_rsi, n_macd, n_volume):
-    # Überprüfe, ob Daten vorhanden sind
+# Layout-Eigenschaften im Dashboard-Stil; sie werden direkt beim Erstellen der Charts
+# übergeben, sodass kein zweites update_layout nötig ist
+PRICE_LAYOUT = dict(DARK_LAYOUT, margin=dict(l=0, r=0, t=0, b=0))
+
+SUB_CHART_LAYOUT = dict(DARK_LAYOUT, margin=dict(l=0, r=0, t=30, b=0), height=200)
+
+# Ausgeblendete Charts bekommen eine leere Standardfigur, die nur einmal serialisiert wird
+HIDDEN_FIG = go.Figure().to_plotly_json()
+
+# Die Figuren sind je Datensatz und Toggle-Zustand gecacht, wiederholtes Umschalten baut nichts neu
+@lru_cache(maxsize=16)
+def _price_figure(symbol, timeframe, date_range, end, show_sma, show_bb, show_volume, window=None):
+    df = _chart_frame(symbol, timeframe, date_range, end, window)
+    return create_price_chart(
+        df, symbol, show_sma=show_sma, show_bb=show_bb, show_volume=show_volume,
+        layout={**PRICE_LAYOUT, "uirevision": symbol}, toggleable=True,
+    )
+
+@lru_cache(maxsize=8)
+def _indicator_figure(symbol, timeframe, date_range, end, indicator_type):
+    df = _chart_frame(symbol, timeframe, date_range, end)
+    return create_indicator_chart(df, indicator_type, layout={**SUB_CHART_LAYOUT, "uirevision": symbol})
+
+@lru_cache(maxsize=4)
+def _volume_figure(symbol, timeframe, date_range, end):
+    df = _chart_frame(symbol, timeframe, date_range, end)
+    return create_volume_chart(df, layout={**SUB_CHART_LAYOUT, "uirevision": symbol})
+
+def _render_chart(data, build, *args):
+    """
+    Erstellt ein Chart aus den Store-Daten mit einheitlicher Fehlerbehandlung
+    
+    Args:
+        data (dict): Inhalt des stock-data-store
+        build (callable): Gecachte Funktion, die das Chart erstellt
+        *args: Zusätzliche Argumente für build
+    
+    Returns:
+        go.Figure | dict: Chart, leeres Chart (EMPTY_FIG) oder Chart mit Fehlermeldung
+    """
     if data is None:
-        # Erstelle leere Charts
-        empty_price_chart = go.Figure()
-        empty_price_chart.update_layout(
-            template="plotly_dark",
-            paper_bgcolor=colors['card_background'],
-            plot_bgcolor=colors['card_background'],
-            margin=dict(l=0, r=0, t=0, b=0),
-            xaxis=dict(showgrid=False, zeroline=False),
-            yaxis=dict(showgrid=False, zeroline=False),
-        )
-        
-        return empty_price_chart, empty_price_chart, empty_price_chart, empty_price_chart
+        return EMPTY_FIG
     
     try:
-        # Lade die Daten aus dem Store
-        df = pd.read_json(StringIO(data['df']), orient='split')
-        symbol = data['symbol']
-        
-        # Setze den Index als DatetimeIndex
-        if not isinstance(df.index, pd.DatetimeIndex):
-            df.index = pd.to_datetime(df.index)
-        
-        # Überprüfe, ob der DataFrame leer ist
-        if df.empty:
-            logger.warning(f"Leerer DataFrame für Symbol {symbol}")
-            # Erstelle leere Charts
-            empty_price_chart = go.Figure()
-            empty_price_chart.update_layout(
-                template="plotly_dark",
-                paper_bgcolor=colors['card_background'],
-                plot_bgcolor=colors['card_background'],
-                margin=dict(l=0, r=0, t=0, b=0),
-                xaxis=dict(showgrid=False, zeroline=False),
-                yaxis=dict(showgrid=False, zeroline=False),
-            )
-            
-            return empty_price_chart, empty_price_chart, empty_price_chart, empty_price_chart
-        
-        # Überprüfe, ob NaN-Werte vorhanden sind
-        if df.isna().any().any():
-            logger.warning(f"{df.isna().sum().sum()} NaN-Werte gefunden, werden gefüllt...")
-            df = df.fillna(method='ffill').fillna(method='bfill').fillna(0)
-        
-        # Bestimme die aktiven Indikatoren
-        show_sma = n_sma % 2 == 1 if n_sma else False
-        show_bb = n_bb % 2 == 1 if n_bb else False
-        show_rsi = n_rsi % 2 == 1 if n_rsi else True
-        show_macd = n_macd % 2 == 1 if n_macd else True
-        show_volume = n_volume % 2 == 1 if n_volume else True
-        
-        # Erstelle die Charts
-        price_chart = create_price_chart(df, symbol, show_sma=show_sma, show_bb=show_bb, show_volume=show_volume)
-        rsi_chart = create_indicator_chart(df, 'rsi') if show_rsi else go.Figure()
-        macd_chart = create_indicator_chart(df, 'macd') if show_macd else go.Figure()
-        volume_chart = create_volume_chart(df) if show_volume else go.Figure()
-        
-        # Aktualisiere die Layouts
-        for chart in [rsi_chart, macd_chart, volume_chart]:
-            chart.update_layout(
-                template="plotly_dark",
-                paper_bgcolor=colors['card_background'],
-                plot_bgcolor=colors['card_background'],
-                margin=dict(l=0, r=0, t=30, b=0),
-                height=200,
-            )
-        
-        price_chart.update_layout(
-            template="plotly_dark",
-            paper_bgcolor=colors['card_background'],
-            plot_bgcolor=colors['card_background'],
-            margin=dict(l=0, r=0, t=0, b=0),
-        )
-        
-        return price_chart, rsi_chart, macd_chart, volume_chart
-    
+        return build(data['symbol'], data['timeframe'], data['date_range'], data['end'], *args)
     except Exception as e:
-        logger.error(f"Fehler beim Aktualisieren der Charts: {str(e)}")
-        # Erstelle leere Charts im Fehlerfall
-        empty_price_chart = go.Figure()
-        empty_price_chart.update_layout(
-            template="plotly_dark",
-            paper_bgcolor=colors['card_background'],
-            plot_bgcolor=colors['card_background'],
-            margin=dict(l=0, r=0, t=0, b=0),
-            xaxis=dict(showgrid=False, zeroline=False),
-            yaxis=dict(showgrid=False, zeroline=False),
-        )
-        
-        return empty_price_chart, empty_price_chart, empty_price_chart, empty_price_chart
+        logger.exception("Fehler beim Erstellen des Charts")
+        return _empty_error_fig(str(e))
 
-# Callback für die Aktualisierung der Trades-Tabelle
+# Callbacks für die Aktualisierung der Charts; jedes Chart hört nur auf seine eigenen Toggles.
+# SMA und BB sind immer im Preischart enthalten und werden clientseitig umgeschaltet,
+# das Volumen ändert die Subplot-Aufteilung und bleibt daher serverseitig
 @app.callback(
-    Output("trades-table-container", "children"),
-    [Input("stock-data-store", "data")]
+    Output("price-chart", "figure"),
+    [Input("stock-data-store", "data"),
+     Input("toggle-volume", "n_clicks")],
+    [State("toggle-sma", "n_clicks"),
+     State("toggle-bb", "n_clicks")],
+    prevent_initial_call=True
+)
+def update_price_chart(data, n_volume, n_sma, n_bb):
+    show_sma = n_sma % 2 == 1 if n_sma else False
+    show_bb = n_bb % 2 == 1 if n_bb else False
+    show_volume = n_volume % 2 == 1 if n_volume else True
+    return _render_chart(data, _price_figure, show_sma, show_bb, show_volume)
+
+app.clientside_callback(
+    """
+    function(nSma, nBb, figure) {
+        if (!figure || !figure.data) {
+            return window.dash_clientside.no_update;
+        }
+        const visible = {sma: nSma % 2 === 1, bb: nBb % 2 === 1};
+        const data = figure.data.map(t => (t.legendgroup in visible ? {...t, visible: visible[t.legendgroup]} : t));
+        return {...figure, data: data};
+    }
+    """,
+    Output("price-chart", "figure", allow_duplicate=True),
+    [Input("toggle-sma", "n_clicks"),
+     Input("toggle-bb", "n_clicks")],
+    State("price-chart", "figure"),
+    prevent_initial_call=True
+)
+
+# Beim Zoomen wird nur der sichtbare Bereich neu aggregiert; uirevision hält den Zoom fest
+@app.callback(
+    Output("price-chart", "figure", allow_duplicate=True),
+    Input("price-chart", "relayoutData"),
+    [State("stock-data-store", "data"),
+     State("toggle-sma", "n_clicks"),
+     State("toggle-bb", "n_clicks"),
+     State("toggle-volume", "n_clicks")],
+    prevent_initial_call=True
+)
+def zoom_price_chart(relayout_data, data, n_sma, n_bb, n_volume):
+    window = xaxis_window(relayout_data)
+    if window is None or data is None:
+        return dash.no_update
+    if window == (None, None):
+        window = None
+    
+    show_sma = n_sma % 2 == 1 if n_sma else False
+    show_bb = n_bb % 2 == 1 if n_bb else False
+    show_volume = n_volume % 2 == 1 if n_volume else True
+    return _render_chart(data, _price_figure, show_sma, show_bb, show_volume, window)
+
+@app.callback(
+    Output("rsi-chart", "figure"),
+    [Input("stock-data-store", "data"),
+     Input("toggle-rsi", "n_clicks")],
+    prevent_initial_call=True
+)
+def update_rsi_chart(data, n_rsi):
+    show_rsi = n_rsi % 2 == 1 if n_rsi else True
+    if data is not None and not show_rsi:
+        return HIDDEN_FIG
+    return _render_chart(data, _indicator_figure, 'rsi')
+
+@app.callback(
+    Output("macd-chart", "figure"),
+    [Input("stock-data-store", "data"),
+     Input("toggle-macd", "n_clicks")],
+    prevent_initial_call=True
+)
+def update_macd_chart(data, n_macd):
+    show_macd = n_macd % 2 == 1 if n_macd else True
+    if data is not None and not show_macd:
+        return HIDDEN_FIG
+    return _render_chart(data, _indicator_figure, 'macd')
+
+@app.callback(
+    Output("volume-chart", "figure"),
+    [Input("stock-data-store", "data"),
+     Input("toggle-volume", "n_clicks")],
+    prevent_initial_call=True
+)
+def update_volume_chart(data, n_volume):
+    show_volume = n_volume % 2 == 1 if n_volume else True
+    if data is not None and not show_volume:
+        return HIDDEN_FIG
+    return _render_chart(data, _volume_figure)
+
+# Callback für die Aktualisierung der Trades-Tabelle; nur die Zeilen werden übertragen
+@app.callback(
+    Output("trades-table", "data"),
+    [Input("stock-data-store", "data")],
+    prevent_initial_call=True
 )
 def update_trades_table(data):
     if data is None:
-        return html.Div("Keine Daten verfügbar", className="text-center text-muted py-5")
+        return []
     
-    try:
-        # Erstelle eine Beispiel-Tabelle für Trades
-        trades_data = [
-            {"Datum": "2023-01-15", "Typ": "Kauf", "Preis": "$150.25", "Menge": "10", "Wert": "$1,502.50"},
-            {"Datum": "2023-02-22", "Typ": "Verkauf", "Preis": "$165.75", "Menge": "5", "Wert": "$828.75"},
-            {"Datum": "2023-03-10", "Typ": "Kauf", "Preis": "$145.30", "Menge": "8", "Wert": "$1,162.40"},
-            {"Datum": "2023-04-05", "Typ": "Verkauf", "Preis": "$170.20", "Menge": "13", "Wert": "$2,212.60"},
-        ]
-        
-        table = dash_table.DataTable(
-            data=trades_data,
-            columns=[{"name": col, "id": col} for col in trades_data[0].keys()],
-            style_header={
-                "backgroundColor": colors['background'],
-                "color": colors['text'],
-                "fontWeight": "bold",
-                "border": f"1px solid {colors['secondary']}",
-            },
-            style_cell={
-                "backgroundColor": colors['card_background'],
-                "color": colors['text'],
-                "border": f"1px solid {colors['secondary']}",
-                "padding": "10px",
-                "textAlign": "left",
-            },
-            style_data_conditional=[
-                {
-                    "if": {"column_id": "Typ", "filter_query": "{Typ} eq 'Kauf'"},
-                    "color": colors['success'],
-                },
-                {
-                    "if": {"column_id": "Typ", "filter_query": "{Typ} eq 'Verkauf'"},
-                    "color": colors['danger'],
-                },
-            ],
-            page_size=10,
-        )
-        
-        return table
-    
-    except Exception as e:
-        logger.error(f"Fehler beim Aktualisieren der Trades-Tabelle: {str(e)}")
-        return html.Div(f"Fehler beim Laden der Trades: {str(e)}", className="text-center text-danger py-5")
+    return SAMPLE_TRADE_RECORDS
 
 # Starte die App
 if __name__ == "__main__":
     # Melde erfolgreiche Initialisierung
     logger.info("Manus API erfolgreich initialisiert")
     print("Starte Trading Dashboard auf http://localhost:8050")
-    app.run_server(debug=True, host="0.0.0.0", port=8050)
+    # Der Entwicklungsmodus (Reloader, Dev-Tools, Prop-Prüfung) nur auf Wunsch; für den
+    # Produktionsbetrieb wsgi.py mit gunicorn oder waitress verwenden
+    debug = os.environ.get("DASH_DEBUG") == "1"
+    app.run(debug=debug, dev_tools_ui=debug, dev_tools_props_check=debug, host="0.0.0.0", port=8050)
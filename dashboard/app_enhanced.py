@@ -1,13 +1,14 @@
 import os
 import sys
-import json
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
+from functools import lru_cache
 from io import StringIO
 
 import dash
-from dash import dcc, html, Input, Output, State, callback, dash_table, ALL, MATCH
+from dash import dcc, html, Input, Output, State, Patch, callback, dash_table, ALL, MATCH
+from dash.exceptions import PreventUpdate
 import dash_bootstrap_components as dbc
 from dash_bootstrap_templates import load_figure_template, ThemeChangerAIO
 from dash_iconify import DashIconify
@@ -22,17 +23,48 @@ parent_dir = os.path.dirname(current_dir)
 sys.path.append(parent_dir)
 
 # Importiere die benutzerdefinierten Komponenten
-from components import load_nasdaq_symbols, create_asset_buttons, create_timeframe_buttons
+from components_module import load_nasdaq_symbols, create_asset_buttons, create_timeframe_buttons
 
 # Importiere die Datenverarbeitungsfunktionen
 from data.data_loader import load_stock_data
-from chart_utils import create_price_chart, create_volume_chart, create_indicator_chart
+from chart_utils import create_price_chart, create_volume_chart, create_indicator_chart, m4_aggregate
+from store_utils import create_cache, encode_array, encode_dataframe, decode_dataframe, memoize, quantize_dataframe
+from data.data_processor import DataProcessor
+from backtesting.backtest_engine import BacktestEngine
+from strategy.example_strategies import MovingAverageCrossover, RSIStrategy, MACDStrategy, BollingerBandsStrategy
 from chart_callbacks import register_chart_callbacks
 from error_handler import handle_error
 
+# dash-ag-grid virtualisiert die Trade-Liste; ohne das Paket wird die DataTable verwendet
+try:
+    import dash_ag_grid as dag
+    AG_GRID_AVAILABLE = True
+except ImportError:
+    AG_GRID_AVAILABLE = False
+
+# plotly-resampler ist optional; ohne das Paket wird die volle Auflösung übertragen
+try:
+    from plotly_resampler import FigureResampler
+    RESAMPLER_AVAILABLE = True
+except ImportError:
+    RESAMPLER_AVAILABLE = False
+
+# Hintergrund-Callbacks benötigen diskcache; ohne das Paket läuft der Backtest im Request
+try:
+    import diskcache
+    background_callback_manager = dash.DiskcacheManager(diskcache.Cache(os.path.join(current_dir, ".cache", "background")))
+except ImportError:
+    background_callback_manager = None
+
+# Schlankes Plotly-Bundle (nur bar, candlestick, ohlc, scatter/scattergl), erzeugt mit
+# `npm run build:plotly`. Dash bindet JS-Dateien aus assets/ automatisch ein; ist
+# window.Plotly dadurch gesetzt, lädt dcc.Graph das vollständige Standard-Bundle nicht nach.
+PLOTLY_BUNDLE_AVAILABLE = os.path.exists(os.path.join(current_dir, "assets", "plotly-custom.min.js"))
+
 # Initialisiere die Dash-App
 app = dash.Dash(
     __name__,
+    background_callback_manager=background_callback_manager,
     external_stylesheets=[dbc.themes.BOOTSTRAP],
     meta_tags=[
         {"name": "viewport", "content": "width=device-width, initial-scale=1"},
@@ -40,6 +72,40 @@ app = dash.Dash(
     suppress_callback_exceptions=True
 )
 
+# Komprimiere Callback-Antworten (Brotli/gzip), wenn flask-compress installiert ist
+try:
+    from flask_compress import Compress
+    app.server.config.update(
+        COMPRESS_ALGORITHM=['br', 'gzip'],
+        COMPRESS_LEVEL=4,
+        COMPRESS_MIN_SIZE=1024,
+    )
+    Compress(app.server)
+except ImportError:
+    pass
+
+# Serverseitiger Cache für geladene Kursdaten (Redis, wenn konfiguriert, sonst Dateisystem)
+cache = create_cache(app.server, os.path.join(current_dir, ".cache", "data"))
+
+def fetch_ohlc(symbol, timeframe, date_range):
+    """
+    Lädt die Kursdaten für ein Symbol
+    
+    Args:
+        symbol (str): Das Aktiensymbol
+        timeframe (str): Zeitrahmen der Kerzen
+        date_range (str): Zeitraum
+        
+    Returns:
+        pd.DataFrame | None: DataFrame mit OHLCV-Daten oder None, wenn keine Daten vorliegen
+    """
+    df = load_stock_data(symbol, timeframe, date_range)
+    if df is None or df.empty:
+        return None
+    return df
+
+fetch_ohlc = memoize(cache, timeout=300, maxsize=8)(fetch_ohlc)
+
 # Setze den Titel der App
 app.title = "Trading Dashboard"
 
@@ -59,9 +125,92 @@ colors = {
     'info': '#0dcaf0',
 }
 
+# Hashbarer Schlüssel des Farbschemas für die gecachten Layout-Bausteine
+colors_key = tuple(sorted(colors.items()))
+
 # Lade die Nasdaq-Symbole
 nasdaq_symbols = load_nasdaq_symbols()
 
+# Symbole und Basisklassen der Asset-Buttons in Layout-Reihenfolge (wie create_asset_buttons)
+_ASSET_SYMBOLS = np.array(
+    [s["symbol"] for s in nasdaq_symbols.get("popular_symbols", []) + nasdaq_symbols.get("indices", [])],
+    dtype=object,
+)
+_ASSET_CLASSES = np.array(
+    ["asset-button"] * len(nasdaq_symbols.get("popular_symbols", []))
+    + ["asset-button index-button"] * len(nasdaq_symbols.get("indices", [])),
+    dtype=object,
+)
+
+# Strategien, die über das Strategie-Dropdown ausgewählt werden können
+STRATEGIES = {
+    "ma_crossover": MovingAverageCrossover,
+    "rsi_strategy": RSIStrategy,
+    "macd_strategy": MACDStrategy,
+    "bb_strategy": BollingerBandsStrategy,
+}
+
+# Zuletzt erzeugte FigureResampler-Objekte je Browser-Sitzung, damit Zoom-Events nachladen können;
+# über _RESAMPLED_SESSIONS hinaus werden die ältesten Sitzungen verdrängt
+_resampled_figures = {}
+_RESAMPLED_SESSIONS = 32
+
+# Anzahl der Zeitpunkte, auf die Chart-Daten per M4-Aggregation reduziert werden
+CHART_POINTS = 1000
+
+# Indikator-Parameter (Name -> Parameter-Tupel)
+INDICATOR_PARAMS = {
+    "sma": (20,),
+    "bb": (20, 2),
+    "rsi": (14,),
+    "macd": (12, 26, 9),
+}
+
+# Trace-Positionen der Overlays im Preischart (Candlestick, SMA, BB obere/mittlere/untere)
+SMA_TRACES = (1,)
+BB_TRACES = (2, 3, 4)
+
+@lru_cache(maxsize=256)
+def _indicator(symbol, timeframe, date_range, end, rows, name, params):
+    """
+    Berechnet einen Indikator in der Auflösung des Charts
+    
+    Die Berechnung läuft auf den vollständigen Daten; anschließend wird das Ergebnis
+    mit denselben Buckets wie das Chart reduziert, sodass die Werte zu den Kerzen passen.
+    
+    Args:
+        symbol (str): Das Aktiensymbol
+        timeframe (str): Zeitrahmen der Kerzen
+        date_range (str): Zeitraum
+        end (str): Letzter Zeitstempel der Chart-Daten, damit neue Kerzen den Cache invalidieren
+        rows (int): Anzahl der Chart-Zeilen; mit end bildet sie die Datenversion, sodass nach
+            einem erneuten Laden keine Arrays anderer Länge wiederverwendet werden
+        name (str): Indikator ('sma', 'bb', 'rsi', 'macd')
+        params (tuple): Parameter des Indikators
+        
+    Returns:
+        tuple: float32-Arrays je Linie (bb: obere, mittlere, untere; macd: MACD, Signal, Histogramm)
+    """
+    df = fetch_ohlc(symbol, timeframe, date_range)
+    if df is None:
+        raise ValueError(f"Keine Daten für {symbol} verfügbar")
+    
+    if name == "sma":
+        lines = [DataProcessor.calculate_sma(df, *params)]
+    elif name == "bb":
+        middle, upper, lower = DataProcessor.calculate_bollinger_bands(df, *params)
+        lines = [upper, middle, lower]
+    elif name == "rsi":
+        lines = [DataProcessor.calculate_rsi(df, *params)]
+    elif name == "macd":
+        lines = list(DataProcessor.calculate_macd(df, *params))
+    else:
+        raise ValueError(f"Unbekannter Indikator: {name}")
+    
+    # Eindeutige Spaltennamen, da alle Linien aus 'Close' abgeleitet sind
+    frame = m4_aggregate(pd.concat(lines, axis=1, keys=range(len(lines))), width=CHART_POINTS)
+    return tuple(frame[i].to_numpy(dtype=np.float32) for i in range(len(lines)))
+
 # Definiere Header
 header = dbc.Navbar(
     dbc.Container(
@@ -109,9 +258,7 @@ sidebar = dbc.Card(
     [
         dbc.CardHeader([
             html.H4("Dateneinstellungen", className="card-title mb-0"),
-            html.Div([
-                DashIconify(icon="mdi:database-cog", width=24, color=colors['primary']),
-            ], className="float-end")
+            DashIconify(icon="mdi:database-cog", width=24, color=colors['primary'], className="float-end")
         ]),
         dbc.CardBody([
             dbc.Form([
@@ -191,11 +338,23 @@ sidebar = dbc.Card(
 )
 
 # Definiere Hauptbereich für Charts
-chart_card = dbc.Card(
-    [
-        dbc.CardHeader([
-            html.H4(["Preischart ", html.Span(id="chart-symbol", className="text-primary")], className="card-title mb-0 d-inline"),
-            html.Div([
+@lru_cache(maxsize=1)
+def _build_chart_card(colors_key):
+    """
+    Erstellt die Karte mit dem Preischart
+    
+    Args:
+        colors_key (tuple): Sortierte (Name, Farbe)-Paare des Farbschemas
+        
+    Returns:
+        dbc.Card: Karte für das Layout
+    """
+    colors = dict(colors_key)
+    
+    return dbc.Card(
+        [
+            dbc.CardHeader([
+                html.H4(["Preischart ", html.Span(id="chart-symbol", className="text-primary")], className="card-title mb-0 d-inline"),
                 dbc.ButtonGroup([
                     dbc.Button(id="toggle-sma", className="btn-sm", n_clicks=0),
                     dbc.Button(id="toggle-bb", className="btn-sm", n_clicks=0),
@@ -203,134 +362,351 @@ chart_card = dbc.Card(
                     dbc.Button(id="toggle-macd", className="btn-sm", n_clicks=0),
                     dbc.Button(id="toggle-volume", className="btn-sm", n_clicks=0),
                 ], className="float-end"),
-            ], className="float-end"),
-        ]),
-        dbc.CardBody([
-            dcc.Loading(
-                dcc.Graph(
-                    id="price-chart",
-                    config={
-                        "displayModeBar": True,
-                        "scrollZoom": True,
-                        "modeBarButtonsToRemove": ["lasso2d", "select2d"],
-                    },
-                    style={"height": "500px"},
+                dbc.ButtonGroup([
+                    dbc.Button(DashIconify(icon="mdi:magnify-plus-outline", width=16), id="zoom-in-button", className="btn-sm", color="secondary", outline=True, n_clicks=0),
+                    dbc.Button(DashIconify(icon="mdi:magnify-minus-outline", width=16), id="zoom-out-button", className="btn-sm", color="secondary", outline=True, n_clicks=0),
+                    dbc.Button(DashIconify(icon="mdi:fit-to-screen-outline", width=16), id="zoom-reset-button", className="btn-sm", color="secondary", outline=True, n_clicks=0),
+                    dbc.Button(DashIconify(icon="mdi:crosshairs", width=16), id="crosshair-button", className="btn-sm", color="secondary", outline=True, n_clicks=0),
+                ], className="float-end me-2"),
+            ]),
+            dbc.CardBody([
+                dcc.Loading(
+                    dcc.Graph(
+                        id="price-chart",
+                        config={
+                            "displayModeBar": True,
+                            "scrollZoom": True,
+                            "plotGlPixelRatio": 1,
+                            "modeBarButtonsToRemove": ["lasso2d", "select2d"],
+                        },
+                        style={"height": "500px"},
+                    ),
+                    type="default",
                 ),
-                type="default",
-            ),
-            html.Div(id="chart-indicators", className="mt-2"),
-        ]),
-    ],
-    className="mb-4 shadow",
-    style={"backgroundColor": colors['card_background']},
-)
+                html.Div(id="chart-indicators", className="mt-2"),
+            ]),
+        ],
+        className="mb-4 shadow",
+        style={"backgroundColor": colors['card_background']},
+    )
+
+chart_card = _build_chart_card(colors_key)
+
+def _build_equity_figure(colors):
+    """
+    Erstellt die leere Equity-Kurve, deren Daten später per Patch gesetzt werden
+    
+    Args:
+        colors (dict): Farbschema
+        
+    Returns:
+        go.Figure: Figur mit einer leeren Equity-Linie
+    """
+    fig = go.Figure(
+        go.Scattergl(
+            x=[],
+            y=[],
+            mode="lines",
+            name="Equity",
+            line=dict(color=colors['primary'], width=1.5),
+        )
+    )
+    fig.update_layout(
+        template="bootstrap",
+        paper_bgcolor=colors['card_background'],
+        plot_bgcolor=colors['card_background'],
+        font=dict(color=colors['text']),
+        margin=dict(l=0, r=0, t=0, b=0),
+        # Die Zeitstempel kommen als Millisekunden, daher muss der Achsentyp feststehen
+        xaxis=dict(type="date"),
+        showlegend=False,
+    )
+    return fig
 
 # Definiere Bereich für Backtest-Ergebnisse
-results_card = dbc.Card(
-    [
-        dbc.CardHeader([
-            html.H4("Backtest-Ergebnisse", className="card-title mb-0"),
-        ]),
-        dbc.CardBody([
-            dbc.Row([
-                dbc.Col([
-                    dbc.Card([
-                        dbc.CardBody([
-                            html.H5("Gesamtrendite", className="card-title text-center"),
-                            html.H3(id="total-return", className="text-center mb-0"),
-                        ]),
-                    ], className="mb-3 shadow-sm"),
-                ], width=4),
-                dbc.Col([
-                    dbc.Card([
-                        dbc.CardBody([
-                            html.H5("Win-Rate", className="card-title text-center"),
-                            html.H3(id="win-rate", className="text-center mb-0"),
-                        ]),
-                    ], className="mb-3 shadow-sm"),
-                ], width=4),
-                dbc.Col([
-                    dbc.Card([
-                        dbc.CardBody([
-                            html.H5("Profit-Faktor", className="card-title text-center"),
-                            html.H3(id="profit-factor", className="text-center mb-0"),
-                        ]),
-                    ], className="mb-3 shadow-sm"),
-                ], width=4),
+@lru_cache(maxsize=1)
+def _build_results_card(colors_key):
+    """
+    Erstellt die Karte mit den Backtest-Ergebnissen
+    
+    Args:
+        colors_key (tuple): Sortierte (Name, Farbe)-Paare des Farbschemas
+        
+    Returns:
+        dbc.Card: Karte für das Layout
+    """
+    colors = dict(colors_key)
+    
+    return dbc.Card(
+        [
+            dbc.CardHeader([
+                html.H4("Backtest-Ergebnisse", className="card-title mb-0"),
             ]),
-            dbc.Row([
-                dbc.Col([
-                    dcc.Loading(
-                        dcc.Graph(
-                            id="equity-curve",
-                            config={"displayModeBar": False},
-                            style={"height": "300px"},
+            dbc.CardBody([
+                dbc.Row([
+                    dbc.Col([
+                        dbc.Card([
+                            dbc.CardBody([
+                                html.H5("Gesamtrendite", className="card-title text-center"),
+                                html.H3(id="total-return", className="text-center mb-0"),
+                            ]),
+                        ], className="mb-3 shadow-sm"),
+                    ], width=4),
+                    dbc.Col([
+                        dbc.Card([
+                            dbc.CardBody([
+                                html.H5("Win-Rate", className="card-title text-center"),
+                                html.H3(id="win-rate", className="text-center mb-0"),
+                            ]),
+                        ], className="mb-3 shadow-sm"),
+                    ], width=4),
+                    dbc.Col([
+                        dbc.Card([
+                            dbc.CardBody([
+                                html.H5("Profit-Faktor", className="card-title text-center"),
+                                html.H3(id="profit-factor", className="text-center mb-0"),
+                            ]),
+                        ], className="mb-3 shadow-sm"),
+                    ], width=4),
+                ]),
+                dbc.Row([
+                    dbc.Col([
+                        dcc.Loading(
+                            dcc.Graph(
+                                id="equity-curve",
+                                figure=_build_equity_figure(colors),
+                                config={"displayModeBar": False, "plotGlPixelRatio": 1},
+                                style={"height": "300px"},
+                            ),
+                            type="default",
                         ),
-                        type="default",
-                    ),
+                    ]),
                 ]),
             ]),
-        ]),
-    ],
-    className="mb-4 shadow",
-    style={"backgroundColor": colors['card_background']},
-)
+        ],
+        className="mb-4 shadow",
+        style={"backgroundColor": colors['card_background']},
+    )
 
-# Definiere Bereich für Trade-Liste
-trades_card = dbc.Card(
-    [
-        dbc.CardHeader([
-            html.H4("Trade-Liste", className="card-title mb-0"),
-        ]),
-        dbc.CardBody([
-            dcc.Loading(
-                dash_table.DataTable(
-                    id="trades-table",
-                    columns=[
-                        {"name": "Datum", "id": "date"},
-                        {"name": "Typ", "id": "type"},
-                        {"name": "Preis", "id": "price"},
-                        {"name": "Menge", "id": "quantity"},
-                        {"name": "P/L", "id": "pnl"},
-                    ],
-                    style_header={
-                        "backgroundColor": colors['background'],
-                        "color": colors['text'],
-                        "fontWeight": "bold",
-                        "textAlign": "center",
-                    },
-                    style_cell={
-                        "backgroundColor": colors['card_background'],
-                        "color": colors['text'],
-                        "textAlign": "center",
-                    },
-                    style_data_conditional=[
-                        {
-                            "if": {"filter_query": "{type} = 'BUY'"},
-                            "backgroundColor": "rgba(25, 135, 84, 0.1)",
-                        },
-                        {
-                            "if": {"filter_query": "{type} = 'SELL'"},
-                            "backgroundColor": "rgba(220, 53, 69, 0.1)",
-                        },
-                        {
-                            "if": {"filter_query": "{pnl} > 0"},
-                            "color": colors['success'],
-                        },
-                        {
-                            "if": {"filter_query": "{pnl} < 0"},
-                            "color": colors['danger'],
-                        },
+# Spalten der Trade-Liste
+TRADES_COLUMNS = [
+    {"name": "Datum", "id": "date"},
+    {"name": "Typ", "id": "type"},
+    {"name": "Preis", "id": "price"},
+    {"name": "Menge", "id": "quantity"},
+    {"name": "P/L", "id": "pnl"},
+]
+
+# Property, über die Callbacks die Zeilen der Trade-Liste setzen
+TRADES_TABLE_PROP = "rowData" if AG_GRID_AVAILABLE else "data"
+
+def _build_trades_table(colors):
+    """
+    Erstellt die Tabelle für die Trade-Liste
+    
+    Mit dash-ag-grid werden nur die sichtbaren Zeilen gerendert; ohne das Paket
+    wird auf eine virtualisierte DataTable zurückgegriffen. Sortieren und Filtern
+    laufen in beiden Fällen vollständig im Browser.
+    
+    Args:
+        colors (dict): Farbschema
+        
+    Returns:
+        Component: AgGrid oder DataTable mit der ID "trades-table"
+    """
+    if AG_GRID_AVAILABLE:
+        return dag.AgGrid(
+            id="trades-table",
+            columnDefs=[{"field": col["id"], "headerName": col["name"]} for col in TRADES_COLUMNS],
+            rowData=[],
+            defaultColDef={
+                "sortable": True,
+                "filter": True,
+                "resizable": True,
+                "cellStyle": {
+                    "styleConditions": [
+                        {"condition": "params.data.pnl > 0", "style": {"color": colors['success']}},
+                        {"condition": "params.data.pnl < 0", "style": {"color": colors['danger']}},
                     ],
-                    page_size=10,
+                },
+            },
+            getRowStyle={
+                "styleConditions": [
+                    {"condition": "params.data.type === 'BUY'", "style": {"backgroundColor": "rgba(25, 135, 84, 0.1)"}},
+                    {"condition": "params.data.type === 'SELL'", "style": {"backgroundColor": "rgba(220, 53, 69, 0.1)"}},
+                ],
+            },
+            columnSize="sizeToFit",
+            className="ag-theme-alpine-dark",
+            dashGridOptions={"pagination": True, "paginationPageSize": 25, "rowBuffer": 10},
+            style={"height": "400px"},
+        )
+    
+    return dash_table.DataTable(
+        id="trades-table",
+        columns=TRADES_COLUMNS,
+        data=[],
+        sort_action="native",
+        filter_action="native",
+        page_action="none",
+        virtualization=True,
+        fixed_rows={"headers": True},
+        style_table={"height": "400px", "overflowY": "auto"},
+        style_header={
+            "backgroundColor": colors['background'],
+            "color": colors['text'],
+            "fontWeight": "bold",
+            "textAlign": "center",
+        },
+        # Feste Spaltenbreiten, damit Kopf und virtualisierte Zeilen ausgerichtet bleiben
+        style_cell={
+            "backgroundColor": colors['card_background'],
+            "color": colors['text'],
+            "textAlign": "center",
+            "minWidth": "100px",
+            "width": "100px",
+            "maxWidth": "100px",
+        },
+        style_data_conditional=[
+            {
+                "if": {"filter_query": "{type} = 'BUY'"},
+                "backgroundColor": "rgba(25, 135, 84, 0.1)",
+            },
+            {
+                "if": {"filter_query": "{type} = 'SELL'"},
+                "backgroundColor": "rgba(220, 53, 69, 0.1)",
+            },
+            {
+                "if": {"filter_query": "{pnl} > 0"},
+                "color": colors['success'],
+            },
+            {
+                "if": {"filter_query": "{pnl} < 0"},
+                "color": colors['danger'],
+            },
+        ],
+    )
+
+# Definiere Bereich für Trade-Liste
+@lru_cache(maxsize=1)
+def _build_trades_card(colors_key):
+    """
+    Erstellt die Karte mit der Trade-Liste
+    
+    Args:
+        colors_key (tuple): Sortierte (Name, Farbe)-Paare des Farbschemas
+        
+    Returns:
+        dbc.Card: Karte für das Layout
+    """
+    colors = dict(colors_key)
+    
+    return dbc.Card(
+        [
+            dbc.CardHeader([
+                html.H4("Trade-Liste", className="card-title mb-0"),
+            ]),
+            dbc.CardBody([
+                dcc.Loading(
+                    _build_trades_table(colors),
+                    type="default",
                 ),
-                type="default",
-            ),
-        ]),
-    ],
-    className="mb-4 shadow",
-    style={"backgroundColor": colors['card_background']},
-)
+            ]),
+        ],
+        className="mb-4 shadow",
+        style={"backgroundColor": colors['card_background']},
+    )
+
+# Definiere die Strategie-Karte
+@lru_cache(maxsize=1)
+def _build_strategy_card(colors_key):
+    """
+    Erstellt die Karte mit den Strategie-Einstellungen
+    
+    Args:
+        colors_key (tuple): Sortierte (Name, Farbe)-Paare des Farbschemas
+        
+    Returns:
+        dbc.Card: Karte für das Layout
+    """
+    colors = dict(colors_key)
+    
+    return dbc.Card(
+        [
+            dbc.CardHeader([
+                html.H4("Strategie-Einstellungen", className="card-title mb-0"),
+                DashIconify(icon="mdi:strategy", width=24, color=colors['primary'], className="float-end")
+            ]),
+            dbc.CardBody([
+                dbc.Form([
+                    dbc.Row([
+                        dbc.Col([
+                            dbc.Label("Strategie", html_for="strategy-dropdown", className="mb-1"),
+                            dbc.InputGroup([
+                                dbc.InputGroupText(DashIconify(icon="mdi:chart-timeline-variant", width=18)),
+                                dbc.Select(
+                                    id="strategy-dropdown",
+                                    options=[
+                                        {"label": "Moving Average Crossover", "value": "ma_crossover"},
+                                        {"label": "RSI Strategy", "value": "rsi_strategy"},
+                                        {"label": "MACD Strategy", "value": "macd_strategy"},
+                                        {"label": "Bollinger Bands Strategy", "value": "bb_strategy"},
+                                    ],
+                                    value="ma_crossover",
+                                    className="border-start-0",
+                                ),
+                            ], className="mb-3"),
+                        ]),
+                    ]),
+
+                    dbc.Row([
+                        dbc.Col([
+                            dbc.Label("Startkapital (€)", html_for="capital-input", className="mb-1"),
+                            dbc.InputGroup([
+                                dbc.InputGroupText("€"),
+                                dbc.Input(
+                                    id="capital-input",
+                                    type="number",
+                                    value=5000,
+                                    min=1000,
+                                    step=1000,
+                                ),
+                            ], className="mb-3"),
+                        ], width=6),
+                        dbc.Col([
+                            dbc.Label("Kommission (%)", html_for="commission-input", className="mb-1"),
+                            dbc.InputGroup([
+                                dbc.InputGroupText("%"),
+                                dbc.Input(
+                                    id="commission-input",
+                                    type="number",
+                                    value=0.1,
+                                    min=0,
+                                    max=5,
+                                    step=0.1,
+                                ),
+                            ], className="mb-3"),
+                        ], width=6),
+                    ]),
+
+                    dbc.Row([
+                        dbc.Col([
+                            dbc.Button(
+                                [DashIconify(icon="mdi:play", width=18, className="me-2"), "Backtest durchführen"],
+                                id="run-backtest-button",
+                                color="success",
+                                className="w-100 mb-3",
+                            ),
+                        ]),
+                    ]),
+                ]),
+            ]),
+        ],
+        className="mb-4 shadow",
+        style={"backgroundColor": colors['card_background']},
+    )
+
+strategy_card = _build_strategy_card(colors_key)
 
 # Definiere das Layout der App
 app.layout = html.Div(
@@ -339,6 +715,8 @@ app.layout = html.Div(
         dcc.Store(id="stock-data-store"),
         dcc.Store(id="backtest-results-store"),
         dcc.Store(id="active-timeframe-store", data="1h"),  # Standardmäßig 1h
+        dcc.Store(id="active-indicators-store", data=[]),
+        dcc.Store(id="session-id-store", storage_type="session"),  # Kennung der Browser-Sitzung
 
         # Header
         header,
@@ -363,8 +741,9 @@ app.layout = html.Div(
                         dbc.Col(
                             [
                                 chart_card,
-                                results_card,
-                                trades_card,
+                                # Ergebnis- und Trade-Karte werden erst nach dem ersten Backtest eingehängt
+                                html.Div(id="results-slot"),
+                                html.Div(id="trades-slot"),
                             ],
                             lg=9,
                             md=12,
@@ -383,7 +762,8 @@ app.layout = html.Div(
                     html.P(
                         [
                             "Trading Dashboard Pro v3.0.1 | ",
-                            html.Span(id="server-status", className="text-success"),
+                            # Der Status ist konstant und wird daher statisch gerendert
+                            html.Span("Server", id="server-status", className="text-success"),
                             html.I(className="fas fa-circle text-success ms-1"),
                         ],
                         className="text-center text-muted small",
@@ -429,128 +809,47 @@ app.layout = html.Div(
 # Callback für die Asset-Buttons
 @app.callback(
     [Output("symbol-input", "value"),
-     Output({"type": "asset-button", "symbol": ALL}, "className")],
-    [Input({"type": "asset-button", "symbol": ALL}, "n_clicks")],
-    [State({"type": "asset-button", "symbol": ALL}, "id"),
-     State({"type": "asset-button", "symbol": ALL}, "className")]
+     Output({"type": "asset-button", "index": ALL}, "className")],
+    [Input({"type": "asset-button", "index": ALL}, "n_clicks")],
+    [State({"type": "asset-button", "index": ALL}, "className")]
 )
-def update_symbol_from_button(n_clicks, ids, classes):
-    ctx = dash.callback_context
+def update_symbol_from_button(n_clicks, classes):
+    triggered = dash.callback_context.triggered_id
     
     # Wenn kein Button geklickt wurde, keine Änderung
-    if not ctx.triggered:
-        button_classes = []
-        for cls in classes:
-            if "index-button" in cls:
-                button_classes.append("asset-button index-button")
-            else:
-                button_classes.append("asset-button")
-        return dash.no_update, button_classes
+    if not isinstance(triggered, dict):
+        raise PreventUpdate
     
     # Finde den geklickten Button
-    button_id = ctx.triggered[0]['prop_id'].split('.')[0]
-    button_data = json.loads(button_id)
-    clicked_symbol = button_data['symbol']
-    
-    # Aktualisiere die Button-Klassen
-    button_classes = []
-    for i, id_obj in enumerate(ids):
-        symbol = id_obj['symbol']
-        is_index = "index-button" in classes[i]
-        
-        if symbol == clicked_symbol:
-            if is_index:
-                button_classes.append("asset-button index-button active")
-            else:
-                button_classes.append("asset-button active")
-        else:
-            if is_index:
-                button_classes.append("asset-button index-button")
-            else:
-                button_classes.append("asset-button")
+    clicked_symbol = triggered['index']
+    
+    # Nur der bisher und der neu aktive Button ändern sich; alle anderen bleiben
+    # no_update und tauchen in der Antwort gar nicht erst auf
+    was_active = np.char.endswith(np.asarray(classes, dtype=str), " active")
+    is_active = _ASSET_SYMBOLS == clicked_symbol
+    new_classes = np.where(is_active, _ASSET_CLASSES + " active", _ASSET_CLASSES)
+    button_classes = np.where(was_active != is_active, new_classes, dash.no_update).tolist()
     
     return clicked_symbol, button_classes
 
-# Callback für die Zeitrahmen-Buttons
+# Callback für die Zeitrahmen-Buttons; ein Pattern-Matching-Output statt je eines pro Button
 @app.callback(
     [Output("active-timeframe-store", "data"),
-     Output("tf-1min", "className"),
-     Output("tf-2min", "className"),
-     Output("tf-3min", "className"),
-     Output("tf-5m", "className"),
-     Output("tf-15m", "className"),
-     Output("tf-30m", "className"),
-     Output("tf-1h", "className"),
-     Output("tf-4h", "className")],
-    [Input("tf-1min", "n_clicks"),
-     Input("tf-2min", "n_clicks"),
-     Input("tf-3min", "n_clicks"),
-     Input("tf-5m", "n_clicks"),
-     Input("tf-15m", "n_clicks"),
-     Input("tf-30m", "n_clicks"),
-     Input("tf-1h", "n_clicks"),
-     Input("tf-4h", "n_clicks")],
-    [State("active-timeframe-store", "data")]
+     Output({"type": "timeframe-button", "index": ALL}, "className")],
+    [Input({"type": "timeframe-button", "index": ALL}, "n_clicks")],
+    [State({"type": "timeframe-button", "index": ALL}, "id")]
 )
-def update_active_timeframe(n1, n2, n3, n5, n15, n30, n1h, n4h, current_tf):
-    ctx = dash.callback_context
-    
-    # Wenn kein Button geklickt wurde, behalte den aktuellen Zeitrahmen
-    if not ctx.triggered:
-        return update_timeframe_classes(current_tf)
-    
-    # Finde den geklickten Button
-    button_id = ctx.triggered[0]['prop_id'].split('.')[0]
-    
-    # Ordne den Button-ID dem entsprechenden Zeitrahmen zu
-    timeframe_map = {
-        "tf-1min": "1m",
-        "tf-2min": "2m",
-        "tf-3min": "3m",
-        "tf-5m": "5m",
-        "tf-15m": "15m",
-        "tf-30m": "30m",
-        "tf-1h": "60m",
-        "tf-4h": "4h"
-    }
+def update_active_timeframe(n_clicks, ids):
+    triggered = dash.callback_context.triggered_id
     
-    # Setze den neuen Zeitrahmen
-    new_timeframe = timeframe_map.get(button_id, current_tf)
-    
-    # Aktualisiere die Button-Klassen basierend auf dem neuen Zeitrahmen
-    return update_timeframe_classes(new_timeframe)
-
-def update_timeframe_classes(active_tf):
-    # Ordne den Zeitrahmen den Button-IDs zu
-    timeframe_map = {
-        "1m": "tf-1min",
-        "2m": "tf-2min",
-        "3m": "tf-3min",
-        "5m": "tf-5m",
-        "15m": "tf-15m",
-        "30m": "tf-30m",
-        "60m": "tf-1h",
-        "4h": "tf-4h"
-    }
+    # Ohne Klick (Initialaufruf) bleibt alles unverändert
+    if not isinstance(triggered, dict):
+        raise PreventUpdate
+    active_tf = triggered["index"]
     
-    # Erstelle die Klassen für jeden Button
-    classes = {}
-    for tf, button_id in timeframe_map.items():
-        if tf == active_tf:
-            classes[button_id] = "timeframe-button active"
-        else:
-            classes[button_id] = "timeframe-button"
-    
-    return [
-        active_tf,
-        classes["tf-1min"],
-        classes["tf-2min"],
-        classes["tf-3min"],
-        classes["tf-5m"],
-        classes["tf-15m"],
-        classes["tf-30m"],
-        classes["tf-1h"],
-        classes["tf-4h"]
+    return active_tf, [
+        "timeframe-button active" if id_obj["index"] == active_tf else "timeframe-button"
+        for id_obj in ids
     ]
 
 # Callback für das Abrufen von Daten
@@ -572,7 +871,9 @@ def fetch_data(n_clicks, symbol, timeframe, date_range):
     
     try:
         # Lade die Daten
-        df = load_stock_data(symbol, timeframe, date_range)
+        df = fetch_ohlc(symbol, timeframe, date_range)
+        if df is None:
+            return dash.no_update, f"Keine Daten für {symbol} gefunden", dash.no_update
         
         # Erstelle eine Info-Nachricht
         start_date = df.index.min().strftime('%d.%m.%Y')
@@ -580,9 +881,12 @@ def fetch_data(n_clicks, symbol, timeframe, date_range):
         days = (df.index.max() - df.index.min()).days
         info = f"{days} Tage ({start_date} - {end_date})"
         
+        # Reduziere die Daten vor dem Speichern auf die darstellbare Auflösung und float32
+        df = quantize_dataframe(m4_aggregate(df, width=CHART_POINTS))
+        
         # Bereite die Daten für das Speichern vor
         data = {
-            'df': df.to_json(date_format='iso', orient='split'),
+            'df': encode_dataframe(df),
             'symbol': symbol,
             'timeframe': timeframe,
             'date_range': date_range
@@ -597,7 +901,7 @@ def fetch_data(n_clicks, symbol, timeframe, date_range):
 # Callback für das Aktualisieren des Charts
 @app.callback(
     [Output("price-chart", "figure"),
-     Output("chart-indicators", "children")],
+     Output("active-indicators-store", "data")],
     [Input("stock-data-store", "data"),
      Input("toggle-sma", "n_clicks"),
      Input("toggle-bb", "n_clicks"),
@@ -608,10 +912,11 @@ def fetch_data(n_clicks, symbol, timeframe, date_range):
      State("toggle-bb", "className"),
      State("toggle-rsi", "className"),
      State("toggle-macd", "className"),
-     State("toggle-volume", "className")]
+     State("toggle-volume", "className"),
+     State("session-id-store", "data")]
 )
 def update_chart(data, n_sma, n_bb, n_rsi, n_macd, n_volume, 
-                cls_sma, cls_bb, cls_rsi, cls_macd, cls_volume):
+                cls_sma, cls_bb, cls_rsi, cls_macd, cls_volume, session_id):
     if data is None:
         # Erstelle ein leeres Chart
         fig = go.Figure()
@@ -623,10 +928,10 @@ def update_chart(data, n_sma, n_bb, n_rsi, n_macd, n_volume,
             margin=dict(l=0, r=0, t=0, b=0),
             showlegend=False,
         )
-        return fig, ""
+        return fig, []
     
     # Lade die Daten
-    df = pd.read_json(data['df'], orient='split')
+    df = decode_dataframe(data['df'])
     
     # Bestimme, welche Indikatoren angezeigt werden sollen
     show_sma = "active" in cls_sma if cls_sma else False
@@ -635,133 +940,274 @@ def update_chart(data, n_sma, n_bb, n_rsi, n_macd, n_volume,
     show_macd = "active" in cls_macd if cls_macd else False
     show_volume = "active" in cls_volume if cls_volume else True
     
-    # Erstelle das Chart
-    fig = create_price_chart(df, data['symbol'], show_sma, show_bb, show_volume)
+    # Indikatoren kommen aus dem LRU-Cache; wiederholtes Umschalten rechnet nichts neu
+    key = (data['symbol'], data['timeframe'], data['date_range'], df.index[-1].isoformat(), len(df))
+    
+    def indicator(name):
+        return _indicator(*key, name, INDICATOR_PARAMS[name])
+    
+    sma = indicator("sma") if show_sma else None
+    bb = indicator("bb") if show_bb else None
+    
+    # Overlays sind immer im Chart enthalten (Candlestick, SMA, 3x BB) und werden nur ein-/ausgeblendet
+    triggered = dash.callback_context.triggered_id
+    if triggered in ("toggle-sma", "toggle-bb"):
+        # Nur das umgeschaltete Overlay patchen, Kerzen und Zoom bleiben erhalten
+        traces, lines, show = (SMA_TRACES, sma, show_sma) if triggered == "toggle-sma" else (BB_TRACES, bb, show_bb)
+        fig = Patch()
+        for i, trace in enumerate(traces):
+            fig['data'][trace]['visible'] = show
+            if show:
+                fig['data'][trace]['y'] = lines[i]
+    elif triggered in ("toggle-rsi", "toggle-macd"):
+        # RSI und MACD erscheinen nur in den Badges, das Chart bleibt unverändert
+        fig = dash.no_update
+    else:
+        # Erstelle das Chart; ausgeblendete Overlays bleiben leer, bis sie aktiviert werden
+        empty = np.full(len(df), np.nan, dtype=np.float32)
+        sma_lines = sma or (empty,)
+        bb_lines = bb or (empty, empty, empty)
+        df = df.assign(sma_20=sma_lines[0], bb_upper=bb_lines[0], bb_middle=bb_lines[1], bb_lower=bb_lines[2])
+        fig = create_price_chart(df, data['symbol'], True, True, show_volume)
+        for i in SMA_TRACES:
+            fig.data[i].visible = show_sma
+        for i in BB_TRACES:
+            fig.data[i].visible = show_bb
+        
+        # Stabile uirevision, damit Plotly den WebGL-Kontext und den Zoom bei Updates beibehält
+        fig.update_layout(uirevision=data['symbol'])
+        
+        # Sende nur eine auf die Canvas-Breite reduzierte Punktmenge an den Browser
+        if RESAMPLER_AVAILABLE:
+            fig = FigureResampler(fig, default_n_shown_samples=2000)
+            if session_id:
+                _resampled_figures.pop(session_id, None)
+                _resampled_figures[session_id] = fig
+                while len(_resampled_figures) > _RESAMPLED_SESSIONS:
+                    _resampled_figures.pop(next(iter(_resampled_figures)), None)
     
-    # Füge Indikatoren hinzu
-    indicators_html = []
+    # Beschreibe die aktiven Indikatoren; die Badges rendert ein clientseitiger Callback
+    indicators = []
     
     if show_sma:
-        sma_values = f"SMA(20): {df['sma_20'].iloc[-1]:.2f}"
-        indicators_html.append(
-            dbc.Badge(sma_values, color="primary", className="me-1 mb-1")
-        )
+        indicators.append({"name": f"SMA(20): {sma[0][-1]:.2f}", "color": "primary"})
     
     if show_bb:
-        bb_values = f"BB(20,2): {df['bb_upper'].iloc[-1]:.2f} / {df['bb_middle'].iloc[-1]:.2f} / {df['bb_lower'].iloc[-1]:.2f}"
-        indicators_html.append(
-            dbc.Badge(bb_values, color="info", className="me-1 mb-1")
-        )
+        indicators.append({"name": f"BB(20,2): {bb[0][-1]:.2f} / {bb[1][-1]:.2f} / {bb[2][-1]:.2f}", "color": "info"})
     
     if show_rsi:
-        rsi_value = f"RSI(14): {df['rsi_14'].iloc[-1]:.2f}"
-        indicators_html.append(
-            dbc.Badge(rsi_value, color="warning", className="me-1 mb-1")
-        )
+        rsi = indicator("rsi")
+        indicators.append({"name": f"RSI(14): {rsi[0][-1]:.2f}", "color": "warning"})
     
     if show_macd:
-        macd_values = f"MACD(12,26,9): {df['macd'].iloc[-1]:.2f} / {df['macdsignal'].iloc[-1]:.2f}"
-        indicators_html.append(
-            dbc.Badge(macd_values, color="danger", className="me-1 mb-1")
-        )
+        macd = indicator("macd")
+        indicators.append({"name": f"MACD(12,26,9): {macd[0][-1]:.2f} / {macd[1][-1]:.2f}", "color": "danger"})
     
-    return fig, indicators_html
+    return fig, indicators
 
-# Callback für den Server-Status
+# Clientseitiger Callback für die Indikator-Badges
+app.clientside_callback(
+    """
+    function(items) {
+        return (items || []).map(function(item) {
+            return {
+                namespace: 'dash_html_components',
+                type: 'Span',
+                props: {children: item.name, className: 'badge bg-' + item.color + ' me-1 mb-1'}
+            };
+        });
+    }
+    """,
+    Output("chart-indicators", "children"),
+    Input("active-indicators-store", "data")
+)
+
+# Callback für das Ausführen des Backtests
 @app.callback(
-    Output("server-status", "children"),
-    Input("interval-component", "n_intervals")
+    Output("backtest-results-store", "data"),
+    [Input("run-backtest-button", "n_clicks")],
+    [State("stock-data-store", "data"),
+     State("strategy-dropdown", "value"),
+     State("capital-input", "value"),
+     State("commission-input", "value")],
+    background=background_callback_manager is not None,
+    running=[(Output("run-backtest-button", "disabled"), True, False)],
+    prevent_initial_call=True
 )
-def update_server_status(n):
-    return "Server"
+def run_backtest(n_clicks, data, strategy_name, capital, commission):
+    if data is None or strategy_name not in STRATEGIES:
+        return dash.no_update
+    
+    # Der Backtest läuft auf den vollständigen Daten, nicht auf der aggregierten Chart-Ansicht
+    df = fetch_ohlc(data['symbol'], data['timeframe'], data['date_range'])
+    if df is None:
+        return dash.no_update
+    
+    engine = BacktestEngine(initial_capital=float(capital or 5000), commission=float(commission or 0) / 100)
+    results = engine.run(df, STRATEGIES[strategy_name]())
+    metrics = results['metrics']
+    equity_curve = results['equity_curve']
+    
+    # Trade-Liste mit je einer Zeile für Ein- und Ausstieg, spaltenweise aufgebaut
+    trade_arrays = results['trade_arrays']
+    n_rows = 2 * len(trade_arrays['profit'])
+    columns = {
+        "date": np.empty(n_rows, dtype=object),
+        "type": np.tile(np.array(["BUY", "SELL"], dtype=object), n_rows // 2),
+        "price": np.empty(n_rows),
+        "quantity": np.repeat(trade_arrays['shares'], 2).round(4),
+        "pnl": np.full(n_rows, None, dtype=object),
+    }
+    columns["date"][0::2] = trade_arrays['entry_date'].strftime('%Y-%m-%d %H:%M')
+    columns["date"][1::2] = trade_arrays['exit_date'].strftime('%Y-%m-%d %H:%M')
+    columns["price"][0::2] = trade_arrays['entry_price']
+    columns["price"][1::2] = trade_arrays['exit_price']
+    columns["price"] = columns["price"].round(2)
+    columns["pnl"][1::2] = trade_arrays['profit'].round(2)
+    
+    # Erst an der Callback-Grenze in Zeilen-Dictionaries umwandeln
+    keys = list(columns)
+    trades = [dict(zip(keys, row)) for row in zip(*(columns[key].tolist() for key in keys))]
+    
+    profit_factor = float(metrics['profit_factor'])
+    
+    # Die Achse zeigt die Zeitstempel wie bisher in der Ortszeit der Daten
+    equity_index = equity_curve.index
+    if equity_index.tz is not None:
+        equity_index = equity_index.tz_localize(None)
+    
+    return {
+        'symbol': data['symbol'],
+        'strategy': strategy_name,
+        # Binär als Typed Arrays: Zeitstempel als Millisekunden (Ortszeit), Werte als float32
+        'equity': {
+            'x': encode_array(equity_index.as_unit('ms').asi8, 'f8'),
+            'y': encode_array(equity_curve.to_numpy(), 'f4'),
+        },
+        'metrics': {
+            'total_return': float(metrics['total_return']),
+            'win_rate': float(metrics['win_rate']),
+            'profit_factor': profit_factor if np.isfinite(profit_factor) else None,
+        },
+        'trades': trades,
+    }
 
-# Füge ein Interval-Komponente hinzu, um den Server-Status zu aktualisieren
-app.layout.children.append(dcc.Interval(
-    id='interval-component',
-    interval=30*1000,  # in Millisekunden
-    n_intervals=0
-))
+# Callback für das Einhängen der Ergebnis-Karten nach dem ersten Backtest
+@app.callback(
+    [Output("results-slot", "children"),
+     Output("trades-slot", "children")],
+    [Input("backtest-results-store", "data")],
+    [State("results-slot", "children")],
+    prevent_initial_call=True
+)
+def mount_result_cards(results, mounted):
+    if results is None or mounted:
+        return dash.no_update, dash.no_update
+    
+    return _build_results_card(colors_key), _build_trades_card(colors_key)
 
-# Definiere die Strategie-Karte
-strategy_card = dbc.Card(
-    [
-        dbc.CardHeader([
-            html.H4("Strategie-Einstellungen", className="card-title mb-0"),
-            html.Div([
-                DashIconify(icon="mdi:strategy", width=24, color=colors['primary']),
-            ], className="float-end")
-        ]),
-        dbc.CardBody([
-            dbc.Form([
-                dbc.Row([
-                    dbc.Col([
-                        dbc.Label("Strategie", html_for="strategy-dropdown", className="mb-1"),
-                        dbc.InputGroup([
-                            dbc.InputGroupText(DashIconify(icon="mdi:chart-timeline-variant", width=18)),
-                            dbc.Select(
-                                id="strategy-dropdown",
-                                options=[
-                                    {"label": "Moving Average Crossover", "value": "ma_crossover"},
-                                    {"label": "RSI Strategy", "value": "rsi_strategy"},
-                                    {"label": "MACD Strategy", "value": "macd_strategy"},
-                                    {"label": "Bollinger Bands Strategy", "value": "bb_strategy"},
-                                ],
-                                value="ma_crossover",
-                                className="border-start-0",
-                            ),
-                        ], className="mb-3"),
-                    ]),
-                ]),
+# Callback für die Anzeige der Backtest-Ergebnisse
+# Ohne prevent_initial_call, damit er beim Einhängen der Karten mit den vorhandenen Ergebnissen läuft
+@app.callback(
+    [Output("total-return", "children"),
+     Output("win-rate", "children"),
+     Output("profit-factor", "children"),
+     Output("equity-curve", "figure"),
+     Output("trades-table", TRADES_TABLE_PROP)],
+    [Input("backtest-results-store", "data")]
+)
+def update_backtest_results(results):
+    if results is None:
+        return dash.no_update, dash.no_update, dash.no_update, dash.no_update, dash.no_update
+    
+    metrics = results['metrics']
+    profit_factor = "∞" if metrics['profit_factor'] is None else f"{metrics['profit_factor']:.2f}"
+    
+    # Nur die Daten der bestehenden Equity-Linie ersetzen, nicht die ganze Figur
+    fig = Patch()
+    fig['data'][0]['x'] = results['equity']['x']
+    fig['data'][0]['y'] = results['equity']['y']
+    fig['layout']['uirevision'] = results['symbol']
+    
+    return (
+        f"{metrics['total_return']:.2%}",
+        f"{metrics['win_rate']:.2%}",
+        profit_factor,
+        fig,
+        results['trades'],
+    )
 
-                dbc.Row([
-                    dbc.Col([
-                        dbc.Label("Startkapital (€)", html_for="capital-input", className="mb-1"),
-                        dbc.InputGroup([
-                            dbc.InputGroupText("€"),
-                            dbc.Input(
-                                id="capital-input",
-                                type="number",
-                                value=5000,
-                                min=1000,
-                                step=1000,
-                            ),
-                        ], className="mb-3"),
-                    ], width=6),
-                    dbc.Col([
-                        dbc.Label("Kommission (%)", html_for="commission-input", className="mb-1"),
-                        dbc.InputGroup([
-                            dbc.InputGroupText("%"),
-                            dbc.Input(
-                                id="commission-input",
-                                type="number",
-                                value=0.1,
-                                min=0,
-                                max=5,
-                                step=0.1,
-                            ),
-                        ], className="mb-3"),
-                    ], width=6),
-                ]),
+# Vergibt jeder Browser-Sitzung einmalig eine zufällige Kennung für den Resampler-Cache
+app.clientside_callback(
+    """
+    function(id, sessionId) {
+        if (sessionId) {
+            return window.dash_clientside.no_update;
+        }
+        return window.crypto && crypto.randomUUID
+            ? crypto.randomUUID()
+            : Date.now().toString(36) + Math.random().toString(36).slice(2);
+    }
+    """,
+    Output("session-id-store", "data"),
+    Input("session-id-store", "id"),
+    State("session-id-store", "data")
+)
 
-                dbc.Row([
-                    dbc.Col([
-                        dbc.Button(
-                            [DashIconify(icon="mdi:play", width=18, className="me-2"), "Backtest durchführen"],
-                            id="run-backtest-button",
-                            color="success",
-                            className="w-100 mb-3",
-                        ),
-                    ]),
-                ]),
-            ]),
-        ]),
-    ],
-    className="mb-4 shadow",
-    style={"backgroundColor": colors['card_background']},
+# Callback für das Nachladen der Auflösung beim Zoomen (nur mit der Figur der eigenen Sitzung)
+if RESAMPLER_AVAILABLE:
+    @app.callback(
+        Output("price-chart", "figure", allow_duplicate=True),
+        Input("price-chart", "relayoutData"),
+        State("session-id-store", "data"),
+        prevent_initial_call=True
+    )
+    def resample_price_chart(relayout_data, session_id):
+        fig = _resampled_figures.get(session_id)
+        if fig is None or not relayout_data:
+            return dash.no_update
+        return fig.construct_update_data_patch(relayout_data)
+
+# Clientseitiger Callback für die Chart-Werkzeugleiste (Zoom und Fadenkreuz ohne Server-Roundtrip)
+app.clientside_callback(
+    """
+    function(nZoomIn, nZoomOut, nReset, nCrosshair) {
+        const button = dash_clientside.callback_context.triggered_id;
+        const gd = document.querySelector('#price-chart .js-plotly-plot');
+        if (!button || !gd || !gd._fullLayout) {
+            return dash_clientside.no_update;
+        }
+        const xaxis = gd._fullLayout.xaxis;
+
+        if (button === 'zoom-reset-button') {
+            Plotly.relayout(gd, {'xaxis.autorange': true, 'yaxis.autorange': true});
+        } else if (button === 'crosshair-button') {
+            const show = !xaxis.showspikes;
+            Plotly.relayout(gd, {
+                'xaxis.showspikes': show, 'xaxis.spikemode': 'across', 'xaxis.spikesnap': 'cursor',
+                'yaxis.showspikes': show, 'yaxis.spikemode': 'across', 'yaxis.spikesnap': 'cursor',
+                'hovermode': show ? 'x' : 'closest'
+            });
+        } else {
+            const range = xaxis.range.map(xaxis.r2l);
+            const step = (range[1] - range[0]) * 0.1 * (button === 'zoom-in-button' ? 1 : -1);
+            Plotly.relayout(gd, {'xaxis.range': [xaxis.l2r(range[0] + step), xaxis.l2r(range[1] - step)]});
+        }
+        return dash_clientside.no_update;
+    }
+    """,
+    Output("price-chart", "id"),
+    [Input("zoom-in-button", "n_clicks"),
+     Input("zoom-out-button", "n_clicks"),
+     Input("zoom-reset-button", "n_clicks"),
+     Input("crosshair-button", "n_clicks")],
+    prevent_initial_call=True
 )
 
 # Starte den Server
 if __name__ == "__main__":
     print("Manus API erfolgreich initialisiert")
+    if not PLOTLY_BUNDLE_AVAILABLE:
+        print("Hinweis: assets/plotly-custom.min.js fehlt, verwende das vollständige Plotly-Bundle (npm run build:plotly)")
     print("Starte Trading Dashboard auf http://localhost:8050")
     app.run(debug=True, host="0.0.0.0", port=8050)
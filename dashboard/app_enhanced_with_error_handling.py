@@ -1,14 +1,13 @@
 import os
 import sys
-import json
 import pandas as pd
 import numpy as np
 import logging
 from datetime import datetime, timedelta
-from io import StringIO
 
 import dash
 from dash import dcc, html, Input, Output, State, callback, dash_table, ALL, MATCH
+from dash.exceptions import PreventUpdate
 import dash_bootstrap_components as dbc
 from dash_bootstrap_templates import load_figure_template, ThemeChangerAIO
 from dash_iconify import DashIconify
@@ -31,7 +30,7 @@ from dashboard.components_module import load_nasdaq_symbols, create_asset_button
 
 # Importiere die Datenverarbeitungsfunktionen
 from data.data_loader_enhanced import load_stock_data, validate_symbol, get_alternative_symbols
-from dashboard.chart_utils import create_price_chart, create_volume_chart, create_indicator_chart
+from dashboard.store_utils import create_cache, make_chart_builder, make_payload_loader
 from dashboard.chart_callbacks import register_chart_callbacks
 from dashboard.error_handler import handle_error
 
@@ -45,6 +44,10 @@ app = dash.Dash(
     suppress_callback_exceptions=True
 )
 
+# Serverseitiger Cache für geladene Kursdaten (Redis, wenn konfiguriert, sonst Dateisystem)
+cache = create_cache(app.server, os.path.join(current_dir, ".cache", "data"))
+fetch_store_payload = make_payload_loader(load_stock_data, cache, timeout=300)
+
 # Setze den Titel der App
 app.title = "Trading Dashboard"
 
@@ -114,9 +117,7 @@ sidebar = dbc.Card(
     [
         dbc.CardHeader([
             html.H4("Dateneinstellungen", className="card-title mb-0"),
-            html.Div([
-                DashIconify(icon="mdi:database-cog", width=24, color=colors['primary']),
-            ], className="float-end")
+            DashIconify(icon="mdi:database-cog", width=24, color=colors['primary'], className="float-end")
         ]),
         dbc.CardBody([
             dbc.Form([
@@ -207,14 +208,12 @@ chart_card = dbc.Card(
     [
         dbc.CardHeader([
             html.H4(["Preischart ", html.Span(id="chart-symbol", className="text-primary")], className="card-title mb-0 d-inline"),
-            html.Div([
-                dbc.ButtonGroup([
-                    dbc.Button(id="toggle-sma", className="btn-sm", n_clicks=0),
-                    dbc.Button(id="toggle-bb", className="btn-sm", n_clicks=0),
-                    dbc.Button(id="toggle-rsi", className="btn-sm", n_clicks=0),
-                    dbc.Button(id="toggle-macd", className="btn-sm", n_clicks=0),
-                    dbc.Button(id="toggle-volume", className="btn-sm", n_clicks=0),
-                ], className="float-end"),
+            dbc.ButtonGroup([
+                dbc.Button(id="toggle-sma", className="btn-sm", n_clicks=0),
+                dbc.Button(id="toggle-bb", className="btn-sm", n_clicks=0),
+                dbc.Button(id="toggle-rsi", className="btn-sm", n_clicks=0),
+                dbc.Button(id="toggle-macd", className="btn-sm", n_clicks=0),
+                dbc.Button(id="toggle-volume", className="btn-sm", n_clicks=0),
             ], className="float-end"),
         ]),
         dbc.CardBody([
@@ -246,9 +245,7 @@ indicators_card = dbc.Card(
     [
         dbc.CardHeader([
             html.H4("Technische Indikatoren", className="card-title mb-0"),
-            html.Div([
-                DashIconify(icon="mdi:chart-bell-curve", width=24, color=colors['primary']),
-            ], className="float-end")
+            DashIconify(icon="mdi:chart-bell-curve", width=24, color=colors['primary'], className="float-end")
         ]),
         dbc.CardBody([
             dbc.Row([
@@ -306,9 +303,7 @@ trades_card = dbc.Card(
     [
         dbc.CardHeader([
             html.H4("Trades", className="card-title mb-0"),
-            html.Div([
-                DashIconify(icon="mdi:swap-horizontal", width=24, color=colors['primary']),
-            ], className="float-end")
+            DashIconify(icon="mdi:swap-horizontal", width=24, color=colors['primary'], className="float-end")
         ]),
         dbc.CardBody([
             html.Div(id="trades-table-container"),
@@ -433,48 +428,28 @@ app.layout = dbc.Container(
 # Callback für die Aktualisierung des aktiven Zeitrahmens
 @app.callback(
     Output("active-timeframe-store", "data"),
-    [Input({"type": "timeframe-button", "index": ALL}, "n_clicks")],
-    [State({"type": "timeframe-button", "index": ALL}, "id"),
-     State("active-timeframe-store", "data")]
+    [Input({"type": "timeframe-button", "index": ALL}, "n_clicks")]
 )
-def update_active_timeframe(n_clicks, ids, current_timeframe):
-    ctx = dash.callback_context
-    if not ctx.triggered:
-        return current_timeframe
-    
-    button_id = ctx.triggered[0]["prop_id"].split(".")[0]
-    if not button_id:
-        return current_timeframe
+def update_active_timeframe(n_clicks):
+    # triggered_id enthält die von Dash bereits geparste ID des geklickten Buttons
+    button_id = dash.callback_context.triggered_id
+    if not isinstance(button_id, dict):
+        raise PreventUpdate
     
-    try:
-        button_id_dict = json.loads(button_id)
-        timeframe = button_id_dict["index"]
-        return timeframe
-    except:
-        return current_timeframe
+    return button_id["index"]
 
 # Callback für die Aktualisierung des Symbols durch Klicken auf Asset-Buttons
 @app.callback(
     Output("symbol-input", "value"),
-    [Input({"type": "asset-button", "index": ALL}, "n_clicks")],
-    [State({"type": "asset-button", "index": ALL}, "id"),
-     State("symbol-input", "value")]
+    [Input({"type": "asset-button", "index": ALL}, "n_clicks")]
 )
-def update_symbol_from_button(n_clicks, ids, current_symbol):
-    ctx = dash.callback_context
-    if not ctx.triggered:
-        return current_symbol
-    
-    button_id = ctx.triggered[0]["prop_id"].split(".")[0]
-    if not button_id:
-        return current_symbol
+def update_symbol_from_button(n_clicks):
+    # triggered_id enthält die von Dash bereits geparste ID des geklickten Buttons
+    button_id = dash.callback_context.triggered_id
+    if not isinstance(button_id, dict):
+        raise PreventUpdate
     
-    try:
-        button_id_dict = json.loads(button_id)
-        symbol = button_id_dict["index"]
-        return symbol
-    except:
-        return current_symbol
+    return button_id["index"]
 
 # Callback für das Abrufen der Daten
 @app.callback(
@@ -518,25 +493,22 @@ def fetch_data(n_clicks, symbol, timeframe, date_range):
             return dash.no_update, error_msg, dash.no_update, error_msg, "text-center small mt-2 text-danger", True, error_msg, False, ""
         
         # Lade die Daten mit verbesserter Fehlerbehandlung
-        df, status_message = load_stock_data(symbol, timeframe, date_range)
+        payload = fetch_store_payload(symbol, timeframe, date_range)
         
         # Überprüfe, ob Daten zurückgegeben wurden
-        if df.empty:
+        if payload is None:
             error_msg = f"Keine Daten für {symbol} gefunden. Bitte überprüfen Sie das Symbol oder versuchen Sie es später erneut."
             return dash.no_update, error_msg, dash.no_update, error_msg, "text-center small mt-2 text-danger", True, error_msg, False, ""
         
-        # Erstelle eine Info-Nachricht
-        start_date = df.index.min().strftime('%d.%m.%Y')
-        end_date = df.index.max().strftime('%d.%m.%Y')
-        days = (df.index.max() - df.index.min()).days
-        info = f"{days} Tage ({start_date} - {end_date})"
+        _, info, status_message, version = payload
         
-        # Bereite die Daten für das Speichern vor
+        # Im Store liegt nur der Schlüssel, damit nicht jeder Toggle-Klick die kodierten
+        # Daten erneut zum Server schickt; update_chart holt sie aus dem Cache
         data = {
-            'df': df.to_json(date_format='iso', orient='split'),
             'symbol': symbol,
             'timeframe': timeframe,
-            'date_range': date_range
+            'date_range': date_range,
+            'version': version
         }
         
         # Zeige ein Info-Toast, wenn Fallback-Symbole verwendet wurden
@@ -592,6 +564,10 @@ def update_chart_controls(n_sma, n_bb, n_rsi, n_macd, n_volume):
     
     return sma_content, sma_color, bb_content, bb_color, rsi_content, rsi_color, macd_content, macd_color, volume_content, volume_color
 
+# Die fertigen Figuren werden je Datensatz, Datenversion und Toggle-Kombination gecacht,
+# so lange wie die Kursdaten selbst; ein erneuter Toggle-Klick baut nichts neu
+build_charts = make_chart_builder(fetch_store_payload, colors['card_background'], cache, timeout=300)
+
 # Callback für die Aktualisierung der Charts
 @app.callback(
     [Output("price-chart", "figure"),
@@ -622,17 +598,19 @@ def update_chart(data, n_sma, n_bb, n_rsi, n_macd, n_volume):
         return empty_price_chart, empty_price_chart, empty_price_chart, empty_price_chart
     
     try:
-        # Lade die Daten aus dem Store
-        df = pd.read_json(StringIO(data['df']), orient='split')
-        symbol = data['symbol']
+        # Bestimme die aktiven Indikatoren
+        show_sma = n_sma % 2 == 1 if n_sma else False
+        show_bb = n_bb % 2 == 1 if n_bb else False
+        show_rsi = n_rsi % 2 == 1 if n_rsi else True
+        show_macd = n_macd % 2 == 1 if n_macd else True
+        show_volume = n_volume % 2 == 1 if n_volume else True
         
-        # Setze den Index als DatetimeIndex
-        if not isinstance(df.index, pd.DatetimeIndex):
-            df.index = pd.to_datetime(df.index)
+        charts = build_charts(data['symbol'], data['timeframe'], data['date_range'], data.get('version'),
+                              show_sma, show_bb, show_rsi, show_macd, show_volume)
         
-        # Überprüfe, ob der DataFrame leer ist
-        if df.empty:
-            logger.warning(f"Leerer DataFrame für Symbol {symbol}")
+        # Überprüfe, ob Daten vorhanden waren
+        if charts is None:
+            logger.warning(f"Leerer DataFrame für Symbol {data['symbol']}")
             # Erstelle leere Charts
             empty_price_chart = go.Figure()
             empty_price_chart.update_layout(
@@ -646,42 +624,7 @@ def update_chart(data, n_sma, n_bb, n_rsi, n_macd, n_volume):
             
             return empty_price_chart, empty_price_chart, empty_price_chart, empty_price_chart
         
-        # Überprüfe, ob NaN-Werte vorhanden sind
-        if df.isna().any().any():
-            logger.warning(f"{df.isna().sum().sum()} NaN-Werte gefunden, werden gefüllt...")
-            df = df.fillna(method='ffill').fillna(method='bfill').fillna(0)
-        
-        # Bestimme die aktiven Indikatoren
-        show_sma = n_sma % 2 == 1 if n_sma else False
-        show_bb = n_bb % 2 == 1 if n_bb else False
-        show_rsi = n_rsi % 2 == 1 if n_rsi else True
-        show_macd = n_macd % 2 == 1 if n_macd else True
-        show_volume = n_volume % 2 == 1 if n_volume else True
-        
-        # Erstelle die Charts
-        price_chart = create_price_chart(df, symbol, show_sma=show_sma, show_bb=show_bb, show_volume=show_volume)
-        rsi_chart = create_indicator_chart(df, 'rsi') if show_rsi else go.Figure()
-        macd_chart = create_indicator_chart(df, 'macd') if show_macd else go.Figure()
-        volume_chart = create_volume_chart(df) if show_volume else go.Figure()
-        
-        # Aktualisiere die Layouts
-        for chart in [rsi_chart, macd_chart, volume_chart]:
-            chart.update_layout(
-                template="plotly_dark",
-                paper_bgcolor=colors['card_background'],
-                plot_bgcolor=colors['card_background'],
-                margin=dict(l=0, r=0, t=30, b=0),
-                height=200,
-            )
-        
-        price_chart.update_layout(
-            template="plotly_dark",
-            paper_bgcolor=colors['card_background'],
-            plot_bgcolor=colors['card_background'],
-            margin=dict(l=0, r=0, t=0, b=0),
-        )
-        
-        return price_chart, rsi_chart, macd_chart, volume_chart
+        return charts
     
     except Exception as e:
         logger.error(f"Fehler beim Aktualisieren der Charts: {str(e)}")
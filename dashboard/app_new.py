@@ -7,11 +7,12 @@ import sys
 import json
 import pandas as pd
 import numpy as np
-from datetime import datetime, timedelta
+from functools import lru_cache
 from io import StringIO
 
 import dash
-from dash import html, dcc, callback, Input, Output, State, dash_table
+from dash import html, dcc, callback, Input, Output, State, Patch, dash_table
+from dash.dash_table.Format import Format, Scheme, Sign, Symbol
 import dash_bootstrap_components as dbc
 from dash_bootstrap_templates import load_figure_template, ThemeChangerAIO
 from dash.exceptions import PreventUpdate
@@ -31,6 +32,8 @@ from dashboard.components import (
     create_settings_content,
     colors
 )
+from dashboard.chart_utils import m4_aggregate
+from dashboard.store_utils import create_cache, memoize
 
 # Lade das dunkle Template für Plotly
 load_figure_template("darkly")
@@ -48,6 +51,25 @@ app = dash.Dash(
 # Setze den Titel der App
 app.title = "Trading Dashboard Pro"
 
+# Serverseitiger Cache für die Kursdaten (Redis, wenn konfiguriert, sonst Dateisystem)
+cache = create_cache(app.server, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache", "data"))
+
+# Höchstzahl der Kerzen, die pro Trace an den Browser gesendet werden
+CHART_POINTS = 2000
+
+# Zeitrahmen-Button -> (Kerzenintervall, Tage bis heute); unbekannte Werte fallen auf 1d zurück
+_TIMEFRAMES = {
+    "1h": ("1h", 7),
+    "1d": ("1d", 180),
+    "1w": ("1wk", 365 * 2),
+}
+
+# pandas-Frequenz je Kerzenintervall
+_INTERVAL_FREQ = {"1h": "h", "1d": "D", "1wk": "W"}
+
+# Startpreise der Beispieldaten; andere Symbole beginnen bei 100
+_BASE_PRICES = {"AAPL": 180, "MSFT": 350, "GOOGL": 140, "AMZN": 170, "TSLA": 200}
+
 # Chart-Stil-Konfiguration
 chart_style = {
     'layout': {
@@ -80,6 +102,27 @@ chart_style = {
     }
 }
 
+# Statischer Teil des Preischart-Layouts, einmalig aus chart_style abgeleitet;
+# Preis- und Zeitachse ersetzen die allgemeinen Achsen-Vorgaben
+_PRICE_CHART_LAYOUT = {
+    **chart_style['layout'],
+    'yaxis': dict(
+        title="Preis",
+        side="right",
+        showgrid=True,
+        gridcolor=colors['grid'],
+        zeroline=False,
+    ),
+    'xaxis': dict(
+        rangeslider=dict(visible=False),
+        type="date",
+        showgrid=True,
+        gridcolor=colors['grid'],
+        zeroline=False,
+    ),
+    'dragmode': "pan",  # Ermöglicht Verschieben per Drag
+}
+
 # Erstelle die Komponenten
 header = create_header()
 strategy_sidebar = create_strategy_sidebar()
@@ -138,6 +181,7 @@ app.layout = html.Div(
         dcc.Store(id="stock-data-store"),
         dcc.Store(id="backtest-results-store"),
         dcc.Store(id="active-timeframe-store", data="1d"),  # Standardmäßig 1 Tag
+        dcc.Store(id="chart-type-store", data="candlestick"),  # Gewählter Chart-Typ
         dcc.Store(id="active-tab-store", data="strategien"),  # Speichert den aktiven Tab
 
         # URL-Routing
@@ -163,6 +207,14 @@ app.layout = html.Div(
     },
 )
 
+# Seiteninhalt und Tab-Status je URL; unbekannte URLs zeigen die Strategien
+_ROUTES = {
+    "/": (strategien_content, True, False, False, "strategien"),
+    "/strategien": (strategien_content, True, False, False, "strategien"),
+    "/backtesting": (backtesting_content_div, False, True, False, "backtesting"),
+    "/einstellung": (settings_content_div, False, False, True, "einstellung"),
+}
+
 # Callback für URL-Routing und Tab-Navigation
 @callback(
     Output("page-content", "children"),
@@ -171,57 +223,50 @@ app.layout = html.Div(
     Output("tab-einstellung", "active"),
     Output("active-tab-store", "data"),
     Input("url", "pathname"),
-    State("active-tab-store", "data"),
 )
-def display_page(pathname, active_tab):
+def display_page(pathname):
     """
     Zeigt den entsprechenden Inhalt basierend auf der URL an und aktualisiert die aktiven Tab-Status.
     """
-    if pathname == "/" or pathname == "/strategien":
-        return strategien_content, True, False, False, "strategien"
-    elif pathname == "/backtesting":
-        return backtesting_content_div, False, True, False, "backtesting"
-    elif pathname == "/einstellung":
-        return settings_content_div, False, False, True, "einstellung"
-    else:
-        # Fallback für unbekannte URLs
-        return strategien_content, True, False, False, "strategien"
+    return _ROUTES.get(pathname, _ROUTES["/"])
 
-# Callback für Chart-Typ-Buttons
-@callback(
+# Clientseitige Callbacks für Chart-Typ- und Zeitrahmen-Buttons (ohne Server-Roundtrip)
+# Beide laufen beim Einhängen der Seite, damit Buttons und Stores übereinstimmen; der Chart-Typ
+# übernimmt dabei den Wert aus chart-type-store und schreibt den Store nur bei einem Klick
+app.clientside_callback(
+    """
+    function(lineClicks, candlestickClicks, ohlcClicks, chartType) {
+        const buttons = {'line-chart-button': 'line', 'candlestick-chart-button': 'candlestick', 'ohlc-chart-button': 'ohlc'};
+        const clicked = window.dash_clientside.callback_context.triggered_id;
+        const active = clicked ? buttons[clicked] : chartType;
+        return Object.keys(buttons).flatMap(
+            b => (buttons[b] === active ? ['primary', false] : ['secondary', true])
+        ).concat([clicked ? active : window.dash_clientside.no_update]);
+    }
+    """,
     Output("line-chart-button", "color"),
     Output("line-chart-button", "outline"),
     Output("candlestick-chart-button", "color"),
     Output("candlestick-chart-button", "outline"),
     Output("ohlc-chart-button", "color"),
     Output("ohlc-chart-button", "outline"),
+    Output("chart-type-store", "data"),
     Input("line-chart-button", "n_clicks"),
     Input("candlestick-chart-button", "n_clicks"),
     Input("ohlc-chart-button", "n_clicks"),
+    State("chart-type-store", "data"),
 )
-def update_chart_type_buttons(line_clicks, candlestick_clicks, ohlc_clicks):
-    """
-    Aktualisiert die Farben der Chart-Typ-Buttons basierend auf dem ausgewählten Typ.
-    """
-    ctx = dash.callback_context
-    if not ctx.triggered:
-        # Standardmäßig ist Candlestick ausgewählt
-        return "secondary", True, "primary", False, "secondary", True
-    
-    button_id = ctx.triggered[0]["prop_id"].split(".")[0]
-    
-    if button_id == "line-chart-button":
-        return "primary", False, "secondary", True, "secondary", True
-    elif button_id == "candlestick-chart-button":
-        return "secondary", True, "primary", False, "secondary", True
-    elif button_id == "ohlc-chart-button":
-        return "secondary", True, "secondary", True, "primary", False
-    
-    # Fallback
-    return "secondary", True, "primary", False, "secondary", True
 
-# Callback für Zeitrahmen-Buttons
-@callback(
+app.clientside_callback(
+    """
+    function(h1Clicks, d1Clicks, w1Clicks) {
+        const buttons = {'timeframe-1h-button': '1h', 'timeframe-1d-button': '1d', 'timeframe-1w-button': '1w'};
+        const active = window.dash_clientside.callback_context.triggered_id || 'timeframe-1d-button';
+        return Object.keys(buttons).flatMap(
+            b => (b === active ? ['primary', false] : ['secondary', true])
+        ).concat([buttons[active]]);
+    }
+    """,
     Output("timeframe-1h-button", "color"),
     Output("timeframe-1h-button", "outline"),
     Output("timeframe-1d-button", "color"),
@@ -232,39 +277,105 @@ def update_chart_type_buttons(line_clicks, candlestick_clicks, ohlc_clicks):
     Input("timeframe-1h-button", "n_clicks"),
     Input("timeframe-1d-button", "n_clicks"),
     Input("timeframe-1w-button", "n_clicks"),
-    State("active-timeframe-store", "data"),
 )
-def update_timeframe_buttons(h1_clicks, d1_clicks, w1_clicks, active_timeframe):
+
+def generate_ohlc(symbol, interval, days_back, end_date):
     """
-    Aktualisiert die Farben der Zeitrahmen-Buttons basierend auf dem ausgewählten Zeitrahmen.
+    Generiert Beispiel-Kursdaten für den Preischart
+    
+    In einer realen Anwendung würden hier Daten von einer API abgerufen werden.
+    
+    Args:
+        symbol (str): Das Aktiensymbol
+        interval (str): Kerzenintervall ('1h', '1d' oder '1wk')
+        days_back (int): Anzahl der Tage bis end_date
+        end_date (pd.Timestamp): Auf die Kerzengrenze abgerundetes Ende (Teil des Cache-Schlüssels)
+        
+    Returns:
+        pd.DataFrame: OHLCV-Daten mit Spalte 'date'
     """
-    ctx = dash.callback_context
-    if not ctx.triggered:
-        # Standardmäßig ist 1D ausgewählt
-        return "secondary", True, "primary", False, "secondary", True, "1d"
+    start_date = end_date - pd.Timedelta(days=days_back)
+    
+    # Generiere Beispieldaten
+    rng = np.random.default_rng(42)  # Für reproduzierbare Ergebnisse
+    date_range = pd.date_range(start=start_date, end=end_date, freq=_INTERVAL_FREQ[interval])
+    n = len(date_range)
     
-    button_id = ctx.triggered[0]["prop_id"].split(".")[0]
+    # Startpreis
+    base_price = _BASE_PRICES.get(symbol, 100)
+    
+    # Generiere OHLC-Daten: Zufällige Preisbewegung mit Trend, alle Kerzen auf einmal
+    volatility = 0.02
+    close = base_price * np.cumprod(1 + rng.normal(0.0003, volatility, n))
+    open_ = close * (1 + rng.normal(0, 0.003, n))
+    high_low_range = close * volatility * 2
+    high = np.maximum(open_, close) + np.abs(rng.normal(0, high_low_range / 2))
+    low = np.minimum(open_, close) - np.abs(rng.normal(0, high_low_range / 2))
     
-    if button_id == "timeframe-1h-button":
-        return "primary", False, "secondary", True, "secondary", True, "1h"
-    elif button_id == "timeframe-1d-button":
-        return "secondary", True, "primary", False, "secondary", True, "1d"
-    elif button_id == "timeframe-1w-button":
-        return "secondary", True, "secondary", True, "primary", False, "1w"
+    return pd.DataFrame({
+        'date': date_range,
+        'open': open_,
+        'high': high,
+        'low': low,
+        'close': close,
+        'volume': rng.integers(1000000, 10000000, n),
+    })
+
+# Mit jeder neuen Kerze ändert sich end_date und damit der Cache-Schlüssel
+generate_ohlc = memoize(cache, timeout=300, maxsize=16)(generate_ohlc)
+
+def _price_trace(df, chart_type, symbol):
+    """
+    Erstellt den Preis-Trace für den gewählten Chart-Typ
     
-    # Fallback
-    return "secondary", True, "primary", False, "secondary", True, active_timeframe
+    Args:
+        df (pd.DataFrame): OHLCV-Daten mit Spalte 'date'
+        chart_type (str): 'line', 'candlestick' oder 'ohlc'
+        symbol (str): Das Aktiensymbol (Trace-Name)
+        
+    Returns:
+        go.Scattergl | go.Candlestick | go.Ohlc: Der Preis-Trace
+    """
+    if chart_type == "line":
+        # WebGL-Linie, damit lange Zeitreihen keine SVG-Knoten im DOM erzeugen
+        return go.Scattergl(
+            x=df['date'],
+            y=df['close'],
+            mode='lines',
+            name=symbol,
+            line=dict(color=colors['primary'], width=2),
+        )
+    elif chart_type == "candlestick":
+        return go.Candlestick(
+            x=df['date'],
+            open=df['open'],
+            high=df['high'],
+            low=df['low'],
+            close=df['close'],
+            name=symbol,
+            increasing_line_color=colors['success'],
+            decreasing_line_color=colors['danger'],
+        )
+    elif chart_type == "ohlc":
+        return go.Ohlc(
+            x=df['date'],
+            open=df['open'],
+            high=df['high'],
+            low=df['low'],
+            close=df['close'],
+            name=symbol,
+            increasing_line_color=colors['success'],
+            decreasing_line_color=colors['danger'],
+        )
 
 # Callback für Preischart
 @callback(
     Output("price-chart", "figure"),
     Input("asset-select", "value"),
-    Input("line-chart-button", "color"),
-    Input("candlestick-chart-button", "color"),
-    Input("ohlc-chart-button", "color"),
+    Input("chart-type-store", "data"),
     Input("active-timeframe-store", "data"),
 )
-def update_price_chart(symbol, line_color, candlestick_color, ohlc_color, timeframe):
+def update_price_chart(symbol, chart_type, timeframe):
     """
     Aktualisiert den Preischart basierend auf dem ausgewählten Symbol, Chart-Typ und Zeitrahmen.
     """
@@ -281,198 +392,78 @@ def update_price_chart(symbol, line_color, candlestick_color, ohlc_color, timefr
         )
         return fig
     
-    # Bestimme den Chart-Typ basierend auf den Button-Farben
-    chart_type = "candlestick"  # Standard
-    if line_color == "primary":
-        chart_type = "line"
-    elif candlestick_color == "primary":
-        chart_type = "candlestick"
-    elif ohlc_color == "primary":
-        chart_type = "ohlc"
-    
     # Bestimme den Zeitrahmen
-    if timeframe == "1h":
-        interval = "1h"
-        days_back = 7
-    elif timeframe == "1d":
-        interval = "1d"
-        days_back = 180
-    elif timeframe == "1w":
-        interval = "1wk"
-        days_back = 365 * 2
-    else:
-        interval = "1d"
-        days_back = 180
+    interval, days_back = _TIMEFRAMES.get(timeframe, _TIMEFRAMES["1d"])
     
-    # Generiere Beispieldaten für den Chart
-    # In einer realen Anwendung würden hier Daten von einer API abgerufen werden
-    end_date = datetime.now()
-    start_date = end_date - timedelta(days=days_back)
+    # Ende auf die Kerzengrenze abrunden (Wochenkerzen verankert date_range selbst), damit
+    # die Reihe innerhalb einer Periode identisch bleibt und eine neue Kerze neu erzeugt wird
+    end_date = pd.Timestamp.now().floor("h" if interval == "1h" else "D")
+    df = generate_ohlc(symbol, interval, days_back, end_date)
     
-    # Generiere Datenpunkte basierend auf dem Zeitrahmen
-    if interval == "1h":
-        periods = days_back * 24
-        freq = "H"
-    elif interval == "1d":
-        periods = days_back
-        freq = "D"
-    elif interval == "1wk":
-        periods = days_back // 7
-        freq = "W"
-    
-    # Generiere Beispieldaten
-    np.random.seed(42)  # Für reproduzierbare Ergebnisse
-    date_range = pd.date_range(start=start_date, end=end_date, freq=freq)
-    
-    # Startpreis
-    if symbol == "AAPL":
-        base_price = 180
-    elif symbol == "MSFT":
-        base_price = 350
-    elif symbol == "GOOGL":
-        base_price = 140
-    elif symbol == "AMZN":
-        base_price = 170
-    elif symbol == "TSLA":
-        base_price = 200
-    else:
-        base_price = 100
-    
-    # Generiere OHLC-Daten
-    volatility = 0.02
-    price_data = []
-    current_price = base_price
-    
-    for i in range(len(date_range)):
-        # Zufällige Preisbewegung mit Trend
-        daily_return = np.random.normal(0.0003, volatility)
-        current_price *= (1 + daily_return)
-        
-        # Generiere OHLC-Daten
-        high_low_range = current_price * volatility * 2
-        open_price = current_price * (1 + np.random.normal(0, 0.003))
-        close_price = current_price
-        high_price = max(open_price, close_price) + abs(np.random.normal(0, high_low_range/2))
-        low_price = min(open_price, close_price) - abs(np.random.normal(0, high_low_range/2))
-        
-        price_data.append({
-            'date': date_range[i],
-            'open': open_price,
-            'high': high_price,
-            'low': low_price,
-            'close': close_price,
-            'volume': np.random.randint(1000000, 10000000)
-        })
-    
-    df = pd.DataFrame(price_data)
+    # Lange Zeitreihen per M4 auf CHART_POINTS Kerzen reduzieren; das Chart bleibt optisch gleich
+    if len(df) > CHART_POINTS:
+        df = (
+            m4_aggregate(df.set_index('date').rename(columns=str.capitalize), width=CHART_POINTS)
+            .rename(columns=str.lower)
+            .rename_axis('date')
+            .reset_index()
+        )
     
-    # Erstelle den Chart basierend auf dem ausgewählten Typ
-    fig = go.Figure()
+    # Erstelle den Preis-Trace basierend auf dem ausgewählten Typ
+    price_trace = _price_trace(df, chart_type, symbol)
     
-    if chart_type == "line":
-        fig.add_trace(
-            go.Scatter(
-                x=df['date'],
-                y=df['close'],
-                mode='lines',
-                name=symbol,
-                line=dict(color=colors['primary'], width=2),
-            )
-        )
-    elif chart_type == "candlestick":
-        fig.add_trace(
-            go.Candlestick(
-                x=df['date'],
-                open=df['open'],
-                high=df['high'],
-                low=df['low'],
-                close=df['close'],
-                name=symbol,
-                increasing_line_color=colors['success'],
-                decreasing_line_color=colors['danger'],
-            )
-        )
-    elif chart_type == "ohlc":
-        fig.add_trace(
-            go.Ohlc(
-                x=df['date'],
-                open=df['open'],
-                high=df['high'],
-                low=df['low'],
-                close=df['close'],
-                name=symbol,
-                increasing_line_color=colors['success'],
-                decreasing_line_color=colors['danger'],
-            )
-        )
+    # Beim Wechsel des Chart-Typs ändert sich nur der Preis-Trace; Volumen und Layout
+    # bleiben im Browser und werden nicht erneut übertragen
+    if set(dash.callback_context.triggered_prop_ids.values()) == {"chart-type-store"}:
+        fig = Patch()
+        fig['data'][0] = price_trace.to_plotly_json()
+        return fig
     
-    # Füge Volumen als Subplot hinzu
-    fig.add_trace(
-        go.Bar(
-            x=df['date'],
-            y=df['volume'],
-            name='Volume',
-            marker=dict(color=colors['secondary'], opacity=0.3),
-            yaxis="y2",
-            showlegend=False,
-        )
+    # Volumen als Subplot; Figure und Layout werden in einem Schritt aufgebaut und validiert,
+    # nur Titel und Volumenachse hängen von den Daten ab
+    volume_trace = go.Bar(
+        x=df['date'],
+        y=df['volume'],
+        name='Volume',
+        marker=dict(color=colors['secondary'], opacity=0.3),
+        yaxis="y2",
+        showlegend=False,
     )
     
-    # Layout-Anpassungen
-    layout_params = chart_style['layout'].copy()  # Kopiere das Style-Dictionary
-    if 'legend' in layout_params:
-        # Entferne das legend dictionary aus den layout_params
-        layout_params.pop('legend')
-    
-    fig.update_layout(
-        **layout_params,
-        title=f"{symbol} - {timeframe}",
-        yaxis=dict(
-            title="Preis",
-            side="right",
-            showgrid=True,
-            gridcolor=colors['grid'],
-            zeroline=False,
-        ),
-        yaxis2=dict(
-            title="Volumen",
-            side="right",
-            showgrid=False,
-            zeroline=False,
-            overlaying="y",
-            anchor="x",
-            visible=False,
-            range=[0, df['volume'].max() * 5],
-            domain=[0, 0.2],
-        ),
-        xaxis=dict(
-            rangeslider=dict(visible=False),
-            type="date",
-            showgrid=True,
-            gridcolor=colors['grid'],
-            zeroline=False,
-        ),
-        dragmode="pan",  # Ermöglicht Verschieben per Drag
-        legend=dict(
-            orientation="h",
-            yanchor="bottom",
-            y=1.02,
-            xanchor="right",
-            x=1,
-            font=dict(color=colors['text']),
+    fig = go.Figure(
+        data=[price_trace, volume_trace],
+        layout=dict(
+            **_PRICE_CHART_LAYOUT,
+            title=f"{symbol} - {timeframe}",
+            # Zoom und Pan bleiben erhalten, solange Symbol und Zeitrahmen gleich sind
+            uirevision=f"{symbol}-{timeframe}",
+            yaxis2=dict(
+                title="Volumen",
+                side="right",
+                showgrid=False,
+                zeroline=False,
+                overlaying="y",
+                anchor="x",
+                visible=False,
+                range=[0, df['volume'].max() * 5],
+                domain=[0, 0.2],
+            ),
         ),
     )
     
     return fig
 
-# Callback für Strategie-Parameter
-@callback(
-    Output("strategy-params", "children"),
-    Input("strategy-select", "value"),
-)
-def update_strategy_params(strategy):
+# Die Parameter-Felder hängen nur von der Strategie ab und werden je Strategie einmal erstellt
+@lru_cache(maxsize=8)
+def _strategy_params(strategy):
     """
-    Aktualisiert die Strategie-Parameter basierend auf der ausgewählten Strategie.
+    Erstellt die Eingabefelder für die Parameter einer Strategie
+    
+    Args:
+        strategy (str): Wert aus dem Strategie-Dropdown
+        
+    Returns:
+        html.Div: Parameter-Felder der Strategie
     """
     if strategy == "ma_crossover":
         return html.Div(
@@ -588,6 +579,80 @@ def update_strategy_params(strategy):
     else:
         return html.Div("Keine Parameter verfügbar")
 
+# Callback für Strategie-Parameter
+@callback(
+    Output("strategy-params", "children"),
+    Input("strategy-select", "value"),
+)
+def update_strategy_params(strategy):
+    """
+    Aktualisiert die Strategie-Parameter basierend auf der ausgewählten Strategie.
+    """
+    return _strategy_params(strategy)
+
+# Spalten und Stile der Trades-Tabelle; einmalig statt bei jedem Klick aufgebaut.
+# Preis und Gewinn/Verlust kommen als Zahlen und werden erst im Browser als Euro formatiert
+_EURO = Format(precision=2, scheme=Scheme.fixed, symbol=Symbol.yes, symbol_suffix=" €")
+_EURO_SIGNED = Format(precision=2, scheme=Scheme.fixed, symbol=Symbol.yes, symbol_suffix=" €", sign=Sign.positive)
+_TRADES_COLUMNS = [
+    {"name": "Datum", "id": "date"},
+    {"name": "Typ", "id": "type"},
+    {"name": "Preis", "id": "price", "type": "numeric", "format": _EURO},
+    {"name": "Menge", "id": "quantity"},
+    {"name": "Gewinn/Verlust", "id": "pnl", "type": "numeric", "format": _EURO_SIGNED},
+]
+_TRADES_STYLE_HEADER = {
+    "backgroundColor": colors['card'],
+    "color": colors['text'],
+    "fontWeight": "bold",
+    "border": f"1px solid {colors['grid']}",
+}
+_TRADES_STYLE_CELL = {
+    "backgroundColor": colors['background'],
+    "color": colors['text'],
+    "border": f"1px solid {colors['grid']}",
+    "padding": "10px",
+    "textAlign": "left",
+}
+_TRADES_STYLE_CONDITIONAL = [
+    {
+        "if": {"filter_query": "{type} = 'Kauf'"},
+        "backgroundColor": "rgba(16, 185, 129, 0.1)",
+    },
+    {
+        "if": {"filter_query": "{type} = 'Verkauf'"},
+        "backgroundColor": "rgba(239, 68, 68, 0.1)",
+    },
+    {
+        "if": {"filter_query": "{pnl} > 0"},
+        "color": colors['success'],
+    },
+    {
+        "if": {"filter_query": "{pnl} < 0"},
+        "color": colors['danger'],
+    },
+]
+
+def _trades_table(trades):
+    """
+    Erstellt die Trades-Tabelle mit den gemeinsamen Spalten und Stilen
+    
+    Args:
+        trades (list): Zeilen der Tabelle
+        
+    Returns:
+        dash_table.DataTable: Tabelle für den trades-table-container
+    """
+    return dash_table.DataTable(
+        id="trades-table",
+        columns=_TRADES_COLUMNS,
+        data=trades,
+        style_header=_TRADES_STYLE_HEADER,
+        style_cell=_TRADES_STYLE_CELL,
+        style_data_conditional=_TRADES_STYLE_CONDITIONAL,
+        page_size=5,
+    )
+
 # Callback für Trades-Tabelle
 @callback(
     Output("trades-table-container", "children"),
@@ -599,130 +664,29 @@ def update_trades_table(n_clicks):
     """
     if n_clicks is None:
         # Zeige eine leere Tabelle, wenn noch keine Strategie ausgeführt wurde
-        return dash_table.DataTable(
-            id="trades-table",
-            columns=[
-                {"name": "Datum", "id": "date"},
-                {"name": "Typ", "id": "type"},
-                {"name": "Preis", "id": "price"},
-                {"name": "Menge", "id": "quantity"},
-                {"name": "Gewinn/Verlust", "id": "pnl"},
-            ],
-            data=[],
-            style_header={
-                "backgroundColor": colors['card'],
-                "color": colors['text'],
-                "fontWeight": "bold",
-                "border": f"1px solid {colors['grid']}",
-            },
-            style_cell={
-                "backgroundColor": colors['background'],
-                "color": colors['text'],
-                "border": f"1px solid {colors['grid']}",
-                "padding": "10px",
-                "textAlign": "left",
-            },
-            style_data_conditional=[
-                {
-                    "if": {"filter_query": "{type} = 'Kauf'"},
-                    "backgroundColor": "rgba(16, 185, 129, 0.1)",
-                },
-                {
-                    "if": {"filter_query": "{type} = 'Verkauf'"},
-                    "backgroundColor": "rgba(239, 68, 68, 0.1)",
-                },
-                {
-                    "if": {"filter_query": "{pnl} contains '+'"},
-                    "color": colors['success'],
-                },
-                {
-                    "if": {"filter_query": "{pnl} contains '-'"},
-                    "color": colors['danger'],
-                },
-            ],
-            page_size=5,
-        )
+        return _trades_table([])
     
-    # Generiere Beispiel-Trades
-    np.random.seed(42)  # Für reproduzierbare Ergebnisse
+    # Generiere Beispiel-Trades auf einmal: abwechselnd Kauf und Verkauf im Abstand von 1-6 Tagen
+    n_trades = 25
+    rng = np.random.default_rng(42)  # Für reproduzierbare Ergebnisse
     
-    trades = []
-    current_date = datetime.now() - timedelta(days=180)
-    
-    for i in range(25):
-        # Zufälliges Datum innerhalb der letzten 180 Tage
-        trade_date = current_date + timedelta(days=np.random.randint(1, 7))
-        current_date = trade_date
-        
-        # Zufälliger Trade-Typ
-        trade_type = "Kauf" if i % 2 == 0 else "Verkauf"
-        
-        # Zufälliger Preis
-        price = np.random.uniform(150, 200)
-        
-        # Zufällige Menge
-        quantity = np.random.randint(1, 10) * 10
-        
-        # Zufälliger Gewinn/Verlust (nur für Verkäufe)
-        pnl = ""
-        if trade_type == "Verkauf":
-            pnl_value = np.random.normal(100, 300)
-            pnl = f"+{pnl_value:.2f} €" if pnl_value >= 0 else f"{pnl_value:.2f} €"
-        
-        trades.append({
-            "date": trade_date.strftime("%d.%m.%Y %H:%M"),
-            "type": trade_type,
-            "price": f"{price:.2f} €",
-            "quantity": quantity,
-            "pnl": pnl,
-        })
+    dates = pd.Timestamp.now() - pd.Timedelta(days=180) + pd.to_timedelta(rng.integers(1, 7, n_trades).cumsum(), unit="D")
+    is_buy = np.arange(n_trades) % 2 == 0
+    prices = rng.uniform(150, 200, n_trades)
+    quantities = rng.integers(1, 10, n_trades) * 10
+    pnl_values = rng.normal(100, 300, n_trades)
     
-    # Sortiere Trades nach Datum (neueste zuerst)
-    trades.sort(key=lambda x: datetime.strptime(x["date"], "%d.%m.%Y %H:%M"), reverse=True)
+    # Zeilen spaltenweise aufbauen; Gewinn/Verlust nur für Verkäufe. Die Daten steigen
+    # streng monoton, neueste zuerst heißt daher einfach umgekehrt
+    trades = pd.DataFrame({
+        "date": dates.strftime("%d.%m.%Y %H:%M"),
+        "type": np.where(is_buy, "Kauf", "Verkauf"),
+        "price": prices.round(2),
+        "quantity": quantities,
+        "pnl": np.where(is_buy, None, pnl_values.round(2)),
+    }).iloc[::-1].to_dict("records")
     
-    return dash_table.DataTable(
-        id="trades-table",
-        columns=[
-            {"name": "Datum", "id": "date"},
-            {"name": "Typ", "id": "type"},
-            {"name": "Preis", "id": "price"},
-            {"name": "Menge", "id": "quantity"},
-            {"name": "Gewinn/Verlust", "id": "pnl"},
-        ],
-        data=trades,
-        style_header={
-            "backgroundColor": colors['card'],
-            "color": colors['text'],
-            "fontWeight": "bold",
-            "border": f"1px solid {colors['grid']}",
-        },
-        style_cell={
-            "backgroundColor": colors['background'],
-            "color": colors['text'],
-            "border": f"1px solid {colors['grid']}",
-            "padding": "10px",
-            "textAlign": "left",
-        },
-        style_data_conditional=[
-            {
-                "if": {"filter_query": "{type} = 'Kauf'"},
-                "backgroundColor": "rgba(16, 185, 129, 0.1)",
-            },
-            {
-                "if": {"filter_query": "{type} = 'Verkauf'"},
-                "backgroundColor": "rgba(239, 68, 68, 0.1)",
-            },
-            {
-                "if": {"filter_query": "{pnl} contains '+'"},
-                "color": colors['success'],
-            },
-            {
-                "if": {"filter_query": "{pnl} contains '-'"},
-                "color": colors['danger'],
-            },
-        ],
-        page_size=5,
-    )
+    return _trades_table(trades)
 
 # Wenn dieses Skript direkt ausgeführt wird
 if __name__ == "__main__":
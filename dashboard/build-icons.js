@@ -0,0 +1,34 @@
+// Schreibt die im Dashboard verwendeten Iconify-Icons als SVG nach assets/icons.json,
+// damit sie ohne Abruf der Iconify-API direkt im Layout ausgeliefert werden.
+// Build: `npm run build:icons` (sucht in *.py nach icon("prefix:name", ...) oder icon('prefix:name', ...))
+var fs = require('fs');
+var path = require('path');
+
+var used = new Set();
+fs.readdirSync(__dirname)
+    .filter(function (file) { return file.endsWith('.py'); })
+    .forEach(function (file) {
+        var source = fs.readFileSync(path.join(__dirname, file), 'utf8');
+        var pattern = /\bicon\((["'])([\w-]+):([\w-]+)\1/g;
+        var match;
+        while ((match = pattern.exec(source)) !== null) {
+            used.add(match[2] + ':' + match[3]);
+        }
+    });
+
+var out = {};
+used.forEach(function (key) {
+    var parts = key.split(':');
+    var set = require('@iconify-json/' + parts[0] + '/icons.json');
+    var name = set.aliases && set.aliases[parts[1]] ? set.aliases[parts[1]].parent : parts[1];
+    var data = set.icons[name];
+    if (!data) {
+        throw new Error('Icon nicht gefunden: ' + key);
+    }
+    var width = data.width || set.width || 24;
+    var height = data.height || set.height || 24;
+    out[key] = '<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 ' + width + ' ' + height + '">' + data.body + '</svg>';
+});
+
+fs.writeFileSync(path.join(__dirname, 'assets', 'icons.json'), JSON.stringify(out));
+console.log(Object.keys(out).length + ' Icons nach assets/icons.json geschrieben');
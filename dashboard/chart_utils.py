@@ -1,16 +1,146 @@
+import numpy as np
+import pandas as pd
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 
-def create_price_chart(df, symbol, show_sma=False, show_bb=False, show_volume=True):
+def m4_aggregate(df, width=1000):
+    """
+    Reduziert OHLCV-Daten per M4-Aggregation auf höchstens eine Kerze pro Pixelspalte
+    
+    Die Zeitachse wird in `width` gleich breite Buckets geteilt. Je Bucket bleiben
+    erster Open, maximales High, minimales Low, letzter Close und die Volumensumme
+    erhalten, sodass das Chart optisch unverändert bleibt.
+    
+    Args:
+        df (pd.DataFrame): DataFrame mit OHLCV-Daten und DatetimeIndex
+        width (int): Breite des Charts in Pixeln
+        
+    Returns:
+        pd.DataFrame: Aggregierter DataFrame (oder das Original, wenn er klein genug ist)
+    """
+    if len(df) <= width:
+        return df
+    
+    # Ordne jede Zeile anhand ihres Zeitstempels einer Pixelspalte zu
+    ts = np.asarray(df.index, dtype='datetime64[ns]').view('i8')
+    # Gleitkomma statt Ganzzahl-Arithmetik, da (ts - ts0) * width bei langen Zeiträumen überläuft
+    span = float(ts[-1] - ts[0] + 1)
+    buckets = np.minimum(((ts - ts[0]) / span * width).astype(np.int64), width - 1)
+    
+    # Nicht-OHLCV-Spalten (z.B. Indikatoren) übernehmen den letzten Wert des Buckets
+    agg = {col: 'last' for col in df.columns}
+    for col, func in (('Open', 'first'), ('High', 'max'), ('Low', 'min'), ('Close', 'last'), ('Volume', 'sum')):
+        if col in agg:
+            agg[col] = func
+    
+    result = df.groupby(buckets, sort=False).agg(agg)
+    
+    # Jeder Bucket bekommt den Zeitstempel seiner ersten Zeile
+    starts = np.flatnonzero(np.diff(buckets)) + 1
+    result.index = df.index[np.concatenate(([0], starts))]
+    
+    return result
+
+def _volume_colors(df):
+    """
+    Färbt die Volumenbalken nach Kerzenrichtung (grün bei Close >= Open, sonst rot)
+    
+    Args:
+        df (pd.DataFrame): DataFrame mit Open- und Close-Spalte
+        
+    Returns:
+        np.ndarray: Farbe je Zeile
+    """
+    rising = df['Close'].to_numpy() >= df['Open'].to_numpy()
+    return np.where(rising, 'rgba(0, 150, 0, 0.5)', 'rgba(255, 0, 0, 0.5)').astype(object)
+
+def xaxis_window(relayout_data):
+    """
+    Liest den sichtbaren Zeitbereich aus dem relayoutData eines Charts
+    
+    Args:
+        relayout_data (dict): relayoutData des Graphen
+        
+    Returns:
+        tuple | None: (start, ende) als Strings, (None, None) beim Zurücksetzen des
+        Zooms oder None, wenn sich die x-Achse nicht geändert hat
+    """
+    if not relayout_data:
+        return None
+    if relayout_data.get('xaxis.autorange'):
+        return (None, None)
+    if 'xaxis.range[0]' in relayout_data and 'xaxis.range[1]' in relayout_data:
+        return (str(relayout_data['xaxis.range[0]']), str(relayout_data['xaxis.range[1]']))
+    if 'xaxis.range' in relayout_data:
+        start, stop = relayout_data['xaxis.range']
+        return (str(start), str(stop))
+    return None
+
+def slice_window(df, start, stop):
+    """
+    Schneidet einen DataFrame auf einen Zeitbereich der x-Achse zu
+    
+    Plotly liefert die Achsengrenzen ohne Zeitzone in der Ortszeit der Daten,
+    bei zeitzonenbehafteten Indizes wird die Zeitzone daher ergänzt.
+    
+    Args:
+        df (pd.DataFrame): DataFrame mit sortiertem DatetimeIndex
+        start (str): Linke Achsengrenze
+        stop (str): Rechte Achsengrenze
+        
+    Returns:
+        pd.DataFrame: Zeilen innerhalb des Bereichs
+    """
+    bounds = [pd.Timestamp(start), pd.Timestamp(stop)]
+    tz = getattr(df.index, 'tz', None)
+    if tz is not None:
+        bounds = [b.tz_localize(tz) if b.tzinfo is None else b.tz_convert(tz) for b in bounds]
+    return df.loc[bounds[0]:bounds[1]]
+
+def fill_missing(df):
+    """
+    Füllt fehlende Werte wie `df.ffill().bfill().fillna(0)` auf einem einheitlichen float64-Block
+    
+    Gemischte Datentypen (float32, uint32, ...) zwingen pandas, jeden Block einzeln
+    zu füllen. Für Chart-Daten (höchstens einige tausend Zeilen) ist es schneller, einmal
+    in ein float64-Array zu wandeln; die Prüfung auf Lücken läuft direkt auf diesem Array.
+    
+    Args:
+        df (pd.DataFrame): DataFrame mit numerischen Spalten
+        
+    Returns:
+        pd.DataFrame: DataFrame (float64) ohne NaN-Werte, oder das Original, wenn nichts fehlt
+    """
+    arr = df.to_numpy(dtype=np.float64)
+    if not np.isnan(arr).any():
+        return df
+    
+    filled = pd.DataFrame(arr, index=df.index, columns=df.columns).ffill().bfill()
+    
+    # Nur vollständig leere Spalten sind nach ffill/bfill noch lückenhaft
+    if np.isnan(filled.to_numpy()).any():
+        filled = filled.fillna(0)
+    
+    return filled
+
+def create_price_chart(df, symbol, show_sma=False, show_bb=False, show_volume=True, layout=None, toggleable=False):
     """
     Erstellt ein Preischart mit optionalen Indikatoren
     
+    Die Overlay-Linien werden als WebGL-Traces (Scattergl) gerendert, damit auch
+    lange Zeitreihen den Browser nicht mit SVG-Knoten überlasten.
+    Mit `toggleable` sind SMA und Bollinger Bands immer enthalten und nur über
+    `visible` ein- bzw. ausgeblendet; die Legendengruppen 'sma' und 'bb' erlauben
+    das Umschalten im Browser.
+    
     Args:
         df (pd.DataFrame): DataFrame mit OHLCV-Daten und Indikatoren
         symbol (str): Das Aktiensymbol
         show_sma (bool): Ob SMAs angezeigt werden sollen
         show_bb (bool): Ob Bollinger Bands angezeigt werden sollen
         show_volume (bool): Ob Volumen angezeigt werden soll
+        layout (dict, optional): Layout-Eigenschaften, die die Standardwerte überschreiben
+        toggleable (bool): Ob ausgeblendete Overlays trotzdem mitgeliefert werden
         
     Returns:
         go.Figure: Plotly-Figur mit dem Chart
@@ -44,12 +174,14 @@ def create_price_chart(df, symbol, show_sma=False, show_bb=False, show_volume=Tr
     )
     
     # Füge SMAs hinzu, wenn gewünscht
-    if show_sma:
+    if show_sma or toggleable:
         fig.add_trace(
-            go.Scatter(
+            go.Scattergl(
                 x=df.index,
                 y=df['sma_20'],
                 name='SMA 20',
+                legendgroup='sma',
+                visible=show_sma,
                 line=dict(color='rgba(0, 150, 255, 0.8)', width=1.5),
                 showlegend=True
             ),
@@ -57,12 +189,14 @@ def create_price_chart(df, symbol, show_sma=False, show_bb=False, show_volume=Tr
         )
     
     # Füge Bollinger Bands hinzu, wenn gewünscht
-    if show_bb:
+    if show_bb or toggleable:
         fig.add_trace(
-            go.Scatter(
+            go.Scattergl(
                 x=df.index,
                 y=df['bb_upper'],
                 name='BB Upper',
+                legendgroup='bb',
+                visible=show_bb,
                 line=dict(color='rgba(0, 255, 255, 0.8)', width=1),
                 showlegend=True
             ),
@@ -70,10 +204,12 @@ def create_price_chart(df, symbol, show_sma=False, show_bb=False, show_volume=Tr
         )
         
         fig.add_trace(
-            go.Scatter(
+            go.Scattergl(
                 x=df.index,
                 y=df['bb_middle'],
                 name='BB Middle',
+                legendgroup='bb',
+                visible=show_bb,
                 line=dict(color='rgba(0, 255, 255, 0.8)', width=1, dash='dash'),
                 showlegend=True
             ),
@@ -81,10 +217,12 @@ def create_price_chart(df, symbol, show_sma=False, show_bb=False, show_volume=Tr
         )
         
         fig.add_trace(
-            go.Scatter(
+            go.Scattergl(
                 x=df.index,
                 y=df['bb_lower'],
                 name='BB Lower',
+                legendgroup='bb',
+                visible=show_bb,
                 line=dict(color='rgba(0, 255, 255, 0.8)', width=1),
                 showlegend=True
             ),
@@ -93,7 +231,7 @@ def create_price_chart(df, symbol, show_sma=False, show_bb=False, show_volume=Tr
     
     # Füge Volumen hinzu, wenn gewünscht
     if show_volume and len(row_heights) > 1:
-        colors = ['rgba(0, 150, 0, 0.5)' if row['Close'] >= row['Open'] else 'rgba(255, 0, 0, 0.5)' for _, row in df.iterrows()]
+        colors = _volume_colors(df)
         
         fig.add_trace(
             go.Bar(
@@ -108,21 +246,27 @@ def create_price_chart(df, symbol, show_sma=False, show_bb=False, show_volume=Tr
     
     # Aktualisiere das Layout
     fig.update_layout(
-        title=f'{symbol} Chart',
-        xaxis_title='Datum',
-        yaxis_title='Preis',
-        template='plotly_dark',
-        legend=dict(
-            orientation="h",
-            yanchor="bottom",
-            y=1.02,
-            xanchor="right",
-            x=1
+        dict(
+            title=f'{symbol} Chart',
+            xaxis_title='Datum',
+            yaxis_title='Preis',
+            template='plotly_dark',
+            legend=dict(
+                orientation="h",
+                yanchor="bottom",
+                y=1.02,
+                xanchor="right",
+                x=1
+            ),
+            margin=dict(l=50, r=50, t=50, b=50),
+            xaxis_rangeslider_visible=False,
         ),
-        margin=dict(l=50, r=50, t=50, b=50),
-        xaxis_rangeslider_visible=False,
+        **(layout or {})
     )
     
+    # Feste Datumsachse, damit Plotly den Achsentyp nicht bei jedem Update neu ermittelt
+    fig.update_xaxes(type='date')
+    
     # Aktualisiere die Y-Achsen
     fig.update_yaxes(title_text='Preis', row=1, col=1)
     if show_volume and len(row_heights) > 1:
@@ -130,19 +274,20 @@ def create_price_chart(df, symbol, show_sma=False, show_bb=False, show_volume=Tr
     
     return fig
 
-def create_volume_chart(df):
+def create_volume_chart(df, layout=None):
     """
     Erstellt ein Volumen-Chart
     
     Args:
         df (pd.DataFrame): DataFrame mit OHLCV-Daten
+        layout (dict, optional): Layout-Eigenschaften, die die Standardwerte überschreiben
         
     Returns:
         go.Figure: Plotly-Figur mit dem Chart
     """
     fig = go.Figure()
     
-    colors = ['rgba(0, 150, 0, 0.5)' if row['Close'] >= row['Open'] else 'rgba(255, 0, 0, 0.5)' for _, row in df.iterrows()]
+    colors = _volume_colors(df)
     
     fig.add_trace(
         go.Bar(
@@ -155,22 +300,28 @@ def create_volume_chart(df):
     )
     
     fig.update_layout(
-        title='Volume',
-        xaxis_title='Datum',
-        yaxis_title='Volumen',
-        template='plotly_dark',
-        margin=dict(l=50, r=50, t=50, b=50),
+        dict(
+            title='Volume',
+            xaxis_title='Datum',
+            yaxis_title='Volumen',
+            template='plotly_dark',
+            margin=dict(l=50, r=50, t=50, b=50),
+        ),
+        **(layout or {})
     )
     
     return fig
 
-def create_indicator_chart(df, indicator_type):
+def create_indicator_chart(df, indicator_type, layout=None):
     """
     Erstellt ein Chart für einen Indikator
     
+    Die Indikatorlinien werden wie im Preischart als WebGL-Traces (Scattergl) gerendert.
+    
     Args:
         df (pd.DataFrame): DataFrame mit OHLCV-Daten und Indikatoren
         indicator_type (str): Typ des Indikators ('rsi', 'macd')
+        layout (dict, optional): Layout-Eigenschaften, die die Standardwerte überschreiben
         
     Returns:
         go.Figure: Plotly-Figur mit dem Chart
@@ -179,7 +330,7 @@ def create_indicator_chart(df, indicator_type):
     
     if indicator_type == 'rsi':
         fig.add_trace(
-            go.Scatter(
+            go.Scattergl(
                 x=df.index,
                 y=df['rsi_14'],
                 name='RSI (14)',
@@ -208,17 +359,20 @@ def create_indicator_chart(df, indicator_type):
         )
         
         fig.update_layout(
-            title='RSI (14)',
-            xaxis_title='Datum',
-            yaxis_title='RSI',
-            template='plotly_dark',
-            margin=dict(l=50, r=50, t=50, b=50),
-            yaxis=dict(range=[0, 100]),
+            dict(
+                title='RSI (14)',
+                xaxis_title='Datum',
+                yaxis_title='RSI',
+                template='plotly_dark',
+                margin=dict(l=50, r=50, t=50, b=50),
+                yaxis=dict(range=[0, 100]),
+            ),
+            **(layout or {})
         )
     
     elif indicator_type == 'macd':
         fig.add_trace(
-            go.Scatter(
+            go.Scattergl(
                 x=df.index,
                 y=df['macd'],
                 name='MACD',
@@ -228,7 +382,7 @@ def create_indicator_chart(df, indicator_type):
         )
         
         fig.add_trace(
-            go.Scatter(
+            go.Scattergl(
                 x=df.index,
                 y=df['macdsignal'],
                 name='Signal',
@@ -250,11 +404,14 @@ def create_indicator_chart(df, indicator_type):
         )
         
         fig.update_layout(
-            title='MACD (12, 26, 9)',
-            xaxis_title='Datum',
-            yaxis_title='MACD',
-            template='plotly_dark',
-            margin=dict(l=50, r=50, t=50, b=50),
+            dict(
+                title='MACD (12, 26, 9)',
+                xaxis_title='Datum',
+                yaxis_title='MACD',
+                template='plotly_dark',
+                margin=dict(l=50, r=50, t=50, b=50),
+            ),
+            **(layout or {})
         )
     
     return fig
@@ -4,8 +4,10 @@ import dash_bootstrap_components as dbc
 from dash_iconify import DashIconify
 import json
 import os
+from functools import lru_cache
 
-# Lade die Nasdaq-Symbole aus der JSON-Datei
+# Lade die Nasdaq-Symbole aus der JSON-Datei (einmal pro Prozess)
+@lru_cache(maxsize=None)
 def load_nasdaq_symbols():
     try:
         with open(os.path.join(os.path.dirname(__file__), 'assets', 'nasdaq_symbols.json'), 'r') as f:
@@ -22,7 +24,7 @@ def create_asset_buttons(symbols_data):
     popular_buttons = [
         html.Button(
             symbol["symbol"],
-            id={"type": "asset-button", "symbol": symbol["symbol"]},
+            id={"type": "asset-button", "index": symbol["symbol"]},
             className="asset-button",
             title=symbol["name"]
         ) for symbol in popular_symbols
@@ -31,7 +33,7 @@ def create_asset_buttons(symbols_data):
     indices_buttons = [
         html.Button(
             symbol["symbol"],
-            id={"type": "asset-button", "symbol": symbol["symbol"]},
+            id={"type": "asset-button", "index": symbol["symbol"]},
             className="asset-button index-button",
             title=symbol["name"]
         ) for symbol in indices
@@ -44,23 +46,44 @@ def create_asset_buttons(symbols_data):
         html.Div(indices_buttons, className="asset-buttons-container"),
     ], className="asset-selection-container")
 
-# Erstelle verbesserte Zeitrahmen-Buttons
+# Erstelle die Optionen für die Symbolsuche (Beliebte Aktien und Indizes);
+# der Suchschlüssel "search" liegt bereits in Großbuchstaben vor und wird nicht pro Tastendruck umgewandelt
+def create_symbol_options(symbols_data):
+    options = []
+    for symbol in symbols_data.get("popular_symbols", []) + symbols_data.get("indices", []):
+        label = f"{symbol['symbol']} - {symbol['name']}"
+        options.append({"label": label, "value": symbol["symbol"], "search": label.upper()})
+    return options
+
+# Erstelle das Suchfeld für Symbole; die Optionen werden im Browser gefiltert
+def create_symbol_search():
+    return dcc.Dropdown(
+        id="symbol-search",
+        options=[],
+        placeholder="Symbol suchen...",
+        searchable=True,
+        clearable=True,
+        className="mb-3",
+    )
+
+# Erstelle verbesserte Zeitrahmen-Buttons (konstant, daher nur einmal erstellt)
+@lru_cache(maxsize=1)
 def create_timeframe_buttons():
     timeframes = [
-        {"label": "1min", "value": "1m", "id": "tf-1min"},
-        {"label": "2min", "value": "2m", "id": "tf-2min"},
-        {"label": "3min", "value": "3m", "id": "tf-3min"},
-        {"label": "5min", "value": "5m", "id": "tf-5m"},
-        {"label": "15min", "value": "15m", "id": "tf-15m"},
-        {"label": "30min", "value": "30m", "id": "tf-30m"},
-        {"label": "1h", "value": "60m", "id": "tf-1h"},
-        {"label": "4h", "value": "4h", "id": "tf-4h"},
+        {"label": "1min", "value": "1m"},
+        {"label": "2min", "value": "2m"},
+        {"label": "3min", "value": "3m"},
+        {"label": "5min", "value": "5m"},
+        {"label": "15min", "value": "15m"},
+        {"label": "30min", "value": "30m"},
+        {"label": "1h", "value": "60m"},
+        {"label": "4h", "value": "4h"},
     ]
     
     buttons = [
         html.Button(
             tf["label"],
-            id=tf["id"],
+            id={"type": "timeframe-button", "index": tf["value"]},
             className="timeframe-button",
             **{"data-value": tf["value"]}
         ) for tf in timeframes
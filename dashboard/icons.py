@@ -0,0 +1,84 @@
+"""
+Vorgerenderte Icons für das Dashboard
+
+`npm run build:icons` schreibt alle per `icon('prefix:name', ...)` verwendeten Icons als
+SVG nach assets/icons.json. Die Icons werden dann als CSS-Maske direkt im Layout
+ausgeliefert, ohne dass der Browser sie einzeln von der Iconify-API lädt. Fehlt die
+Datei, wird auf DashIconify zurückgegriffen.
+"""
+
+import base64
+import json
+import logging
+import os
+from functools import lru_cache
+
+from dash import html
+from dash_iconify import DashIconify
+
+logger = logging.getLogger(__name__)
+
+ICONS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "assets", "icons.json")
+
+try:
+    with open(ICONS_FILE, "r") as f:
+        _SVG = json.load(f)
+    ICONS_AVAILABLE = True
+except FileNotFoundError:
+    _SVG = {}
+    ICONS_AVAILABLE = False
+    logger.info("assets/icons.json fehlt, Icons werden über DashIconify geladen (npm run build:icons)")
+
+
+@lru_cache(maxsize=None)
+def _mask_url(name):
+    """
+    Kodiert ein SVG einmalig als Data-URL für die CSS-Maske
+
+    Args:
+        name (str): Iconify-Name, z.B. 'mdi:chart-line'
+
+    Returns:
+        str: CSS-Wert für mask-image
+    """
+    data = base64.b64encode(_SVG[name].encode("utf-8")).decode("ascii")
+    return f'url("data:image/svg+xml;base64,{data}")'
+
+
+def icon(name, width=18, color=None, className=None):
+    """
+    Erstellt ein Icon; Signatur wie DashIconify(icon=..., width=..., color=..., className=...)
+
+    Das SVG dient als Maske über einer Fläche in `color`, ohne Farbe wird wie bei
+    DashIconify die Textfarbe (currentColor) übernommen.
+
+    Args:
+        name (str): Iconify-Name, z.B. 'mdi:chart-line'
+        width (int): Breite und Höhe in Pixeln
+        color (str, optional): Farbe des Icons
+        className (str, optional): CSS-Klassen
+
+    Returns:
+        Component: html.Span mit dem Icon oder DashIconify, wenn das Icon nicht vorgerendert ist
+    """
+    if name not in _SVG:
+        kwargs = {key: value for key, value in (("color", color), ("className", className)) if value is not None}
+        return DashIconify(icon=name, width=width, **kwargs)
+
+    mask = _mask_url(name)
+    style = {
+        "display": "inline-block",
+        "width": f"{width}px",
+        "height": f"{width}px",
+        "verticalAlign": "middle",
+        "backgroundColor": color or "currentColor",
+        "maskImage": mask,
+        "WebkitMaskImage": mask,
+        "maskRepeat": "no-repeat",
+        "WebkitMaskRepeat": "no-repeat",
+        "maskSize": "contain",
+        "WebkitMaskSize": "contain",
+    }
+    if className is None:
+        return html.Span(style=style)
+    return html.Span(className=className, style=style)
@@ -0,0 +1,12 @@
+// Schlankes Plotly-Bundle mit den Trace-Typen, die das Dashboard tatsächlich nutzt.
+// Build: `npm run build:plotly` -> assets/plotly-custom.min.js
+var Plotly = require('plotly.js/lib/core');
+
+Plotly.register([
+    require('plotly.js/lib/bar'),
+    require('plotly.js/lib/candlestick'),
+    require('plotly.js/lib/ohlc'),
+    require('plotly.js/lib/scattergl'),
+]);
+
+module.exports = Plotly;
@@ -0,0 +1,319 @@
+"""
+Serialisierung und Caching von DataFrames für dcc.Store-Komponenten
+"""
+
+import base64
+import logging
+import os
+import threading
+from collections import OrderedDict
+from functools import wraps
+from io import StringIO
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# pyarrow ist optional; ohne das Paket wird JSON verwendet
+try:
+    import pyarrow as pa
+    ARROW_AVAILABLE = True
+except ImportError:
+    ARROW_AVAILABLE = False
+    logger.info("pyarrow nicht verfügbar, Store-Daten werden als JSON serialisiert")
+
+
+def quantize_dataframe(df):
+    """
+    Reduziert die Genauigkeit der Spalten für die Übertragung an den Browser
+
+    Gleitkommaspalten werden zu float32, ein nicht-negatives ganzzahliges Volumen zu
+    uint32. Für die Darstellung ist der Unterschied nicht sichtbar, die Payload halbiert
+    sich. Gebrochene Volumina (z.B. Krypto oder gemittelte Werte) bleiben Gleitkommazahlen.
+
+    Args:
+        df (pd.DataFrame): DataFrame mit OHLCV-Daten
+
+    Returns:
+        pd.DataFrame: DataFrame mit reduzierten Datentypen
+    """
+    dtypes = {col: 'float32' for col in df.select_dtypes(include='float64').columns}
+
+    volume = next((col for col in df.columns if str(col).lower() == 'volume'), None)
+    if volume is not None and len(df):
+        values = df[volume]
+        if values.notna().all() and 0 <= values.min() and values.max() < 2 ** 32 and (values % 1 == 0).all():
+            dtypes[volume] = 'uint32'
+
+    return df.astype(dtypes)
+
+
+def encode_dataframe(df):
+    """
+    Serialisiert einen DataFrame für die Ablage in einem dcc.Store
+
+    Mit pyarrow wird der DataFrame als Arrow-IPC-Stream in Base64 abgelegt, sonst
+    als JSON im 'split'-Format. Arrow behält das spaltenweise Binärformat bei, sodass
+    beim Lesen kein Text in Gleitkommazahlen zurückgewandelt werden muss.
+
+    Args:
+        df (pd.DataFrame): Zu speichernder DataFrame
+
+    Returns:
+        dict: Payload mit 'format' und 'data'
+    """
+    if ARROW_AVAILABLE:
+        table = pa.Table.from_pandas(df)
+        sink = pa.BufferOutputStream()
+        with pa.ipc.new_stream(sink, table.schema) as writer:
+            writer.write_table(table)
+        return {'format': 'arrow', 'data': base64.b64encode(sink.getvalue().to_pybytes()).decode('ascii')}
+
+    return {'format': 'json', 'data': df.to_json(date_format='iso', orient='split')}
+
+
+def decode_dataframe(payload):
+    """
+    Stellt einen mit encode_dataframe serialisierten DataFrame wieder her
+
+    Args:
+        payload (dict): Payload aus dem dcc.Store
+
+    Returns:
+        pd.DataFrame: Wiederhergestellter DataFrame
+    """
+    if payload['format'] == 'arrow':
+        with pa.ipc.open_stream(base64.b64decode(payload['data'])) as reader:
+            return reader.read_all().to_pandas(self_destruct=True)
+
+    df = pd.read_json(StringIO(payload['data']), orient='split')
+    if not isinstance(df.index, pd.DatetimeIndex):
+        df.index = pd.to_datetime(df.index)
+    return df
+
+
+def encode_array(values, dtype='f4'):
+    """
+    Kodiert ein numerisches Array als Typed Array im Plotly-Format
+
+    plotly.js liest {'dtype': ..., 'bdata': ...} direkt als TypedArray ein. Trace-Daten
+    lassen sich so binär über Stores und Patches übertragen, ohne dass der Browser sie
+    erst entpacken muss; float32 braucht rund 5 statt etwa 9 Zeichen je Wert.
+
+    Args:
+        values (array-like): Numerische Werte
+        dtype (str): Von plotly.js unterstützter Typ ('f8', 'f4', 'i4', 'u4', ...)
+
+    Returns:
+        dict: Typed-Array-Spezifikation für Plotly
+    """
+    arr = np.ascontiguousarray(values, dtype=np.dtype(dtype).newbyteorder('<'))
+    return {'dtype': dtype, 'bdata': base64.b64encode(arr.tobytes()).decode('ascii')}
+
+
+def memoize(cache, timeout=300, maxsize=8, namespace=None):
+    """
+    Cacht die Ergebnisse einer Ladefunktion
+
+    Mit flask-caching liegen die Ergebnisse für `timeout` Sekunden im gemeinsamen
+    Cache, ohne das Paket in einem LRU-Speicher des Prozesses mit `maxsize` Einträgen.
+    In beiden Fällen wird None nicht behalten: Liefert die Funktion für leere oder
+    fehlgeschlagene Ladevorgänge None, versucht es der nächste Aufruf erneut.
+
+    Args:
+        cache (flask_caching.Cache | None): Cache der App oder None
+        timeout (int): Gültigkeit der Einträge in Sekunden (nur mit flask-caching)
+        maxsize (int): Anzahl der Einträge im Prozess-Cache (nur ohne flask-caching)
+        namespace (str, optional): Zusatz zum Funktionsnamen im gemeinsamen Cache, damit
+            gleichnamige Funktionen mit unterschiedlicher Konfiguration getrennt bleiben
+
+    Returns:
+        callable: Dekorator für Funktionen mit hashbaren Positionsargumenten
+    """
+    def decorator(func):
+        # flask-caching behandelt gecachtes None als Fehltreffer (cache_none=False)
+        if cache is not None:
+            make_name = None if namespace is None else (lambda name: f"{name}:{namespace}")
+            return cache.memoize(timeout=timeout, make_name=make_name)(func)
+
+        entries = OrderedDict()
+        lock = threading.Lock()
+
+        @wraps(func)
+        def wrapper(*args):
+            with lock:
+                if args in entries:
+                    entries.move_to_end(args)
+                    return entries[args]
+            result = func(*args)
+            if result is not None:
+                with lock:
+                    entries[args] = result
+                    while len(entries) > maxsize:
+                        entries.popitem(last=False)
+            return result
+
+        wrapper.cache_clear = entries.clear
+        return wrapper
+
+    return decorator
+
+
+def create_cache(server, cache_dir):
+    """
+    Richtet den serverseitigen Cache einer App ein
+
+    Ist CACHE_REDIS_URL gesetzt, teilen sich alle Worker einen Redis-Cache, sonst liegt
+    der Cache im Dateisystem unter `cache_dir`.
+
+    Args:
+        server (flask.Flask): Flask-Server der Dash-App
+        cache_dir (str): Verzeichnis für den Dateisystem-Cache
+
+    Returns:
+        flask_caching.Cache | None: Cache der App oder None, wenn flask-caching fehlt
+    """
+    try:
+        from flask_caching import Cache
+    except ImportError:
+        logger.info("flask-caching nicht verfügbar, Daten werden im Prozess gecacht")
+        return None
+
+    if os.environ.get("CACHE_REDIS_URL"):
+        config = {"CACHE_TYPE": "RedisCache", "CACHE_REDIS_URL": os.environ["CACHE_REDIS_URL"]}
+    else:
+        config = {"CACHE_TYPE": "FileSystemCache", "CACHE_DIR": cache_dir}
+    return Cache(server, config=config)
+
+
+def make_payload_loader(load_stock_data, cache=None, timeout=300):
+    """
+    Erstellt die gecachte Funktion, die Kursdaten für den stock-data-store lädt
+
+    Gecacht wird die fertige Kodierung, leere Ergebnisse (None) werden nicht behalten.
+
+    Args:
+        load_stock_data (callable): Ladefunktion (symbol, timeframe, date_range), die
+            (DataFrame, Statusmeldung) liefert
+        cache (flask_caching.Cache | None): Cache der App oder None
+        timeout (int): Gültigkeit der Einträge in Sekunden
+
+    Returns:
+        callable: fetch_store_payload(symbol, timeframe, date_range) -> (kodierter DataFrame,
+            Info-Text, Statusmeldung, Datenversion) oder None
+    """
+    def fetch_store_payload(symbol, timeframe, date_range):
+        """
+        Lädt die Kursdaten für ein Symbol und kodiert sie für den stock-data-store
+
+        Args:
+            symbol (str): Das Aktiensymbol
+            timeframe (str): Zeitrahmen der Kerzen
+            date_range (str): Zeitraum
+
+        Returns:
+            tuple | None: (kodierter DataFrame, Info-Text, Statusmeldung, Datenversion) oder None, wenn keine Daten vorliegen
+        """
+        df, status_message = load_stock_data(symbol, timeframe, date_range)
+        if df.empty:
+            return None
+
+        first, last = df.index.min(), df.index.max()
+        info = f"{(last - first).days} Tage ({first:%d.%m.%Y} - {last:%d.%m.%Y})"
+        # Letzter Zeitstempel und Zeilenzahl kennzeichnen die geladenen Daten für die Chart-Caches
+        version = f"{last.isoformat()}/{len(df)}"
+        # Kurse und Indikatoren als float32, Volumen als uint32: halbiert den Store und den Cache
+        return encode_dataframe(quantize_dataframe(df)), info, status_message, version
+
+    # Apps mit unterschiedlichen Ladefunktionen können denselben Cache nutzen
+    return memoize(cache, timeout=timeout, maxsize=8, namespace=load_stock_data.__module__)(fetch_store_payload)
+
+
+def make_chart_builder(fetch_payload, card_background, cache=None, timeout=300):
+    """
+    Erstellt die gecachte Funktion, die aus einem Store-Eintrag die vier Charts baut
+
+    Die Figuren werden je Datensatz, Datenversion und Toggle-Kombination gecacht, mit
+    derselben Gültigkeit wie die Kursdaten. Die Version stammt aus `fetch_payload` und
+    liegt im stock-data-store; nach einem erneuten Laden mit neuen Daten ändert sie
+    sich, sodass keine Charts der alten Daten ausgeliefert werden.
+
+    Args:
+        fetch_payload (callable): Gecachte Ladefunktion (symbol, timeframe, date_range), die
+            (kodierter DataFrame, Info-Text, Statusmeldung, Version) oder None liefert
+        card_background (str): Hintergrundfarbe der Chart-Karten
+        cache (flask_caching.Cache | None): Cache der App oder None
+        timeout (int): Gültigkeit der Einträge in Sekunden
+
+    Returns:
+        callable: build_charts(symbol, timeframe, date_range, version, show_sma, show_bb,
+            show_rsi, show_macd, show_volume) -> Tuple der Plotly-JSON-Figuren oder None
+    """
+    import plotly.graph_objects as go
+
+    from dashboard.chart_utils import create_price_chart, create_volume_chart, create_indicator_chart
+
+    def build_charts(symbol, timeframe, date_range, version, show_sma, show_bb, show_rsi, show_macd, show_volume):
+        """
+        Erstellt die vier Charts für einen Datensatz und eine Kombination der Toggles
+
+        Args:
+            symbol (str): Das Aktiensymbol
+            timeframe (str): Zeitrahmen der Kerzen
+            date_range (str): Zeitraum
+            version (str): Datenversion aus dem stock-data-store (Teil des Cache-Schlüssels)
+            show_sma (bool): Ob SMAs angezeigt werden sollen
+            show_bb (bool): Ob Bollinger Bands angezeigt werden sollen
+            show_rsi (bool): Ob das RSI-Chart angezeigt werden soll
+            show_macd (bool): Ob das MACD-Chart angezeigt werden soll
+            show_volume (bool): Ob Volumen angezeigt werden soll
+
+        Returns:
+            tuple | None: Preis-, RSI-, MACD- und Volumenchart als Plotly-JSON oder None, wenn keine Daten vorliegen
+        """
+        payload = fetch_payload(symbol, timeframe, date_range)
+        if payload is None:
+            return None
+        df = decode_dataframe(payload[0])
+
+        # Setze den Index als DatetimeIndex
+        if not isinstance(df.index, pd.DatetimeIndex):
+            df.index = pd.to_datetime(df.index)
+
+        if df.empty:
+            return None
+
+        # Überprüfe, ob NaN-Werte vorhanden sind
+        if df.isna().any().any():
+            logger.warning(f"{df.isna().sum().sum()} NaN-Werte gefunden, werden gefüllt...")
+            df = df.ffill().bfill().fillna(0)
+
+        # Erstelle die Charts
+        price_chart = create_price_chart(df, symbol, show_sma=show_sma, show_bb=show_bb, show_volume=show_volume)
+        rsi_chart = create_indicator_chart(df, 'rsi') if show_rsi else go.Figure()
+        macd_chart = create_indicator_chart(df, 'macd') if show_macd else go.Figure()
+        volume_chart = create_volume_chart(df) if show_volume else go.Figure()
+
+        # Aktualisiere die Layouts
+        for chart in [rsi_chart, macd_chart, volume_chart]:
+            chart.update_layout(
+                template="plotly_dark",
+                paper_bgcolor=card_background,
+                plot_bgcolor=card_background,
+                margin=dict(l=0, r=0, t=30, b=0),
+                height=200,
+            )
+
+        price_chart.update_layout(
+            template="plotly_dark",
+            paper_bgcolor=card_background,
+            plot_bgcolor=card_background,
+            margin=dict(l=0, r=0, t=0, b=0),
+        )
+
+        return tuple(chart.to_plotly_json() for chart in (price_chart, rsi_chart, macd_chart, volume_chart))
+
+    # Die Hintergrundfarbe steckt in den Figuren, ist aber kein Argument; jede Konfiguration
+    # bekommt daher einen eigenen Namensraum im gemeinsamen Cache der Apps
+    return memoize(cache, timeout=timeout, maxsize=16, namespace=card_background)(build_charts)
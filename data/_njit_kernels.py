@@ -0,0 +1,189 @@
+"""
+JIT-Kernel für technische Indikatoren
+
+Die Kernel arbeiten auf float64-Arrays und liefern dieselben Werte wie die
+entsprechenden pandas-Ausdrücke (rolling/ewm), sparen sich aber die Zwischen-
+Series. Ohne numba laufen sie über `utils._njit` als reines Python.
+
+Die expliziten Signaturen erzwingen das Kompilieren beim Import statt beim
+ersten Aufruf; mit cache=True laden spätere Prozesse den Maschinencode von
+der Platte. Die Kernel erwarten daher eindimensionale float64-Arrays.
+"""
+
+import numpy as np
+
+from utils._njit import FLOAT_ARRAY, njit
+
+
+@njit(f"({FLOAT_ARRAY}, int64)", cache=True)
+def sma(close, n):
+    """
+    Gleitender Durchschnitt wie `close.rolling(n).mean()`
+
+    Args:
+        close (np.ndarray): Schlusskurse (float64)
+        n (int): Fensterlänge
+
+    Returns:
+        np.ndarray: SMA, die ersten n - 1 Werte sind NaN
+    """
+    size = close.shape[0]
+    out = np.full(size, np.nan)
+    total = 0.0
+    missing = 0
+    for i in range(size):
+        if np.isnan(close[i]):
+            missing += 1
+        else:
+            total += close[i]
+        if i >= n:
+            if np.isnan(close[i - n]):
+                missing -= 1
+            else:
+                total -= close[i - n]
+        # Wie pandas: Fenster mit fehlenden Werten ergeben NaN
+        if i >= n - 1 and missing == 0:
+            out[i] = total / n
+    return out
+
+
+@njit(f"({FLOAT_ARRAY}, int64, float64)", cache=True)
+def bbands(close, n, k):
+    """
+    Bollinger Bands in O(n) über gleitenden Mittelwert und Abweichungsquadratsumme
+
+    Statt Summe und Quadratsumme (numerisch instabil bei hohen Kursen) werden
+    Mittelwert und M2 beim Verschieben des Fensters angepasst (Welford). Nach
+    Fenstern mit fehlenden Werten wird neu aufsummiert, diese ergeben wie bei
+    pandas NaN.
+
+    Args:
+        close (np.ndarray): Schlusskurse (float64)
+        n (int): Fensterlänge
+        k (float): Anzahl der Standardabweichungen
+
+    Returns:
+        tuple: (Mittellinie, Standardabweichung, oberes Band, unteres Band)
+    """
+    size = close.shape[0]
+    middle = np.full(size, np.nan)
+    std = np.full(size, np.nan)
+    mean = 0.0
+    m2 = 0.0
+    missing = 0
+    valid = False
+    for i in range(size):
+        if np.isnan(close[i]):
+            missing += 1
+        if i >= n and np.isnan(close[i - n]):
+            missing -= 1
+        if i < n - 1 or missing > 0:
+            valid = False
+            continue
+        if valid:
+            # Fenster um einen Wert verschieben
+            x_in = close[i]
+            x_out = close[i - n]
+            old_mean = mean
+            mean += (x_in - x_out) / n
+            m2 += (x_in - x_out) * (x_in - mean + x_out - old_mean)
+        else:
+            mean = 0.0
+            for j in range(i - n + 1, i + 1):
+                mean += close[j]
+            mean /= n
+            m2 = 0.0
+            for j in range(i - n + 1, i + 1):
+                m2 += (close[j] - mean) ** 2
+            valid = True
+        middle[i] = mean
+        # Rundungsreste können M2 minimal negativ machen
+        std[i] = np.sqrt(max(m2, 0.0) / (n - 1))
+    return middle, std, middle + k * std, middle - k * std
+
+
+@njit(f"({FLOAT_ARRAY}, int64)", cache=True)
+def ema(close, span):
+    """
+    Exponentieller Durchschnitt wie `close.ewm(span=span, adjust=False).mean()`
+
+    Wie bei pandas beginnt die Glättung beim ersten gültigen Wert; fehlende
+    Werte übernehmen den bisherigen Stand, zählen für das Gewicht des alten
+    Werts aber als verstrichene Bars (ignore_na=False).
+
+    Args:
+        close (np.ndarray): Werte (float64)
+        span (int): Spanne der Glättung
+
+    Returns:
+        np.ndarray: EMA, NaN bis zum ersten gültigen Wert
+    """
+    size = close.shape[0]
+    out = np.full(size, np.nan)
+    alpha = 2.0 / (span + 1.0)
+    weighted = np.nan
+    old_wt = 1.0
+    for i in range(size):
+        x = close[i]
+        if np.isnan(weighted):
+            # Erster gültiger Wert startet die Glättung
+            weighted = x
+        else:
+            old_wt *= 1.0 - alpha
+            if not np.isnan(x):
+                weighted = (old_wt * weighted + alpha * x) / (old_wt + alpha)
+                old_wt = 1.0
+        out[i] = weighted
+    return out
+
+
+@njit(f"({FLOAT_ARRAY}, int64)", cache=True)
+def rsi(close, n):
+    """
+    RSI mit einfachem Durchschnitt der Gewinne und Verluste über n Bars
+
+    Wie in `DataFetcher.add_technical_indicators` ist der RSI NaN, solange
+    das Fenster keine Verluste enthält.
+
+    Args:
+        close (np.ndarray): Schlusskurse (float64)
+        n (int): Fensterlänge
+
+    Returns:
+        np.ndarray: RSI zwischen 0 und 100, die ersten n - 1 Werte sind NaN
+    """
+    size = close.shape[0]
+    out = np.full(size, np.nan)
+    for i in range(n - 1, size):
+        # Fenster jeweils neu summieren, damit ein verlustfreies Fenster
+        # nicht durch Rundungsreste einer laufenden Summe verfälscht wird
+        gain = 0.0
+        loss = 0.0
+        for j in range(max(i - n + 1, 1), i + 1):
+            delta = close[j] - close[j - 1]
+            if delta > 0:
+                gain += delta
+            elif delta < 0:
+                loss -= delta
+        if loss > 0:
+            out[i] = 100.0 - 100.0 / (1.0 + gain / loss)
+    return out
+
+
+@njit(f"({FLOAT_ARRAY}, int64, int64, int64)", cache=True)
+def macd(close, fast, slow, signal):
+    """
+    MACD-Linie, Signallinie und Histogramm
+
+    Args:
+        close (np.ndarray): Schlusskurse (float64)
+        fast (int): Spanne der schnellen EMA
+        slow (int): Spanne der langsamen EMA
+        signal (int): Spanne der Signallinie
+
+    Returns:
+        tuple: (MACD, Signal, Histogramm)
+    """
+    line = ema(close, fast) - ema(close, slow)
+    signal_line = ema(line, signal)
+    return line, signal_line, line - signal_line
@@ -14,6 +14,16 @@ from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Optional, Union, Dict, List, Tuple, Any
 
+from data import _njit_kernels as kernels
+
+# pyarrow ist optional; ohne das Paket bleibt der Daten-Cache im CSV-Format
+try:
+    import pyarrow as pa
+    import pyarrow.feather as feather
+    ARROW_AVAILABLE = True
+except ImportError:
+    ARROW_AVAILABLE = False
+
 # Konfiguriere Logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
@@ -49,6 +59,30 @@ class DataFetcher:
     Optimierte Klasse zum Abrufen und Verwalten von Handelsdaten
     Kombiniert Funktionalität aus verschiedenen Datenquellen
     """
+    # Intervalle, die aus einem feineren Basisintervall mit gleicher Historie aggregiert
+    # werden, statt sie erneut herunterzuladen (3m und 4h bietet yfinance nicht an)
+    RESAMPLED_INTERVALS = {
+        '3m': ('1m', '3min'),
+        '15m': ('5m', '15min'),
+        '30m': ('5m', '30min'),
+        '4h': ('60m', '4h'),
+    }
+
+    # Feather (Arrow IPC) wird ohne Text-Parsing gelesen und behält Datentypen und Zeitzone
+    CACHE_SUFFIX = '.feather' if ARROW_AVAILABLE else '.csv'
+
+    # Aggregation je Spalte beim Resampling; Indikatoren werden danach neu berechnet
+    RESAMPLE_AGG = {
+        'Open': 'first',
+        'High': 'max',
+        'Low': 'min',
+        'Close': 'last',
+        'Adj Close': 'last',
+        'Volume': 'sum',
+        'Dividends': 'sum',
+        'Splits': 'sum',
+    }
+
     def __init__(self, cache_dir=None):
         """
         Initialisiert den DataFetcher
@@ -91,21 +125,27 @@ class DataFetcher:
         Returns:
             pandas.DataFrame: DataFrame mit den Aktiendaten
         """
+        # Gröbere Intervalle aus den (gecachten) Daten des Basisintervalls ableiten
+        if interval in self.RESAMPLED_INTERVALS:
+            base_interval, rule = self.RESAMPLED_INTERVALS[interval]
+            base = self.get_stock_data(symbol, base_interval, range_val, use_cache, force_refresh)
+            return self.resample_ohlcv(base, rule)
+
         # Spezialbehandlung für NQ Futures
         if symbol.upper() in ['NQ', 'NQ=F']:
             return self.get_nq_futures_data(interval, range_val, use_cache, force_refresh)
 
-        cache_file = self.cache_dir / f"{symbol}_{interval}_{range_val}.csv"
+        cache_file = self.cache_dir / f"{symbol}_{interval}_{range_val}{self.CACHE_SUFFIX}"
 
         # Prüfe, ob Cache verwendet werden soll und Datei existiert
         if use_cache and cache_file.exists() and not force_refresh:
             cache_age = datetime.now() - datetime.fromtimestamp(cache_file.stat().st_mtime)
             if interval in ['1d', '1wk', '1mo'] and cache_age.days < 1:
                 logger.info(f"Verwende gecachte Daten für {symbol}")
-                return pd.read_csv(cache_file, index_col=0, parse_dates=True)
+                return self._read_cache(cache_file)
             elif interval.endswith('m') and cache_age.seconds < 3600:  # Für Minutendaten: 1 Stunde Cache
                 logger.info(f"Verwende gecachte Daten für {symbol}")
-                return pd.read_csv(cache_file, index_col=0, parse_dates=True)
+                return self._read_cache(cache_file)
 
         # Daten abrufen
         # Erste Priorität: Manus API, wenn verfügbar
@@ -115,7 +155,7 @@ class DataFetcher:
                 if data is not None and not data.empty:
                     # Speichere Daten im Cache
                     if use_cache:
-                        data.to_csv(cache_file)
+                        self._write_cache(data, cache_file)
                     return data
             except Exception as e:
                 logger.error(f"Fehler beim Abrufen der Daten über API: {e}")
@@ -153,7 +193,7 @@ class DataFetcher:
 
                         # Speichere Daten im Cache
                         if use_cache:
-                            data.to_csv(cache_file)
+                            self._write_cache(data, cache_file)
 
                         return data
 
@@ -166,6 +206,23 @@ class DataFetcher:
         logger.error(f"Konnte keine Daten für {symbol} oder Fallback-Symbole laden")
         return pd.DataFrame(columns=['Open', 'High', 'Low', 'Close', 'Volume', 'Dividends', 'Splits'])
 
+    def _read_cache(self, cache_file: Path) -> pd.DataFrame:
+        """
+        Liest eine Cache-Datei im Feather- oder CSV-Format
+        """
+        if cache_file.suffix == '.feather':
+            return feather.read_table(cache_file).to_pandas()
+        return pd.read_csv(cache_file, index_col=0, parse_dates=True)
+
+    def _write_cache(self, df: pd.DataFrame, cache_file: Path) -> None:
+        """
+        Schreibt einen DataFrame im Format der Cache-Datei
+        """
+        if cache_file.suffix == '.feather':
+            feather.write_feather(pa.Table.from_pandas(df), cache_file)
+        else:
+            df.to_csv(cache_file)
+
     def _fetch_data_from_api(self, symbol: str, interval: str, range_val: str) -> pd.DataFrame:
         """
         Ruft Daten über die Manus API ab
@@ -373,17 +430,17 @@ class DataFetcher:
         # Standardmäßig verwenden wir das generische NQ Futures Symbol
         symbol = "NQ=F"
 
-        cache_file = self.cache_dir / f"NQ_Futures_{interval}_{range_val}.csv"
+        cache_file = self.cache_dir / f"NQ_Futures_{interval}_{range_val}{self.CACHE_SUFFIX}"
 
         # Prüfe, ob Cache verwendet werden soll und Datei existiert
         if use_cache and cache_file.exists() and not force_refresh:
             cache_age = datetime.now() - datetime.fromtimestamp(cache_file.stat().st_mtime)
             if interval in ['1d', '1wk', '1mo'] and cache_age.days < 1:
                 logger.info("Verwende gecachte NQ Futures Daten")
-                return pd.read_csv(cache_file, index_col=0, parse_dates=True)
+                return self._read_cache(cache_file)
             elif interval.endswith('m') and cache_age.seconds < 3600:  # Für Minutendaten: 1 Stunde Cache
                 logger.info("Verwende gecachte NQ Futures Daten")
-                return pd.read_csv(cache_file, index_col=0, parse_dates=True)
+                return self._read_cache(cache_file)
 
         # Versuche Daten über yfinance zu laden
         logger.info("Rufe NQ Futures Daten über yfinance ab...")
@@ -393,7 +450,7 @@ class DataFetcher:
             if not df.empty:
                 # Speichere Daten im Cache
                 if use_cache:
-                    df.to_csv(cache_file)
+                    self._write_cache(df, cache_file)
                 logger.info(f"Erfolgreich NQ Futures Daten abgerufen, {len(df)} Datenpunkte")
                 return df
         except Exception as e:
@@ -408,7 +465,7 @@ class DataFetcher:
                 if not df.empty:
                     # Speichere Daten im Cache
                     if use_cache:
-                        df.to_csv(cache_file)
+                        self._write_cache(df, cache_file)
                     logger.info(f"Erfolgreich NQ Futures Daten über API abgerufen, {len(df)} Datenpunkte")
                     return df
             except Exception as e:
@@ -418,6 +475,26 @@ class DataFetcher:
         logger.error("Alle Versuche, NQ Futures Daten abzurufen, sind fehlgeschlagen.")
         return pd.DataFrame(columns=['Open', 'High', 'Low', 'Close', 'Volume', 'Adj Close'])
 
+    def resample_ohlcv(self, df: pd.DataFrame, rule: str) -> pd.DataFrame:
+        """
+        Aggregiert OHLCV-Daten auf ein gröberes Intervall
+
+        Args:
+            df: DataFrame mit OHLCV-Daten und DatetimeIndex
+            rule: pandas-Frequenz des Zielintervalls (z.B. '15min')
+
+        Returns:
+            pd.DataFrame: Aggregierter DataFrame mit neu berechneten Indikatoren
+        """
+        if df.empty:
+            return df
+
+        agg = {col: func for col, func in self.RESAMPLE_AGG.items() if col in df.columns}
+
+        # Buckets ohne Kurse (Nacht, Wochenende) entfallen
+        resampled = df.resample(rule).agg(agg).dropna(subset=['Close'])
+        return self.add_technical_indicators(resampled)
+
     def add_technical_indicators(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         Fügt technische Indikatoren zu einem DataFrame hinzu
@@ -444,40 +521,28 @@ class DataFetcher:
             # Kopiere den DataFrame, um Warnungen zu vermeiden
             df = df.copy()
 
+            # Alle Indikatoren werden einmalig beim Laden mit den JIT-Kernels berechnet,
+            # die Chart-Callbacks lesen nur noch die Spalten
+            close = df['Close'].to_numpy(dtype=np.float64)
+
             # Berechne SMA
-            df['sma_20'] = df['Close'].rolling(window=20).mean()
-            df['sma_50'] = df['Close'].rolling(window=50).mean()
-            df['sma_200'] = df['Close'].rolling(window=200).mean()
+            df['sma_20'] = kernels.sma(close, 20)
+            df['sma_50'] = kernels.sma(close, 50)
+            df['sma_200'] = kernels.sma(close, 200)
 
             # Berechne Bollinger Bands
-            df['bb_middle'] = df['sma_20']
-            df['bb_std'] = df['Close'].rolling(window=20).std()
-            df['bb_upper'] = df['bb_middle'] + 2 * df['bb_std']
-            df['bb_lower'] = df['bb_middle'] - 2 * df['bb_std']
+            df['bb_middle'], df['bb_std'], df['bb_upper'], df['bb_lower'] = kernels.bbands(close, 20, 2.0)
 
             # Berechne RSI mit Fehlerbehandlung
             try:
-                delta = df['Close'].diff()
-                gain = delta.where(delta > 0, 0)
-                loss = -delta.where(delta < 0, 0)
-                avg_gain = gain.rolling(window=14).mean()
-                avg_loss = loss.rolling(window=14).mean()
-
-                # Vermeide Division durch Null
-                avg_loss = avg_loss.replace(0, np.nan)
-                rs = avg_gain / avg_loss
-                df['rsi_14'] = 100 - (100 / (1 + rs))
+                df['rsi_14'] = kernels.rsi(close, 14)
             except Exception as e:
                 logger.warning(f"Fehler bei RSI-Berechnung: {str(e)}")
                 df['rsi_14'] = np.nan
 
             # Berechne MACD
             try:
-                ema_12 = df['Close'].ewm(span=12, adjust=False).mean()
-                ema_26 = df['Close'].ewm(span=26, adjust=False).mean()
-                df['macd'] = ema_12 - ema_26
-                df['macdsignal'] = df['macd'].ewm(span=9, adjust=False).mean()
-                df['macdhist'] = df['macd'] - df['macdsignal']
+                df['macd'], df['macdsignal'], df['macdhist'] = kernels.macd(close, 12, 26, 9)
             except Exception as e:
                 logger.warning(f"Fehler bei MACD-Berechnung: {str(e)}")
                 df['macd'] = np.nan
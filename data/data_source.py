@@ -3,6 +3,7 @@ Abstrakte Basisklasse für Datenquellen im Trading Dashboard
 """
 
 import os
+import re
 import sys
 import pandas as pd
 import numpy as np
@@ -17,6 +18,13 @@ from utils.helpers import DateTimeUtils, DataUtils, CacheManager
 # Logger konfigurieren
 logger = logging.getLogger("trading_dashboard.data_source")
 
+# Volatilität der synthetischen Daten je Anlageklasse als vorkompilierte Muster; die erste
+# passende Regel gilt, Kryptowährungen haben also Vorrang vor NQ
+_VOLATILITY_RULES = (
+    (re.compile(r"BTC|ETH"), 0.04),  # Höhere Volatilität für Kryptowährungen
+    (re.compile(r"NQ"), 0.03),  # Mittlere Volatilität für NQ Futures
+)
+
 class DataSource(ABC):
     """
     Abstrakte Basisklasse für Datenquellen
@@ -249,11 +257,7 @@ class MockDataSource(DataSource):
             base_price = symbol_prices.get(symbol, 100)
             
             # Generiere OHLC-Daten mit realistischeren Preisbewegungen
-            volatility = 0.02
-            if "BTC" in symbol or "ETH" in symbol:
-                volatility = 0.04  # Höhere Volatilität für Kryptowährungen
-            elif "NQ" in symbol:
-                volatility = 0.03  # Mittlere Volatilität für NQ Futures
+            volatility = next((value for pattern, value in _VOLATILITY_RULES if pattern.search(symbol)), 0.02)
             
             price_data = []
             current_price = base_price
@@ -15,4 +15,6 @@ from dashboard.app import app
 
 if __name__ == "__main__":
     print("Starte Trading Dashboard auf http://localhost:8050")
-    app.run(debug=True, host="0.0.0.0", port=8050)
+    # Entwicklungsmodus mit DASH_DEBUG=1; für den Produktionsbetrieb siehe wsgi.py
+    debug = os.environ.get("DASH_DEBUG") == "1"
+    app.run(debug=debug, dev_tools_ui=debug, dev_tools_props_check=debug, host="0.0.0.0", port=8050)
@@ -7,6 +7,44 @@ import pandas as pd
 import numpy as np
 from strategy.strategy_base import Strategy
 
+def _average_true_range(data, window=14):
+    """
+    Berechnet den Average True Range (ATR) vektorisiert
+    
+    Args:
+        data (pandas.DataFrame): DataFrame mit Preisdaten
+        window (int): Fenstergröße für den ATR
+        
+    Returns:
+        pandas.Series: Serie mit ATR-Werten
+    """
+    high_low = data['High'] - data['Low']
+    high_close = np.abs(data['High'] - data['Close'].shift())
+    low_close = np.abs(data['Low'] - data['Close'].shift())
+    
+    ranges = pd.concat([high_low, high_close, low_close], axis=1)
+    true_range = ranges.max(axis=1)
+    
+    return true_range.rolling(window=window).mean()
+
+def _crossover_signals(prev_buy, buy, prev_sell, sell):
+    """
+    Setzt Kauf- und Verkaufsbedingungen in ein Signal-Array um
+    
+    Kaufsignale haben Vorrang, wie in der früheren zeilenweisen Auswertung.
+    Vergleiche mit NaN ergeben False und erzeugen daher kein Signal.
+    
+    Args:
+        prev_buy (numpy.ndarray): Kaufbedingung der Vorperiode
+        buy (numpy.ndarray): Kaufbedingung der aktuellen Periode
+        prev_sell (numpy.ndarray): Verkaufsbedingung der Vorperiode
+        sell (numpy.ndarray): Verkaufsbedingung der aktuellen Periode
+        
+    Returns:
+        numpy.ndarray: Signale (1 für Kauf, -1 für Verkauf, 0 sonst)
+    """
+    return np.where(prev_buy & buy, 1, np.where(prev_sell & sell, -1, 0))
+
 class MovingAverageCrossover(Strategy):
     """
     Strategie basierend auf dem Kreuzen von gleitenden Durchschnitten
@@ -63,6 +101,9 @@ class MovingAverageCrossover(Strategy):
         # Konvertiere zu Handelssignalen
         df['Signal'] = np.where(df['Position'] > 0, 1, np.where(df['Position'] < 0, -1, 0))
         
+        # ATR einmalig für Stop-Loss und Take-Profit berechnen
+        df['ATR'] = _average_true_range(df)
+        
         return df
     
     def calculate_stop_loss(self, data, index):
@@ -76,15 +117,8 @@ class MovingAverageCrossover(Strategy):
         Returns:
             float: Stop-Loss-Preis
         """
-        # Berechne ATR (Average True Range)
-        high_low = data['High'] - data['Low']
-        high_close = np.abs(data['High'] - data['Close'].shift())
-        low_close = np.abs(data['Low'] - data['Close'].shift())
-        
-        ranges = pd.concat([high_low, high_close, low_close], axis=1)
-        true_range = ranges.max(axis=1)
-        
-        atr = true_range.rolling(window=14).mean()
+        # Verwende den in generate_signals berechneten ATR, sonst neu berechnen
+        atr = data['ATR'] if 'ATR' in data else _average_true_range(data)
         
         # Setze Stop-Loss auf 2 ATR unter dem Einstiegspreis
         current_price = data['Close'].iloc[index]
@@ -103,15 +137,8 @@ class MovingAverageCrossover(Strategy):
         Returns:
             float: Take-Profit-Preis
         """
-        # Berechne ATR (Average True Range)
-        high_low = data['High'] - data['Low']
-        high_close = np.abs(data['High'] - data['Close'].shift())
-        low_close = np.abs(data['Low'] - data['Close'].shift())
-        
-        ranges = pd.concat([high_low, high_close, low_close], axis=1)
-        true_range = ranges.max(axis=1)
-        
-        atr = true_range.rolling(window=14).mean()
+        # Verwende den in generate_signals berechneten ATR, sonst neu berechnen
+        atr = data['ATR'] if 'ATR' in data else _average_true_range(data)
         
         # Setze Take-Profit auf 3 ATR über dem Einstiegspreis (Risk-Reward-Ratio von 1.5)
         current_price = data['Close'].iloc[index]
@@ -171,17 +198,13 @@ class RSIStrategy(Strategy):
         rs = avg_gain / avg_loss
         df['RSI'] = 100 - (100 / (1 + rs))
         
-        # Initialisiere Signal-Spalte
-        df['Signal'] = 0
-        
         # Generiere Signale
         # Kaufsignal, wenn RSI unter oversold ist und dann darüber steigt
         # Verkaufssignal, wenn RSI über overbought ist und dann darunter fällt
-        for i in range(1, len(df)):
-            if df['RSI'].iloc[i-1] < oversold and df['RSI'].iloc[i] >= oversold:
-                df['Signal'].iloc[i] = 1  # Kaufsignal
-            elif df['RSI'].iloc[i-1] > overbought and df['RSI'].iloc[i] <= overbought:
-                df['Signal'].iloc[i] = -1  # Verkaufssignal
+        rsi = df['RSI'].to_numpy()
+        prev_rsi = df['RSI'].shift().to_numpy()
+        df['Signal'] = _crossover_signals(prev_rsi < oversold, rsi >= oversold,
+                                          prev_rsi > overbought, rsi <= overbought)
                 
         return df
     
@@ -278,17 +301,15 @@ class MACDStrategy(Strategy):
         df['Signal_Line'] = df['MACD'].ewm(span=signal_window, adjust=False).mean()
         df['Histogram'] = df['MACD'] - df['Signal_Line']
         
-        # Initialisiere Signal-Spalte
-        df['Signal'] = 0
-        
         # Generiere Signale
         # Kaufsignal, wenn MACD die Signallinie von unten kreuzt
         # Verkaufssignal, wenn MACD die Signallinie von oben kreuzt
-        for i in range(1, len(df)):
-            if df['MACD'].iloc[i-1] < df['Signal_Line'].iloc[i-1] and df['MACD'].iloc[i] >= df['Signal_Line'].iloc[i]:
-                df['Signal'].iloc[i] = 1  # Kaufsignal
-            elif df['MACD'].iloc[i-1] > df['Signal_Line'].iloc[i-1] and df['MACD'].iloc[i] <= df['Signal_Line'].iloc[i]:
-                df['Signal'].iloc[i] = -1  # Verkaufssignal
+        diff = df['Histogram'].to_numpy()
+        prev_diff = df['Histogram'].shift().to_numpy()
+        df['Signal'] = _crossover_signals(prev_diff < 0, diff >= 0, prev_diff > 0, diff <= 0)
+        
+        # ATR einmalig für den Stop-Loss berechnen
+        df['ATR'] = _average_true_range(df)
                 
         return df
     
@@ -303,15 +324,8 @@ class MACDStrategy(Strategy):
         Returns:
             float: Stop-Loss-Preis
         """
-        # Berechne ATR (Average True Range)
-        high_low = data['High'] - data['Low']
-        high_close = np.abs(data['High'] - data['Close'].shift())
-        low_close = np.abs(data['Low'] - data['Close'].shift())
-        
-        ranges = pd.concat([high_low, high_close, low_close], axis=1)
-        true_range = ranges.max(axis=1)
-        
-        atr = true_range.rolling(window=14).mean()
+        # Verwende den in generate_signals berechneten ATR, sonst neu berechnen
+        atr = data['ATR'] if 'ATR' in data else _average_true_range(data)
         
         # Finde das letzte Swing Low (lokales Minimum) in den letzten 10 Tagen
         lookback = min(10, index)
@@ -397,17 +411,15 @@ class BollingerBandsStrategy(Strategy):
         df['Upper_Band'] = df['Middle_Band'] + (df['Std_Dev'] * num_std)
         df['Lower_Band'] = df['Middle_Band'] - (df['Std_Dev'] * num_std)
         
-        # Initialisiere Signal-Spalte
-        df['Signal'] = 0
-        
         # Generiere Signale
         # Kaufsignal, wenn Preis die untere Band berührt oder unterschreitet und dann wieder darüber steigt
         # Verkaufssignal, wenn Preis die obere Band berührt oder überschreitet und dann wieder darunter fällt
-        for i in range(1, len(df)):
-            if df['Close'].iloc[i-1] <= df['Lower_Band'].iloc[i-1] and df['Close'].iloc[i] > df['Lower_Band'].iloc[i]:
-                df['Signal'].iloc[i] = 1  # Kaufsignal
-            elif df['Close'].iloc[i-1] >= df['Upper_Band'].iloc[i-1] and df['Close'].iloc[i] < df['Upper_Band'].iloc[i]:
-                df['Signal'].iloc[i] = -1  # Verkaufssignal
+        to_lower = df['Close'] - df['Lower_Band']
+        to_upper = df['Close'] - df['Upper_Band']
+        prev_to_lower = to_lower.shift().to_numpy()
+        prev_to_upper = to_upper.shift().to_numpy()
+        df['Signal'] = _crossover_signals(prev_to_lower <= 0, to_lower.to_numpy() > 0,
+                                          prev_to_upper >= 0, to_upper.to_numpy() < 0)
                 
         return df
     
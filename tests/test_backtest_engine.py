@@ -0,0 +1,86 @@
+"""
+Tests für die Backtesting-Engine
+"""
+
+import os
+import sys
+import unittest
+
+import numpy as np
+import pandas as pd
+
+# Füge Projektverzeichnis zum Pfad hinzu
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backtesting.backtest_engine import BacktestEngine
+from strategy.strategy_base import Strategy
+
+
+class FixedSignalStrategy(Strategy):
+    """
+    Strategie mit vorgegebenen Signalen für reproduzierbare Tests
+    """
+
+    def __init__(self, signals, **kwargs):
+        super().__init__(name="Fixed Signals", **kwargs)
+        self.signals = signals
+
+    def generate_signals(self, data):
+        return pd.Series(self.signals, index=data.index)
+
+
+class TestBacktestEngine(unittest.TestCase):
+    """
+    Tests für BacktestEngine.run
+    """
+
+    def setUp(self):
+        """
+        Vorbereitung für Tests
+        """
+        close = np.array([100.0, 100.0, 105.0, 110.0, 108.0, 100.0, 90.0, 95.0, 120.0, 121.0])
+        self.data = pd.DataFrame({
+            'Open': close,
+            'High': close + 1,
+            'Low': close - 1,
+            'Close': close,
+            'Volume': np.full(len(close), 1000),
+        }, index=pd.date_range('2024-01-01', periods=len(close), freq='D'))
+
+    def test_signal_exit(self):
+        """
+        Testet Ein- und Ausstieg über Signale ohne Kommission
+        """
+        signals = [0, 1, 0, 0, -1, 0, 0, 0, 0, 0]
+        engine = BacktestEngine(initial_capital=10000.0, commission=0.0)
+        results = engine.run(self.data, FixedSignalStrategy(signals, stop_loss_pct=50, take_profit_pct=50))
+
+        trades = results['trades']
+        self.assertEqual(len(trades), 1)
+        self.assertEqual(trades[0]['entry_date'], self.data.index[1])
+        self.assertEqual(trades[0]['exit_date'], self.data.index[4])
+        self.assertAlmostEqual(trades[0]['shares'], 95.0)
+        self.assertAlmostEqual(trades[0]['profit'], 95.0 * 8.0)
+        self.assertNotIn('exit_reason', trades[0])
+        self.assertAlmostEqual(results['equity_curve'].iloc[-1], 10000.0 + 95.0 * 8.0)
+
+    def test_stop_loss_and_take_profit(self):
+        """
+        Testet Stop-Loss- und Take-Profit-Ausstiege sowie einen offenen Trade am Ende
+        """
+        signals = [0, 1, 0, 0, 0, 0, 0, 1, 0, 1]
+        engine = BacktestEngine(initial_capital=10000.0, commission=0.001)
+        results = engine.run(self.data, FixedSignalStrategy(signals, stop_loss_pct=5, take_profit_pct=20))
+
+        trades = results['trades']
+        self.assertEqual([t['exit_reason'] for t in trades], ['stop_loss', 'take_profit'])
+        self.assertAlmostEqual(trades[0]['exit_price'], 95.0)
+        self.assertAlmostEqual(trades[1]['exit_price'], 114.0)
+        self.assertIsNotNone(engine.current_trade)
+        self.assertEqual(engine.current_trade['entry_date'], self.data.index[9])
+        self.assertEqual(results['metrics']['stop_loss_exits'], 1)
+        self.assertEqual(results['metrics']['take_profit_exits'], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,164 @@
+"""
+Tests für die Chart-Hilfsfunktionen des Dashboards
+"""
+
+import os
+import sys
+import unittest
+
+import numpy as np
+import pandas as pd
+
+# Füge Projektverzeichnis zum Pfad hinzu
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dashboard.chart_utils import create_price_chart, m4_aggregate, fill_missing, xaxis_window, slice_window
+
+
+def _make_ohlcv(rows=5000, freq='min'):
+    """
+    Erzeugt reproduzierbare OHLCV-Testdaten
+    """
+    rng = np.random.default_rng(42)
+    close = 100 + rng.standard_normal(rows).cumsum()
+    index = pd.date_range('2024-01-01', periods=rows, freq=freq)
+    return pd.DataFrame({
+        'Open': close + rng.standard_normal(rows) * 0.1,
+        'High': close + 1,
+        'Low': close - 1,
+        'Close': close,
+        'Volume': rng.integers(1_000, 10_000, rows),
+        'sma_20': pd.Series(close).rolling(20).mean().to_numpy(),
+    }, index=index)
+
+
+class TestM4Aggregate(unittest.TestCase):
+    """
+    Tests für die M4-Aggregation
+    """
+
+    def test_small_frame_unchanged(self):
+        """
+        Testet, dass kleine DataFrames nicht verändert werden
+        """
+        df = _make_ohlcv(rows=500)
+        self.assertIs(m4_aggregate(df, width=1000), df)
+
+    def test_preserves_extremes_and_volume(self):
+        """
+        Testet, dass Extremwerte, Endkurse und Volumensumme erhalten bleiben
+        """
+        df = _make_ohlcv()
+        result = m4_aggregate(df, width=200)
+
+        self.assertLessEqual(len(result), 200)
+        self.assertEqual(list(result.columns), list(df.columns))
+        self.assertTrue(result.index.is_monotonic_increasing)
+        self.assertEqual(result.index[0], df.index[0])
+        self.assertAlmostEqual(result['High'].max(), df['High'].max())
+        self.assertAlmostEqual(result['Low'].min(), df['Low'].min())
+        self.assertEqual(result['Open'].iloc[0], df['Open'].iloc[0])
+        self.assertEqual(result['Close'].iloc[-1], df['Close'].iloc[-1])
+        self.assertEqual(result['Volume'].sum(), df['Volume'].sum())
+
+    def test_long_daily_range(self):
+        """
+        Testet mehrjährige Tagesdaten ohne Überlauf der Bucket-Berechnung
+        """
+        df = _make_ohlcv(rows=3000, freq='D')
+        result = m4_aggregate(df, width=1000)
+
+        self.assertLessEqual(len(result), 1000)
+        self.assertEqual(result['Volume'].sum(), df['Volume'].sum())
+
+
+class TestFillMissing(unittest.TestCase):
+    """
+    Tests für das Füllen fehlender Werte
+    """
+
+    def test_matches_pandas_chain(self):
+        """
+        Testet die Übereinstimmung mit ffill().bfill().fillna(0)
+        """
+        df = _make_ohlcv(rows=200).astype({'Volume': 'float64'})
+        df.iloc[50:55, 0] = np.nan
+        df['empty'] = np.nan
+
+        result = fill_missing(df)
+        expected = df.ffill().bfill().fillna(0)
+
+        pd.testing.assert_frame_equal(result, expected)
+
+    def test_no_missing_unchanged(self):
+        """
+        Testet, dass DataFrames ohne Lücken unverändert bleiben
+        """
+        df = _make_ohlcv(rows=10).drop(columns='sma_20')
+        self.assertIs(fill_missing(df), df)
+
+
+class TestZoomWindow(unittest.TestCase):
+    """
+    Tests für das Auslesen und Zuschneiden des sichtbaren Bereichs
+    """
+
+    def test_xaxis_window(self):
+        """
+        Testet die verschiedenen relayoutData-Formen
+        """
+        self.assertIsNone(xaxis_window(None))
+        self.assertIsNone(xaxis_window({'autosize': True}))
+        self.assertEqual(xaxis_window({'xaxis.autorange': True}), (None, None))
+        self.assertEqual(
+            xaxis_window({'xaxis.range[0]': '2024-01-01 01:00', 'xaxis.range[1]': '2024-01-01 02:00'}),
+            ('2024-01-01 01:00', '2024-01-01 02:00'),
+        )
+        self.assertEqual(xaxis_window({'xaxis.range': ['a', 'b']}), ('a', 'b'))
+
+    def test_slice_window_with_timezone(self):
+        """
+        Testet, dass Achsengrenzen ohne Zeitzone auf zeitzonenbehaftete Indizes passen
+        """
+        df = _make_ohlcv(rows=300).tz_localize('America/New_York')
+
+        result = slice_window(df, '2024-01-01 01:00:00', '2024-01-01 01:59:00')
+
+        self.assertEqual(len(result), 60)
+        self.assertEqual(result.index[0], pd.Timestamp('2024-01-01 01:00', tz='America/New_York'))
+
+
+class TestPriceChart(unittest.TestCase):
+    """
+    Tests für das Preischart
+    """
+
+    def test_toggleable_overlays(self):
+        """
+        Testet, dass ausgeblendete Overlays mit toggleable unsichtbar enthalten sind
+        """
+        df = _make_ohlcv(rows=50)
+        for col in ('bb_upper', 'bb_middle', 'bb_lower'):
+            df[col] = df['Close']
+
+        fig = create_price_chart(df, 'TEST', show_sma=True, show_volume=False, toggleable=True)
+        visible = {trace.name: trace.visible for trace in fig.data if trace.legendgroup}
+
+        self.assertEqual(visible, {'SMA 20': True, 'BB Upper': False, 'BB Middle': False, 'BB Lower': False})
+        self.assertEqual(len(create_price_chart(df, 'TEST', show_volume=False).data), 1)
+
+    def test_volume_colors(self):
+        """
+        Testet die Färbung der Volumenbalken nach Kerzenrichtung
+        """
+        df = _make_ohlcv(rows=3)
+        df['Open'] = [1.0, 2.0, 3.0]
+        df['Close'] = [1.0, 1.0, 4.0]
+
+        fig = create_price_chart(df, 'TEST')
+
+        self.assertEqual(list(fig.data[-1].marker.color), ['rgba(0, 150, 0, 0.5)', 'rgba(255, 0, 0, 0.5)', 'rgba(0, 150, 0, 0.5)'])
+
+
+if __name__ == '__main__':
+    unittest.main()
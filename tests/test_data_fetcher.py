@@ -0,0 +1,103 @@
+"""
+Tests für das Resampling im DataFetcher
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+
+# Füge Projektverzeichnis zum Pfad hinzu
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from data.data_fetcher import DataFetcher
+
+
+def _make_minutes(rows=120):
+    """
+    Erzeugt 5-Minuten-Kerzen über eine Nachtlücke hinweg
+    """
+    index = pd.date_range('2024-01-02 09:30', periods=rows // 2, freq='5min').append(
+        pd.date_range('2024-01-03 09:30', periods=rows - rows // 2, freq='5min'))
+    close = 100 + np.arange(rows, dtype=float)
+    return pd.DataFrame({
+        'Open': close - 0.5,
+        'High': close + 1,
+        'Low': close - 1,
+        'Close': close,
+        'Volume': np.full(rows, 10),
+    }, index=index)
+
+
+class TestResample(unittest.TestCase):
+    """
+    Tests für resample_ohlcv und die abgeleiteten Intervalle
+    """
+
+    def setUp(self):
+        """
+        Vorbereitung für Tests
+        """
+        self.tmp = tempfile.TemporaryDirectory()
+        self.fetcher = DataFetcher(cache_dir=self.tmp.name)
+
+    def tearDown(self):
+        """
+        Aufräumen nach Tests
+        """
+        self.tmp.cleanup()
+
+    def test_resample_ohlcv(self):
+        """
+        Testet die OHLCV-Aggregation und das Entfernen leerer Buckets
+        """
+        df = _make_minutes()
+
+        result = self.fetcher.resample_ohlcv(df, '15min')
+
+        self.assertEqual(len(result), 40)
+        first = result.iloc[0]
+        self.assertEqual(first['Open'], df['Open'].iloc[0])
+        self.assertEqual(first['High'], df['High'].iloc[:3].max())
+        self.assertEqual(first['Low'], df['Low'].iloc[:3].min())
+        self.assertEqual(first['Close'], df['Close'].iloc[2])
+        self.assertEqual(first['Volume'], 30)
+        self.assertIn('sma_20', result.columns)
+
+    def test_derived_interval_uses_base(self):
+        """
+        Testet, dass 30m aus den 5m-Daten abgeleitet statt neu geladen wird
+        """
+        with mock.patch.object(self.fetcher, '_fetch_data_from_yfinance', return_value=_make_minutes()) as fetch:
+            result = self.fetcher.get_stock_data('TEST', interval='30m', range_val='5d', use_cache=False)
+
+        fetch.assert_called_once_with('TEST', '5m', '5d')
+        self.assertEqual(len(result), 20)
+
+
+class TestCache(unittest.TestCase):
+    """
+    Tests für den Daten-Cache
+    """
+
+    def test_roundtrip_keeps_index_and_dtypes(self):
+        """
+        Testet, dass Zeitzone, Index und Datentypen beim Cachen erhalten bleiben
+        """
+        with tempfile.TemporaryDirectory() as tmp:
+            fetcher = DataFetcher(cache_dir=tmp)
+            df = _make_minutes().tz_localize('America/New_York')
+            cache_file = fetcher.cache_dir / f"TEST_5m_5d{fetcher.CACHE_SUFFIX}"
+
+            fetcher._write_cache(df, cache_file)
+            result = fetcher._read_cache(cache_file)
+
+        pd.testing.assert_frame_equal(result, df, check_freq=False)
+
+
+if __name__ == '__main__':
+    unittest.main()
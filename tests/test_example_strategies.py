@@ -0,0 +1,99 @@
+"""
+Tests für die Beispielstrategien
+"""
+
+import os
+import sys
+import unittest
+
+import numpy as np
+import pandas as pd
+
+# Füge Projektverzeichnis zum Pfad hinzu
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from strategy.example_strategies import RSIStrategy, MACDStrategy, BollingerBandsStrategy
+
+
+def _reference_signals(first, second):
+    """
+    Zeilenweise Referenz: Kauf, wenn erste Reihe die zweite von unten kreuzt,
+    Verkauf, wenn sie sie von oben kreuzt
+    """
+    signals = np.zeros(len(first), dtype=int)
+    for i in range(1, len(first)):
+        if first[i - 1] < second[i - 1] and first[i] >= second[i]:
+            signals[i] = 1
+        elif first[i - 1] > second[i - 1] and first[i] <= second[i]:
+            signals[i] = -1
+    return signals
+
+
+class TestExampleStrategies(unittest.TestCase):
+    """
+    Tests für die vektorisierte Signalerzeugung
+    """
+
+    def setUp(self):
+        """
+        Vorbereitung für Tests
+        """
+        rng = np.random.default_rng(3)
+        close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, 2000)))
+        self.data = pd.DataFrame({
+            'Open': close,
+            'High': close * 1.01,
+            'Low': close * 0.99,
+            'Close': close,
+            'Volume': 1_000.0,
+        }, index=pd.date_range('2020-01-01', periods=2000, freq='D'))
+
+    def test_rsi_signals(self):
+        """
+        Testet die RSI-Signale gegen die zeilenweise Auswertung
+        """
+        df = RSIStrategy().generate_signals(self.data)
+        rsi = df['RSI'].to_numpy()
+
+        expected = np.zeros(len(df), dtype=int)
+        for i in range(1, len(df)):
+            if rsi[i - 1] < 30 and rsi[i] >= 30:
+                expected[i] = 1
+            elif rsi[i - 1] > 70 and rsi[i] <= 70:
+                expected[i] = -1
+
+        np.testing.assert_array_equal(df['Signal'].to_numpy(), expected)
+        self.assertTrue((expected != 0).any())
+
+    def test_macd_signals(self):
+        """
+        Testet die MACD-Signale gegen die zeilenweise Auswertung
+        """
+        df = MACDStrategy().generate_signals(self.data)
+        expected = _reference_signals(df['MACD'].to_numpy(), df['Signal_Line'].to_numpy())
+
+        np.testing.assert_array_equal(df['Signal'].to_numpy(), expected)
+        self.assertTrue((expected != 0).any())
+
+    def test_bollinger_signals(self):
+        """
+        Testet die Bollinger-Band-Signale gegen die zeilenweise Auswertung
+        """
+        df = BollingerBandsStrategy().generate_signals(self.data)
+        close = df['Close'].to_numpy()
+        lower = df['Lower_Band'].to_numpy()
+        upper = df['Upper_Band'].to_numpy()
+
+        expected = np.zeros(len(df), dtype=int)
+        for i in range(1, len(df)):
+            if close[i - 1] <= lower[i - 1] and close[i] > lower[i]:
+                expected[i] = 1
+            elif close[i - 1] >= upper[i - 1] and close[i] < upper[i]:
+                expected[i] = -1
+
+        np.testing.assert_array_equal(df['Signal'].to_numpy(), expected)
+        self.assertTrue((expected != 0).any())
+
+
+if __name__ == '__main__':
+    unittest.main()
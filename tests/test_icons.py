@@ -0,0 +1,61 @@
+"""
+Tests für die vorgerenderten Icons
+"""
+
+import os
+import sys
+import unittest
+from unittest import mock
+
+# Füge Projektverzeichnis zum Pfad hinzu
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dash import html
+from dash_iconify import DashIconify
+
+from dashboard import icons
+
+
+class TestIcon(unittest.TestCase):
+    """
+    Tests für icon()
+    """
+
+    def setUp(self):
+        """
+        Leert den Cache der Masken, da die Tests _SVG austauschen
+        """
+        icons._mask_url.cache_clear()
+
+    def tearDown(self):
+        """
+        Entfernt die Masken der Test-Icons aus dem Cache
+        """
+        icons._mask_url.cache_clear()
+
+    def test_fallback_without_svg(self):
+        """
+        Testet den Rückgriff auf DashIconify für nicht vorgerenderte Icons
+        """
+        with mock.patch.dict(icons._SVG, clear=True):
+            result = icons.icon("mdi:cog", width=18, className="me-2")
+
+        self.assertIsInstance(result, DashIconify)
+        self.assertEqual(result.icon, "mdi:cog")
+        self.assertEqual(result.className, "me-2")
+
+    def test_prerendered_svg(self):
+        """
+        Testet, dass vorgerenderte Icons als Maske mit der Textfarbe erscheinen
+        """
+        with mock.patch.dict(icons._SVG, {"mdi:test": "<svg/>"}, clear=True):
+            result = icons.icon("mdi:test", width=24)
+
+        self.assertIsInstance(result, html.Span)
+        self.assertEqual(result.style["width"], "24px")
+        self.assertEqual(result.style["backgroundColor"], "currentColor")
+        self.assertIn("data:image/svg+xml;base64,", result.style["maskImage"])
+
+
+if __name__ == '__main__':
+    unittest.main()
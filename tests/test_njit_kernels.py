@@ -0,0 +1,117 @@
+"""
+Tests für die JIT-Kernel der technischen Indikatoren
+"""
+
+import os
+import sys
+import unittest
+
+import numpy as np
+import pandas as pd
+
+# Füge Projektverzeichnis zum Pfad hinzu
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from data import _njit_kernels as kernels
+
+
+class TestNjitKernels(unittest.TestCase):
+    """
+    Vergleicht die Kernel mit den bisherigen pandas-Berechnungen
+    """
+
+    def setUp(self):
+        """
+        Vorbereitung für Tests
+        """
+        rng = np.random.default_rng(7)
+        self.close = pd.Series(100 + rng.standard_normal(500).cumsum())
+
+    def test_sma(self):
+        """
+        Testet den SMA gegen rolling()
+        """
+        np.testing.assert_allclose(kernels.sma(self.close.to_numpy(), 20), self.close.rolling(20).mean(), equal_nan=True)
+
+    def test_bbands(self):
+        """
+        Testet die Bollinger Bands gegen rolling()
+        """
+        mean = self.close.rolling(20).mean()
+        std = self.close.rolling(20).std()
+
+        middle, bb_std, upper, lower = kernels.bbands(self.close.to_numpy(), 20, 2.0)
+
+        np.testing.assert_allclose(middle, mean, equal_nan=True)
+        np.testing.assert_allclose(bb_std, std, equal_nan=True)
+        np.testing.assert_allclose(upper, mean + 2 * std, equal_nan=True)
+        np.testing.assert_allclose(lower, mean - 2 * std, equal_nan=True)
+
+    def test_bbands_with_missing_values(self):
+        """
+        Testet, dass die Bänder nach einer Lücke wieder mit rolling() übereinstimmen
+        """
+        series = self.close.copy()
+        series.iloc[100] = np.nan
+
+        middle, bb_std, _, _ = kernels.bbands(series.to_numpy(), 20, 2.0)
+
+        np.testing.assert_allclose(middle, series.rolling(20).mean(), equal_nan=True)
+        np.testing.assert_allclose(bb_std, series.rolling(20).std(), equal_nan=True)
+
+    def test_sma_with_missing_values(self):
+        """
+        Testet, dass Fenster mit fehlenden Werten wie bei pandas NaN ergeben
+        """
+        series = self.close.copy()
+        series.iloc[100] = np.nan
+        np.testing.assert_allclose(kernels.sma(series.to_numpy(), 20), series.rolling(20).mean(), equal_nan=True)
+
+    def test_ema_with_missing_values(self):
+        """
+        Testet, dass führende und einzelne fehlende Werte wie bei ewm() übersprungen werden
+        """
+        series = self.close.copy()
+        series.iloc[:3] = np.nan
+        series.iloc[100] = np.nan
+        series.iloc[150:153] = np.nan
+
+        result = kernels.ema(series.to_numpy(), 12)
+
+        np.testing.assert_allclose(result, series.ewm(span=12, adjust=False).mean(), equal_nan=True)
+        np.testing.assert_allclose(kernels.ema(np.array([np.nan, 1.0, 2.0]), 3), [np.nan, 1.0, 1.5], equal_nan=True)
+
+    def test_rsi(self):
+        """
+        Testet den RSI gegen die Berechnung mit rolling()
+        """
+        delta = self.close.diff()
+        avg_gain = delta.where(delta > 0, 0).rolling(14).mean()
+        avg_loss = (-delta.where(delta < 0, 0)).rolling(14).mean().replace(0, np.nan)
+        expected = 100 - (100 / (1 + avg_gain / avg_loss))
+
+        np.testing.assert_allclose(kernels.rsi(self.close.to_numpy(), 14), expected, equal_nan=True)
+
+    def test_rsi_without_losses(self):
+        """
+        Testet, dass ein Fenster ohne Verluste NaN liefert
+        """
+        result = kernels.rsi(np.arange(30, dtype=np.float64), 14)
+        self.assertTrue(np.isnan(result).all())
+
+    def test_macd(self):
+        """
+        Testet MACD, Signallinie und Histogramm gegen ewm()
+        """
+        line = self.close.ewm(span=12, adjust=False).mean() - self.close.ewm(span=26, adjust=False).mean()
+        signal = line.ewm(span=9, adjust=False).mean()
+
+        macd, macd_signal, macd_hist = kernels.macd(self.close.to_numpy(), 12, 26, 9)
+
+        np.testing.assert_allclose(macd, line)
+        np.testing.assert_allclose(macd_signal, signal)
+        np.testing.assert_allclose(macd_hist, line - signal)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,254 @@
+"""
+Tests für die Serialisierung der Store-Daten
+"""
+
+import base64
+import os
+import sys
+import unittest
+
+import numpy as np
+import pandas as pd
+
+# Füge Projektverzeichnis zum Pfad hinzu
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dashboard import store_utils
+from dashboard.store_utils import (create_cache, encode_array, encode_dataframe, decode_dataframe, make_chart_builder,
+                                   make_payload_loader, memoize, quantize_dataframe)
+
+
+class TestStoreSerialization(unittest.TestCase):
+    """
+    Tests für encode_dataframe/decode_dataframe
+    """
+
+    def setUp(self):
+        """
+        Vorbereitung für Tests
+        """
+        index = pd.date_range('2024-01-01', periods=50, freq='h')
+        self.df = pd.DataFrame({
+            'Open': np.linspace(100, 150, 50),
+            'High': np.linspace(101, 151, 50),
+            'Low': np.linspace(99, 149, 50),
+            'Close': np.linspace(100.5, 150.5, 50),
+            'Volume': np.arange(50, dtype='int64') * 1000,
+        }, index=index)
+
+    def test_roundtrip(self):
+        """
+        Testet, dass Werte und Index die Serialisierung überstehen
+        """
+        payload = encode_dataframe(self.df)
+        self.assertIn(payload['format'], ('arrow', 'json'))
+
+        result = decode_dataframe(payload)
+        self.assertTrue(isinstance(result.index, pd.DatetimeIndex))
+        self.assertTrue((result.index == self.df.index).all())
+        np.testing.assert_allclose(result[['Open', 'High', 'Low', 'Close']], self.df[['Open', 'High', 'Low', 'Close']])
+        self.assertEqual(result['Volume'].sum(), self.df['Volume'].sum())
+
+    def test_json_fallback(self):
+        """
+        Testet die JSON-Serialisierung ohne pyarrow
+        """
+        available = store_utils.ARROW_AVAILABLE
+        store_utils.ARROW_AVAILABLE = False
+        try:
+            payload = encode_dataframe(self.df)
+        finally:
+            store_utils.ARROW_AVAILABLE = available
+
+        self.assertEqual(payload['format'], 'json')
+        result = decode_dataframe(payload)
+        np.testing.assert_allclose(result['Close'], self.df['Close'])
+
+    def test_quantize(self):
+        """
+        Testet die Reduktion auf float32/uint32
+        """
+        result = quantize_dataframe(self.df)
+        self.assertEqual(result['Close'].dtype, np.float32)
+        self.assertEqual(result['Volume'].dtype, np.uint32)
+        np.testing.assert_allclose(result['Close'], self.df['Close'], rtol=1e-6)
+
+        # Roundtrip behält die reduzierten Datentypen
+        decoded = decode_dataframe(encode_dataframe(result))
+        np.testing.assert_allclose(decoded['Close'], result['Close'], rtol=1e-6)
+
+    def test_quantize_keeps_fractional_volume(self):
+        """
+        Testet, dass gebrochene Volumina nicht auf Ganzzahlen abgeschnitten werden
+        """
+        df = self.df.assign(Volume=self.df['Volume'] + 0.25)
+
+        result = quantize_dataframe(df)
+
+        self.assertEqual(result['Volume'].dtype, np.float32)
+        np.testing.assert_allclose(result['Volume'], df['Volume'], rtol=1e-6)
+
+
+class TestEncodeArray(unittest.TestCase):
+    """
+    Tests für encode_array
+    """
+
+    def test_typed_array_spec(self):
+        """
+        Testet, dass die Bytes als Little-Endian im angegebenen Typ vorliegen
+        """
+        values = np.array([1.5, -2.25, 1e4])
+
+        spec = encode_array(values, 'f4')
+
+        self.assertEqual(spec['dtype'], 'f4')
+        decoded = np.frombuffer(base64.b64decode(spec['bdata']), dtype='<f4')
+        np.testing.assert_array_equal(decoded, values.astype(np.float32))
+
+
+
+class TestMemoize(unittest.TestCase):
+    """
+    Tests für den Prozess-Cache von memoize (ohne flask-caching)
+    """
+
+    def test_skips_none(self):
+        """
+        Testet, dass Ergebnisse gecacht werden, None aber erneut geladen wird
+        """
+        calls = []
+
+        @memoize(None, maxsize=2)
+        def load(symbol):
+            calls.append(symbol)
+            return None if symbol == 'FAIL' else symbol.lower()
+
+        self.assertEqual(load('AAPL'), 'aapl')
+        self.assertEqual(load('AAPL'), 'aapl')
+        self.assertIsNone(load('FAIL'))
+        self.assertIsNone(load('FAIL'))
+        self.assertEqual(calls, ['AAPL', 'FAIL', 'FAIL'])
+
+    def test_evicts_oldest(self):
+        """
+        Testet, dass über maxsize hinaus der am längsten ungenutzte Eintrag entfällt
+        """
+        calls = []
+
+        @memoize(None, maxsize=2)
+        def load(symbol):
+            calls.append(symbol)
+            return symbol
+
+        for symbol in ('A', 'B', 'A', 'C', 'A', 'B'):
+            load(symbol)
+
+        self.assertEqual(calls, ['A', 'B', 'C', 'B'])
+
+
+class TestPayloadLoader(unittest.TestCase):
+    """
+    Tests für create_cache und make_payload_loader
+    """
+
+    def test_payload_and_empty_result(self):
+        """
+        Testet die Payload mit Datenversion und dass leere Daten nicht gecacht werden
+        """
+        index = pd.date_range('2024-01-01', periods=10, freq='D')
+        frames = {'AAPL': pd.DataFrame({'Close': np.arange(10.0), 'Volume': np.full(10, 1000)}, index=index),
+                  'NONE': pd.DataFrame()}
+        calls = []
+
+        def load_stock_data(symbol, timeframe, date_range):
+            calls.append(symbol)
+            return frames[symbol], 'ok'
+
+        fetch_store_payload = make_payload_loader(load_stock_data)
+        encoded, info, status_message, version = fetch_store_payload('AAPL', '1d', '1mo')
+        self.assertEqual(decode_dataframe(encoded)['Close'].dtype, np.float32)
+        self.assertEqual(status_message, 'ok')
+        self.assertEqual(version, f"{index[-1].isoformat()}/10")
+        self.assertTrue(info.startswith('9 Tage'))
+
+        fetch_store_payload('AAPL', '1d', '1mo')
+        self.assertIsNone(fetch_store_payload('NONE', '1d', '1mo'))
+        self.assertIsNone(fetch_store_payload('NONE', '1d', '1mo'))
+        self.assertEqual(calls, ['AAPL', 'NONE', 'NONE'])
+
+    def test_create_cache_filesystem(self):
+        """
+        Testet, dass ohne CACHE_REDIS_URL ein Dateisystem-Cache im angegebenen Verzeichnis entsteht
+        """
+        import tempfile
+        from unittest import mock
+        from flask import Flask
+
+        with tempfile.TemporaryDirectory() as cache_dir, mock.patch.dict(os.environ, clear=False) as env:
+            env.pop('CACHE_REDIS_URL', None)
+            server = Flask(__name__)
+            cache = create_cache(server, cache_dir)
+            with server.app_context():
+                cache.set('key', 'value')
+                self.assertEqual(cache.get('key'), 'value')
+            self.assertTrue(os.listdir(cache_dir))
+
+
+class TestChartBuilder(unittest.TestCase):
+    """
+    Tests für make_chart_builder
+    """
+
+    def test_keyed_on_version(self):
+        """
+        Testet, dass Charts je Datenversion gecacht und nach neuen Daten neu erstellt werden
+        """
+        index = pd.date_range('2024-01-01', periods=30, freq='D')
+        close = np.linspace(100, 130, 30)
+        df = pd.DataFrame({'Open': close, 'High': close + 1, 'Low': close - 1, 'Close': close,
+                           'Volume': np.full(30, 1000)}, index=index)
+        calls = []
+
+        def fetch_payload(symbol, timeframe, date_range):
+            calls.append(symbol)
+            return encode_dataframe(df), '', '', f"{index[-1].isoformat()}/{len(df)}"
+
+        build_charts = make_chart_builder(fetch_payload, '#252525')
+        args = ('AAPL', '1d', '1mo')
+        toggles = (False, False, False, False, True)
+
+        charts = build_charts(*args, 'v1', *toggles)
+        self.assertEqual(len(charts), 4)
+        self.assertIs(build_charts(*args, 'v1', *toggles), charts)
+        build_charts(*args, 'v2', *toggles)
+        self.assertEqual(len(calls), 2)
+
+    def test_shared_cache_separates_backgrounds(self):
+        """
+        Testet, dass Apps mit unterschiedlicher Kartenfarbe im gemeinsamen Cache getrennt bleiben
+        """
+        from flask import Flask
+        from flask_caching import Cache
+
+        server = Flask(__name__)
+        cache = Cache(server, config={"CACHE_TYPE": "SimpleCache"})
+        index = pd.date_range('2024-01-01', periods=30, freq='D')
+        close = np.linspace(100, 130, 30)
+        df = pd.DataFrame({'Open': close, 'High': close + 1, 'Low': close - 1, 'Close': close,
+                           'Volume': np.full(30, 1000)}, index=index)
+
+        def fetch_payload(symbol, timeframe, date_range):
+            return encode_dataframe(df), '', '', 'v1'
+
+        args = ('AAPL', '1d', '1mo', 'v1', False, False, False, False, True)
+        with server.app_context():
+            first = make_chart_builder(fetch_payload, '#252525', cache)(*args)
+            second = make_chart_builder(fetch_payload, '#252a37', cache)(*args)
+
+        self.assertEqual(first[0]['layout']['paper_bgcolor'], '#252525')
+        self.assertEqual(second[0]['layout']['paper_bgcolor'], '#252a37')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -291,6 +291,48 @@ class TestHelpers(unittest.TestCase):
         # Lösche Cache
         success = cache_manager.clear_cache(cache_key)
         self.assertTrue(success)
+    
+    def test_cache_manager_memory(self):
+        """
+        Testet, dass der Speicher-Cache Kopien liefert und geänderte Dateien neu lädt
+        """
+        cache_manager = CacheManager()
+        cache_key = 'test_cache_memory'
+        cache_manager.save_to_cache(cache_key, pd.DataFrame({'close': [1.0, 2.0]}))
+        
+        # Änderungen des Aufrufers wirken sich nicht auf den Cache aus
+        loaded_df = cache_manager.get_from_cache(cache_key)
+        loaded_df['close'] = 0.0
+        self.assertEqual(cache_manager.get_from_cache(cache_key)['close'].tolist(), [1.0, 2.0])
+        
+        # Eine von außen neu geschriebene Datei wird erneut eingelesen
+        cache_file = cache_manager.get_cache_file_path(cache_key)
+        pd.DataFrame({'close': [3.0]}).to_csv(cache_file)
+        os.utime(cache_file, (0, os.path.getmtime(cache_file) + 10))
+        self.assertEqual(cache_manager.get_from_cache(cache_key)['close'].tolist(), [3.0])
+        
+        cache_manager.clear_cache(cache_key)
+    
+    def test_cache_manager_memory_matches_csv(self):
+        """
+        Testet, dass der Speicher-Cache die Datentypen der CSV-Datei liefert und begrenzt ist
+        """
+        cache_manager = CacheManager()
+        df = pd.DataFrame({'volume': np.array([1, 2], dtype='uint32')},
+                          index=pd.date_range('2024-01-01', periods=2, freq='D'))
+        cache_manager.save_to_cache('test_cache_dtypes', df)
+        
+        # Auch der erste Abruf im selben Prozess liefert den Stand der CSV-Datei
+        self.assertEqual(cache_manager.get_from_cache('test_cache_dtypes')['volume'].dtype, np.int64)
+        cache_manager.clear_cache('test_cache_dtypes')
+        
+        keys = [f'test_cache_bound_{i}' for i in range(CacheManager._MAX_FRAMES + 2)]
+        for key in keys:
+            cache_manager.save_to_cache(key, df)
+            cache_manager.get_from_cache(key)
+        self.assertLessEqual(len(CacheManager._frames), CacheManager._MAX_FRAMES)
+        for key in keys:
+            cache_manager.clear_cache(key)
 
 class TestStatePreservation(unittest.TestCase):
     """
@@ -0,0 +1,36 @@
+"""
+Optionale Numba-Unterstützung für rechenintensive Schleifen
+
+Ist numba installiert, werden die Kernel nativ kompiliert. Ohne numba liefert
+`njit` einen No-op-Dekorator, sodass dieselben Funktionen als reines Python laufen.
+"""
+
+import logging
+
+logger = logging.getLogger("trading_dashboard.njit")
+
+# Typ für eindimensionale float64-Eingaben in expliziten Signaturen. Schreibgeschützt,
+# damit auch die Arrays aus pandas' Copy-on-Write (to_numpy) passen; beschreibbare
+# Arrays werden ebenso angenommen.
+FLOAT_ARRAY = "Array(float64, 1, 'A', readonly=True)"
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    logger.info("numba nicht verfügbar, JIT-Kernel laufen als reines Python")
+
+    def njit(*args, **kwargs):
+        """
+        No-op-Ersatz für numba.njit
+
+        Unterstützt `@njit`, `@njit(cache=True, ...)` und `@njit("(float64[:], int64)", ...)` (Signaturen werden ignoriert).
+        """
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func):
+            return func
+
+        return decorator
@@ -4,6 +4,8 @@ Utilities-Modul für gemeinsam genutzte Funktionen im Trading Dashboard
 
 import os
 import sys
+import threading
+from collections import OrderedDict
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
@@ -400,8 +402,21 @@ class ConfigUtils:
 class CacheManager:
     """
     Manager für das Caching von Daten
+    
+    Die Dateien im Cache-Verzeichnis sind maßgeblich. Die zuletzt gelesenen DataFrames
+    werden zusätzlich prozessweit im Speicher gehalten, solange sich die Datei nicht
+    geändert hat, damit wiederholte Abrufe die CSV-Datei nicht erneut parsen. Gespeichert
+    wird nur, was aus der CSV-Datei gelesen wurde, sodass jeder Prozess dieselben
+    Datentypen erhält.
     """
     
+    # Prozessweit geteilt, da jede Datenquelle ihren eigenen CacheManager erzeugt:
+    # Dateipfad -> (Änderungszeit der Datei, DataFrame), die ältesten Einträge werden
+    # über _MAX_FRAMES hinaus verdrängt (die Schlüssel enthalten rollierende Zeiträume)
+    _frames: "OrderedDict[str, Tuple[float, pd.DataFrame]]" = OrderedDict()
+    _frames_lock = threading.Lock()
+    _MAX_FRAMES = 16
+    
     def __init__(self, cache_dir: str = None):
         """
         Initialisiert den Cache-Manager
@@ -466,7 +481,19 @@ class CacheManager:
             return None
         
         try:
-            return pd.read_csv(cache_file, index_col=0, parse_dates=True)
+            mtime = os.path.getmtime(cache_file)
+            with self._frames_lock:
+                cached = self._frames.get(cache_file)
+                if cached is not None and cached[0] == mtime:
+                    self._frames.move_to_end(cache_file)
+            if cached is None or cached[0] != mtime:
+                cached = (mtime, pd.read_csv(cache_file, index_col=0, parse_dates=True))
+                with self._frames_lock:
+                    self._frames[cache_file] = cached
+                    while len(self._frames) > self._MAX_FRAMES:
+                        self._frames.popitem(last=False)
+            # Kopie, damit Aufrufer (z.B. Strategien beim Hinzufügen von Spalten) den Cache nicht verändern
+            return cached[1].copy()
         except Exception as e:
             logger.error(f"Fehler beim Laden aus dem Cache: {str(e)}")
             return None
@@ -486,6 +513,9 @@ class CacheManager:
         
         try:
             df.to_csv(cache_file)
+            # Der nächste Abruf liest die neue Datei ein
+            with self._frames_lock:
+                self._frames.pop(cache_file, None)
             return True
         except Exception as e:
             logger.error(f"Fehler beim Speichern im Cache: {str(e)}")
@@ -504,13 +534,18 @@ class CacheManager:
         try:
             if key is not None:
                 cache_file = self.get_cache_file_path(key)
+                with self._frames_lock:
+                    self._frames.pop(cache_file, None)
                 if os.path.exists(cache_file):
                     os.remove(cache_file)
             else:
                 # Lösche alle Dateien im Cache-Verzeichnis
                 for file_name in os.listdir(self.cache_dir):
                     if file_name.endswith('.csv'):
-                        os.remove(os.path.join(self.cache_dir, file_name))
+                        cache_file = os.path.join(self.cache_dir, file_name)
+                        with self._frames_lock:
+                            self._frames.pop(cache_file, None)
+                        os.remove(cache_file)
             
             return True
         except Exception as e:
@@ -0,0 +1,22 @@
+"""
+WSGI-Einstiegspunkt für den Produktionsbetrieb des Trading Dashboards
+
+Beispiel:
+    gunicorn -k gevent -w 4 --worker-connections 100 --preload -b 0.0.0.0:8050 wsgi:server
+    waitress-serve --listen=0.0.0.0:8050 wsgi:server
+
+Mit --preload importiert gunicorn die App einmal im Master-Prozess; Layout, Symbolliste
+und JIT-Kernel werden dann nicht in jedem Worker erneut aufgebaut, sondern per fork geteilt.
+"""
+
+import os
+import sys
+
+# Füge den Projektpfad zum Systempfad hinzu
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(current_dir)
+
+# Importiere die Dashboard-App
+from dashboard.app import app
+
+server = app.server